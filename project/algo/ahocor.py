@@ -1,9 +1,12 @@
 # Aho-Corasick String Matching Algorithm
+from array import array
 from collections import deque
 class AhoCorasick:
     def __init__(self, words: list[str]):
         self.root = TrieNode()
-        for word in words:
+        # urutan keyword dipertahankan, duplikat dan string kosong diabaikan
+        self.words = list(dict.fromkeys(word for word in words if word))
+        for word in self.words:
             self.root.add_word(word)
         self.build_failure_links()
 
@@ -19,37 +22,59 @@ class AhoCorasick:
                 queue.append(child)
                 curr_fail_link = curr_node.fail_link
                 while char not in curr_fail_link.children.keys() and curr_fail_link !=self.root:
-                    curr_fail_link = curr_fail_link.fail_link   
-                child.fail_link = curr_fail_link.children.get(char, self.root)    
+                    curr_fail_link = curr_fail_link.fail_link
+                child.fail_link = curr_fail_link.children.get(char, self.root)
                 child.output += child.fail_link.output
-    
+
+    def _walk(self, text: str):
+        """
+        Telusuri automaton sekali untuk seluruh teks.
+        Yield (index akhir, node) untuk setiap node yang punya output.
+        """
+        root = self.root
+        curr_node = root
+        for i, char in enumerate(text):
+            # saat mismatch, ikuti failure link sampai ada transisi (atau sampai root)
+            while char not in curr_node.children and curr_node is not root:
+                curr_node = curr_node.fail_link
+            curr_node = curr_node.children.get(char, root)
+            if curr_node.output:
+                yield i, curr_node
+
+    def find_all(self, text: str) -> list[tuple[int, str]]:
+        """
+        Semua kemunculan keyword di text, sebagai list (index awal, word).
+        """
+        results = []
+        for i, node in self._walk(text):
+            for word in node.output:
+                results.append((i - len(word) + 1, word))
+        return results
+
+    def count(self, text: str) -> dict[str, int]:
+        """
+        Jumlah kemunculan setiap keyword di text (satu kali scan).
+        """
+        counts = dict.fromkeys(self.words, 0)
+        for _, node in self._walk(text):
+            for word in node.output:
+                counts[word] += 1
+        return counts
+
     @staticmethod
     def search(text:str, words:list[str]) -> list[tuple[int, str]]:
         """
         Searches for all occurrences of words in the text.
         Returns a list of tuples (index, word).
         """
-        ac = AhoCorasick(words)
-        results = []
-        curr_node = ac.root
-        for i, char in enumerate(text):
-            if char in curr_node.children.keys():
-                curr_node = curr_node.children[char]
-                if curr_node.output:
-                    for word in curr_node.output:
-                        results.append((i - len(word)+1, word))
-            elif curr_node == ac.root:
-                continue
-            else:
-                curr_node = curr_node.fail_link
-        return results
-    
+        return AhoCorasick(words).find_all(text)
+
 class TrieNode:
     def __init__(self):
         self.children:dict[str,TrieNode] = {}
         self.fail_link:TrieNode = None
         self.output = []
-    
+
     def add_word(self,word:str):
         """
         Adds a word to the TrieNode.
@@ -59,4 +84,130 @@ class TrieNode:
             if char not in node.children:
                 node.children[char] = TrieNode()
             node = node.children[char]
-        node.output.append(word)
\ No newline at end of file
+        if word not in node.output:
+            node.output.append(word)
+
+class CompiledAhoCorasick:
+    """
+    Aho-Corasick dalam bentuk tabel (DFA) di atas alfabet byte.
+    Byte yang muncul di pattern dipetakan ke class 1..A (class 0 = byte lain),
+    transisi disimpan di satu array int datar berukuran jumlah_state * (A+1).
+    Posisi yang dihasilkan adalah offset byte pada teks UTF-8
+    (sama dengan index karakter untuk teks ASCII).
+    """
+    def __init__(self, words: list[str]):
+        self.words = list(dict.fromkeys(word for word in words if word))
+        encoded = [word.encode("utf-8") for word in self.words]
+        self.lengths = array("i", (len(pattern) for pattern in encoded))
+
+        # Kompresi alfabet: hanya byte yang dipakai pattern yang punya kolom sendiri
+        class_table = bytearray(256)
+        next_class = 1
+        for pattern in encoded:
+            for byte in pattern:
+                if not class_table[byte]:
+                    class_table[byte] = next_class
+                    next_class += 1
+        self.class_table = bytes(class_table)
+        self.stride = stride = next_class
+
+        # 1) Goto function (trie) langsung di tabel datar; 0 = tidak ada anak
+        delta = array("i", bytes(4 * stride))
+        terminal = array("i", [-1])
+        for pattern_id, pattern in enumerate(encoded):
+            node = 0
+            for byte in pattern:
+                slot = node * stride + class_table[byte]
+                if not delta[slot]:
+                    delta[slot] = len(terminal)
+                    delta.frombytes(bytes(4 * stride))
+                    terminal.append(-1)
+                node = delta[slot]
+            terminal[node] = pattern_id
+        state_count = len(terminal)
+
+        # 2) Failure link + output link (BFS), sekaligus ubah goto menjadi DFA penuh
+        fail = array("i", bytes(4 * state_count))
+        output_link = array("i", bytes(4 * state_count))
+        queue = deque([0])
+        while queue:
+            node = queue.popleft()
+            row = node * stride
+            fail_row = fail[node] * stride
+            for char_class in range(1, stride):
+                child = delta[row + char_class]
+                if child:
+                    child_fail = delta[fail_row + char_class] if node else 0
+                    fail[child] = child_fail
+                    output_link[child] = child_fail if terminal[child_fail] >= 0 else output_link[child_fail]
+                    queue.append(child)
+                elif node:
+                    delta[row + char_class] = delta[fail_row + char_class]
+
+        # 3) Simpan offset baris (state * stride); negatif = state punya output
+        has_output = [terminal[state] >= 0 or output_link[state] > 0 for state in range(state_count)]
+        for slot, target in enumerate(delta):
+            delta[slot] = -target * stride if has_output[target] else target * stride
+        self.delta = delta
+        self.terminal = terminal
+        self.output_link = output_link
+        self.state_count = state_count
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Ukuran tabel automaton dalam byte.
+        """
+        return sum(table.itemsize * len(table) for table in (self.delta, self.terminal, self.output_link, self.lengths))
+
+    def _codes(self, text) -> bytes:
+        if isinstance(text, str):
+            text = text.encode("utf-8")
+        return bytes(text).translate(self.class_table)
+
+    def scan(self, text) -> list[tuple[int, int]]:
+        """
+        Semua kemunculan pattern sebagai list (posisi awal, pattern_id).
+        """
+        delta, terminal, output_link, lengths = self.delta, self.terminal, self.output_link, self.lengths
+        stride = self.stride
+        results = []
+        state = 0
+        for i, char_class in enumerate(self._codes(text)):
+            state = delta[state + char_class]
+            if state < 0:
+                state = -state
+                node = state // stride
+                if terminal[node] < 0:
+                    node = output_link[node]
+                while node:
+                    pattern_id = terminal[node]
+                    results.append((i - lengths[pattern_id] + 1, pattern_id))
+                    node = output_link[node]
+        return results
+
+    def scan_counts(self, text) -> list[int]:
+        """
+        Jumlah kemunculan per pattern_id, tanpa membuat list posisi.
+        """
+        delta, terminal, output_link = self.delta, self.terminal, self.output_link
+        stride = self.stride
+        counts = [0] * len(self.words)
+        state = 0
+        for char_class in self._codes(text):
+            state = delta[state + char_class]
+            if state < 0:
+                state = -state
+                node = state // stride
+                if terminal[node] < 0:
+                    node = output_link[node]
+                while node:
+                    counts[terminal[node]] += 1
+                    node = output_link[node]
+        return counts
+
+    def count(self, text) -> dict[str, int]:
+        """
+        Sama seperti AhoCorasick.count: dict word -> jumlah kemunculan.
+        """
+        return dict(zip(self.words, self.scan_counts(text)))
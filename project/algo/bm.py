@@ -1,4 +1,6 @@
 # Boyer Moore String Search Algorithm
+from array import array
+
 def build_last_occurrence(pattern:str, charset=None) -> dict:
     """
     Builds last occurrence table for 'pattern'.
@@ -31,8 +33,187 @@ def boyer_moore_search(text: str, pattern: str) -> list[int]:
             j -= 1
         if j < 0:
             results.append(s) 
-            s += (s + m < n) and (m - last_occurrence.get(text[s + m], -1)) or 1
+            # geser ke karakter setelah window (aturan Sunday), kecuali sudah di ujung teks
+            s += m - last_occurrence.get(text[s + m], -1) if s + m < n else 1
         else:
             s += max(1, j - last_occurrence.get(text[s + j], -1))
     
-    return results
\ No newline at end of file
+    return results
+
+def build_bad_character_table(pattern: bytes) -> array:
+    """
+    Versi byte dari build_last_occurrence: array 256 entri,
+    index terakhir setiap byte di pattern (-1 jika tidak ada).
+    """
+    last_occurrence = array("i", [-1]) * 256
+    for i, byte in enumerate(pattern):
+        last_occurrence[byte] = i
+    return last_occurrence
+
+def build_good_suffix_table(pattern: bytes) -> array:
+    """
+    Tabel good suffix (versi kuat): shift[j] = geseran aman jika mismatch di index j
+    setelah pattern[j+1:] cocok; shift[0] juga dipakai setelah full match.
+    """
+    m = len(pattern)
+    # suffix[i] = panjang suffix terpanjang pattern yang juga berakhir di index i
+    suffix = [0] * m
+    suffix[m - 1] = m
+    g, f = m - 1, 0
+    for i in range(m - 2, -1, -1):
+        if i > g and suffix[i + m - 1 - f] < i - g:
+            suffix[i] = suffix[i + m - 1 - f]
+        else:
+            g = min(g, i)
+            f = i
+            while g >= 0 and pattern[g] == pattern[g + m - 1 - f]:
+                g -= 1
+            suffix[i] = f - g
+
+    shift = array("i", [m]) * m
+    # Kasus 2: hanya prefix pattern yang cocok dengan sebagian suffix yang sudah cocok
+    j = 0
+    for i in range(m - 1, -1, -1):
+        if suffix[i] == i + 1:
+            while j < m - 1 - i:
+                if shift[j] == m:
+                    shift[j] = m - 1 - i
+                j += 1
+    # Kasus 1: suffix yang cocok muncul lagi di dalam pattern
+    for i in range(m - 1):
+        shift[m - 1 - suffix[i]] = m - 1 - i
+    return shift
+
+def build_boyer_moore_table(pattern: bytes) -> tuple[array, array]:
+    return build_bad_character_table(pattern), build_good_suffix_table(pattern)
+
+def build_horspool_table(pattern: bytes) -> array:
+    """
+    Geseran Horspool per byte: jarak dari kemunculan terakhir byte (tanpa byte terakhir pattern) ke ujung pattern.
+    """
+    m = len(pattern)
+    shift = array("i", [m]) * 256
+    for i in range(m - 1):
+        shift[pattern[i]] = m - 1 - i
+    return shift
+
+def build_sunday_table(pattern: bytes) -> array:
+    """
+    Geseran Sunday (quick search) per byte, berdasarkan byte tepat setelah window.
+    """
+    m = len(pattern)
+    shift = array("i", [m + 1]) * 256
+    for i, byte in enumerate(pattern):
+        shift[byte] = m - i
+    return shift
+
+def _iter_boyer_moore(text, pattern: bytes, table: tuple[array, array]):
+    last_occurrence, good_suffix = table
+    n, m = len(text), len(pattern)
+    codes = tuple(pattern)  # indexing tuple lebih cepat daripada bytes di loop Python
+    full_match_shift = good_suffix[0]
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and codes[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+            s += full_match_shift
+        else:
+            bad_character_shift = j - last_occurrence[text[s + j]]
+            good_suffix_shift = good_suffix[j]
+            s += bad_character_shift if bad_character_shift > good_suffix_shift else good_suffix_shift
+
+def _iter_horspool(text, pattern: bytes, shift: array):
+    n, m = len(text), len(pattern)
+    codes = tuple(pattern)
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and codes[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+        s += shift[text[s + m - 1]]
+
+def _iter_sunday(text, pattern: bytes, shift: array):
+    n, m = len(text), len(pattern)
+    codes = tuple(pattern)
+    last_start = n - m
+    s = 0
+    while s <= last_start:
+        j = m - 1
+        while j >= 0 and codes[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+        if s == last_start:
+            break
+        s += shift[text[s + m]]
+
+# Varian Boyer-Moore per nama algoritma: (pembuat tabel, iterator posisi match)
+BM_VARIANTS = {
+    "Boyer-Moore": (build_boyer_moore_table, _iter_boyer_moore),
+    "Horspool": (build_horspool_table, _iter_horspool),
+    "Sunday": (build_sunday_table, _iter_sunday),
+}
+
+def bm_search_bytes(text, pattern: bytes, variant: str = "Boyer-Moore", table=None) -> list[int]:
+    """
+    Cari semua kemunculan 'pattern' di teks bytes/memoryview dengan varian BM pilihan
+    (lihat BM_VARIANTS). Kembalikan list offset byte awal match.
+    'table' boleh diisi hasil pembuat tabel varian yang sama agar tidak dihitung ulang.
+    """
+    if not pattern:
+        return []
+    build_table, iterate = BM_VARIANTS[variant]
+    return list(iterate(text, pattern, table if table is not None else build_table(pattern)))
+
+def bm_count_bytes(text, pattern: bytes, variant: str = "Boyer-Moore", table=None) -> int:
+    """
+    Seperti bm_search_bytes tetapi hanya menghitung jumlah kemunculan.
+    """
+    if not pattern:
+        return 0
+    build_table, iterate = BM_VARIANTS[variant]
+    count = 0
+    for _ in iterate(text, pattern, table if table is not None else build_table(pattern)):
+        count += 1
+    return count
+
+def boyer_moore_search_bytes(text, pattern: bytes, table: tuple[array, array] | None = None) -> list[int]:
+    """
+    Boyer-Moore lengkap (bad character + good suffix) di atas bytes/memoryview.
+    Returns a list of start byte offsets.
+    """
+    return bm_search_bytes(text, pattern, "Boyer-Moore", table)
+
+def boyer_moore_count_bytes(text, pattern: bytes, table: tuple[array, array] | None = None) -> int:
+    return bm_count_bytes(text, pattern, "Boyer-Moore", table)
+
+class BMPattern:
+    """
+    Keyword yang sudah dikompilasi untuk salah satu varian BM_VARIANTS:
+    tabel geseran dihitung sekali lalu dipakai ulang untuk setiap CV.
+    """
+    __slots__ = ("pattern", "variant", "table")
+
+    def __init__(self, pattern: str | bytes, variant: str = "Boyer-Moore"):
+        if variant not in BM_VARIANTS:
+            raise ValueError(f"Unknown Boyer-Moore variant: {variant}")
+        self.pattern = pattern.encode("utf-8") if isinstance(pattern, str) else bytes(pattern)
+        self.variant = variant
+        self.table = BM_VARIANTS[variant][0](self.pattern) if self.pattern else None
+
+    def search(self, text) -> list[int]:
+        """
+        Offset byte semua kemunculan di teks bytes/memoryview.
+        """
+        return bm_search_bytes(text, self.pattern, self.variant, self.table)
+
+    def count(self, text) -> int:
+        return bm_count_bytes(text, self.pattern, self.variant, self.table)
+
+    def __repr__(self) -> str:
+        return f"BMPattern({self.pattern!r}, {self.variant!r})"
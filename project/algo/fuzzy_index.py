@@ -0,0 +1,151 @@
+# BK-tree + index kosakata untuk fuzzy search seluruh korpus
+from algo.levenshtein import myers_distance, build_peq, fuzzy_distance_limit
+
+class BKTree:
+    """
+    Burkhard-Keller tree atas jarak Levenshtein.
+    Setiap node: [word, {jarak: anak}].
+    """
+    def __init__(self):
+        self.root: list | None = None
+        self.size = 0
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = [word, {}]
+            self.size = 1
+            return
+        node = self.root
+        while True:
+            distance = myers_distance(node[0], word)
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [word, {}]
+                self.size += 1
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[str, int]]:
+        """
+        Semua kata di tree dengan jarak <= max_distance dari 'word'.
+        """
+        if self.root is None:
+            return []
+        peq = build_peq(word)
+        results = []
+        stack = [self.root]
+        while stack:
+            node_word, children = stack.pop()
+            distance = myers_distance(word, node_word, peq=peq)
+            if distance <= max_distance:
+                results.append((node_word, distance))
+            # ketaksamaan segitiga: hanya anak dengan jarak di [d-k, d+k] yang mungkin cocok
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+        return results
+
+def _in_text_order(found: list[tuple[int, str]]) -> tuple[int, list[str]]:
+    """
+    (match_count, matched_words) dari pasangan (posisi, bentuk kata), urut seperti di teks.
+    """
+    found.sort()
+    return len(found), [form for _, form in found]
+
+class FuzzyIndex:
+    """
+    Kosakata unik (lowercase) seluruh CV dalam BK-tree, plus posting
+    kata -> {cv_id: {bentuk asli: [posisi kata di teks]}}. Satu query fuzzy = satu lookup BK-tree,
+    hasilnya sama dengan fuzzy_text_search pada setiap CV (termasuk urutan kata).
+    """
+    def __init__(self, texts: list[str] | None = None):
+        self.tree = BKTree()
+        self.postings: dict[str, dict[int, dict[str, list[int]]]] = {}
+        self.size = 0
+        self._similar_cache: dict[tuple[str, int], list[str]] = {}
+        for text in texts or []:
+            self.add(text)
+
+    def add(self, text: str) -> int:
+        """
+        Tambahkan satu teks CV ke index, kembalikan cv_id-nya.
+        """
+        cv_id = self.size
+        self.size += 1
+        for position, word in enumerate(text.split()):
+            word_lowercase = word.lower()
+            cv_postings = self.postings.get(word_lowercase)
+            if cv_postings is None:
+                cv_postings = self.postings[word_lowercase] = {}
+                self.tree.add(word_lowercase)
+            cv_postings.setdefault(cv_id, {}).setdefault(word, []).append(position)
+        self._similar_cache.clear()
+        return cv_id
+
+    def similar_words(self, target: str, max_distance: int) -> list[str]:
+        """
+        Kata-kata (lowercase) di kosakata dengan jarak <= max_distance.
+        """
+        key = (target.lower(), max_distance)
+        if key not in self._similar_cache:
+            self._similar_cache[key] = [word for word, _ in self.tree.search(key[0], max_distance)]
+        return self._similar_cache[key]
+
+    def _similar_for(self, target: str, similarity_threshold: float, max_distance: int) -> list[str]:
+        edit_distance_limit = fuzzy_distance_limit(len(target), similarity_threshold, max_distance)
+        return self.similar_words(target, edit_distance_limit)
+
+    def search(self, target: str, similarity_threshold: float = 0.125, max_distance: int = 4) -> dict[int, tuple[int, list[str]]]:
+        """
+        Fuzzy search 'target' di seluruh korpus.
+        Kembalikan dict cv_id -> (match_count, matched_words), hanya CV dengan match.
+        """
+        if not target:
+            return {}
+        occurrences: dict[int, list[tuple[int, str]]] = {}
+        for word in self._similar_for(target, similarity_threshold, max_distance):
+            for cv_id, forms in self.postings[word].items():
+                found = occurrences.setdefault(cv_id, [])
+                for form, positions in forms.items():
+                    found.extend((position, form) for position in positions)
+        return {cv_id: _in_text_order(found) for cv_id, found in occurrences.items()}
+
+    def search_counts(self, target: str, similarity_threshold: float = 0.125, max_distance: int = 4) -> dict[int, int]:
+        """
+        Seperti search(), tapi hanya jumlah match per cv_id (tanpa list kata).
+        """
+        if not target:
+            return {}
+        counts: dict[int, int] = {}
+        for word in self._similar_for(target, similarity_threshold, max_distance):
+            for cv_id, forms in self.postings[word].items():
+                counts[cv_id] = counts.get(cv_id, 0) + sum(map(len, forms.values()))
+        return counts
+
+    def matched_words(self, target: str, cv_id: int, similarity_threshold: float = 0.125, max_distance: int = 4) -> tuple[int, list[str]]:
+        """
+        (match_count, matched_words) untuk satu CV saja.
+        """
+        if not target:
+            return 0, []
+        found = []
+        for word in self._similar_for(target, similarity_threshold, max_distance):
+            for form, positions in self.postings[word].get(cv_id, {}).items():
+                found.extend((position, form) for position in positions)
+        return _in_text_order(found)
+
+    def matched_forms(self, target: str, exclude_cv_ids=(), similarity_threshold: float = 0.125, max_distance: int = 4) -> set[str]:
+        """
+        Semua bentuk kata asli yang mirip 'target' di korpus, kecuali di CV 'exclude_cv_ids'.
+        """
+        if not target:
+            return set()
+        exclude_cv_ids = set(exclude_cv_ids)
+        found = set()
+        for word in self._similar_for(target, similarity_threshold, max_distance):
+            for cv_id, forms in self.postings[word].items():
+                if cv_id not in exclude_cv_ids:
+                    found.update(forms)
+        return found
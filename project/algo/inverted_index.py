@@ -0,0 +1,215 @@
+# Inverted Index untuk pencarian keyword exact
+import re
+from bisect import bisect_left
+
+from utils.lru_cache import LRUCache
+
+TOKEN_PATTERN = re.compile(r"\w+")
+GRAM_SIZE = 3
+TOKEN_CACHE_SIZE = 1024  # hasil lookup kosakata per (bagian keyword, posisi)
+
+def _prefixed(sorted_tokens: list[str], prefix: str):
+    """
+    Token di list terurut yang diawali 'prefix' (bisect, tanpa menelusuri semua token).
+    """
+    for i in range(bisect_left(sorted_tokens, prefix), len(sorted_tokens)):
+        if not sorted_tokens[i].startswith(prefix):
+            break
+        yield sorted_tokens[i]
+
+class TokenIndex:
+    """
+    Kosakata InvertedIndex dengan lookup substring tanpa menelusuri seluruh kosakata:
+    trigram -> token untuk substring, list token terurut (dan token terbalik) + bisect untuk prefix/suffix.
+    """
+    def __init__(self):
+        self.tokens: set[str] = set()
+        self.grams: dict[str, set[str]] = {}
+        self.short_tokens: set[str] = set()  # token < GRAM_SIZE karakter, tidak punya trigram
+        self._sorted: list[str] = []
+        self._reversed: list[str] = []
+        self._pending: list[str] = []  # token baru yang belum masuk list terurut
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def add(self, token: str):
+        if token in self.tokens:
+            return
+        self.tokens.add(token)
+        self._pending.append(token)
+        if len(token) < GRAM_SIZE:
+            self.short_tokens.add(token)
+        for i in range(len(token) - GRAM_SIZE + 1):
+            self.grams.setdefault(token[i:i + GRAM_SIZE], set()).add(token)
+
+    def _sorted_lists(self) -> tuple[list[str], list[str]]:
+        # Diurutkan ulang hanya jika ada token baru; timsort menggabungkan dua run terurut dalam O(n)
+        if self._pending:
+            self._sorted = sorted(self._sorted + sorted(self._pending))
+            self._reversed = sorted(self._reversed + sorted(token[::-1] for token in self._pending))
+            self._pending = []
+        return self._sorted, self._reversed
+
+    def containing(self, run: str) -> list[str]:
+        """
+        Token yang memuat 'run' di posisi mana pun.
+        """
+        if len(run) < GRAM_SIZE:
+            # Jumlah trigram dibatasi alfabet, tidak tumbuh dengan kosakata
+            tokens = {token for token in self.short_tokens if run in token}
+            for gram, gram_tokens in self.grams.items():
+                if run in gram:
+                    tokens.update(gram_tokens)
+            return list(tokens)
+        # Token yang memuat 'run' pasti memuat semua trigramnya: cukup saring himpunan trigram terkecil
+        candidates = min((self.grams.get(run[i:i + GRAM_SIZE], ()) for i in range(len(run) - GRAM_SIZE + 1)), key=len)
+        return [token for token in candidates if run in token]
+
+    def exact(self, run: str) -> list[str]:
+        return [run] if run in self.tokens else []
+
+    def starting_with(self, run: str) -> list[str]:
+        return list(_prefixed(self._sorted_lists()[0], run))
+
+    def ending_with(self, run: str) -> list[str]:
+        return [token[::-1] for token in _prefixed(self._sorted_lists()[1], run[::-1])]
+
+class InvertedIndex:
+    """
+    Memetakan token (lowercase) ke posting list {cv_id: [posisi karakter]}.
+    Hasil pencarian sama dengan menjalankan KMP/BM pada teks lowercase,
+    tapi hanya menyentuh posting dari token yang relevan.
+    Jika 'text_source' (cv_id -> teks lowercase) diberikan, index tidak menyimpan
+    salinan teks sendiri dan membaca teks dari sumber itu saat verifikasi.
+    """
+    def __init__(self, texts: list[str] | None = None, text_source=None):
+        self.texts: list[str] = []
+        self.size = 0
+        self._text = text_source or self.texts.__getitem__
+        self._keep_texts = text_source is None
+        self.postings: dict[str, dict[int, list[int]]] = {}
+        self.tokens = TokenIndex()
+        # Kosakata hanya bertambah: key memuat ukurannya, jadi add() tidak perlu mengosongkan cache
+        self._token_cache = LRUCache(maxsize=TOKEN_CACHE_SIZE)
+        for text in texts or []:
+            self.add(text)
+
+    def add(self, text: str) -> int:
+        """
+        Tambahkan satu teks CV ke index, kembalikan cv_id-nya.
+        """
+        cv_id = self.size
+        self.size += 1
+        text = text.lower()
+        if self._keep_texts:
+            self.texts.append(text)
+        for match in TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            cv_postings = self.postings.get(token)
+            if cv_postings is None:
+                cv_postings = self.postings[token] = {}
+                self.tokens.add(token)
+            cv_postings.setdefault(cv_id, []).append(match.start())
+        return cv_id
+
+    def _matching_tokens(self, run: str, at_token_start: bool, at_token_end: bool) -> list[str]:
+        """
+        Token di vocabulary yang bisa memuat 'run' sesuai posisinya di keyword.
+        """
+        if at_token_start and at_token_end:
+            lookup = self.tokens.exact
+        elif at_token_start:
+            lookup = self.tokens.starting_with
+        elif at_token_end:
+            lookup = self.tokens.ending_with
+        else:
+            lookup = self.tokens.containing
+        key = (run, at_token_start, at_token_end, len(self.tokens))
+        return self._token_cache.get_or_compute(key, lambda: lookup(run))
+
+    def _scan(self, keyword: str) -> dict[int, list[int]]:
+        # keyword tanpa karakter kata (mis. "++"), tidak bisa dijawab dari index
+        results = {}
+        for cv_id in range(self.size):
+            text = self._text(cv_id)
+            positions = []
+            start = text.find(keyword)
+            while start != -1:
+                positions.append(start)
+                start = text.find(keyword, start + 1)
+            if positions:
+                results[cv_id] = positions
+        return results
+
+    def search(self, keyword: str) -> dict[int, list[int]]:
+        """
+        Cari semua kemunculan 'keyword'.
+        Kembalikan dict cv_id -> list posisi awal (0-based, terurut).
+        """
+        keyword = keyword.lower()
+        if not keyword:
+            return {}
+        runs = []
+        for match in TOKEN_PATTERN.finditer(keyword):
+            at_token_start = match.start() > 0
+            at_token_end = match.end() < len(keyword)
+            runs.append((match.start(), match.group(), at_token_start, at_token_end))
+        if not runs:
+            return self._scan(keyword)
+
+        # Irisan posting list: CV harus memuat token untuk setiap bagian keyword
+        run_tokens = [self._matching_tokens(run, start, end) for _, run, start, end in runs]
+        cv_sets = []
+        for tokens in sorted(run_tokens, key=len):
+            cv_ids = set()
+            for token in tokens:
+                cv_ids.update(self._cv_ids(token))
+            cv_sets.append(cv_ids)
+            if not cv_ids:
+                return {}
+        candidates = set.intersection(*cv_sets)
+
+        # Anchor = bagian keyword terpanjang; verifikasi posisi kandidat di teks asli
+        anchor_index = max(range(len(runs)), key=lambda i: len(runs[i][1]))
+        results = self._verify(keyword, runs[anchor_index], run_tokens[anchor_index], candidates)
+        for positions in results.values():
+            positions.sort()
+        return results
+
+    def _cv_ids(self, token: str):
+        return self.postings[token]
+
+    def _verify(self, keyword: str, anchor_run: tuple, tokens: list[str], candidates: set[int]) -> dict[int, list[int]]:
+        """
+        Posisi 'keyword' di CV kandidat: setiap kemunculan token anchor digeser ke awal keyword lalu dicek di teks.
+        """
+        anchor_offset, anchor, at_token_start, at_token_end = anchor_run
+        results: dict[int, list[int]] = {}
+        # Teks kandidat dibaca (lewat text_source) sekali per query, bukan sekali per token/posting
+        texts: dict[int, str] = {}
+        for token in tokens:
+            if at_token_start:
+                shifts = [0]
+            elif at_token_end:
+                shifts = [len(token) - len(anchor)]
+            else:
+                shifts = [i for i in range(len(token) - len(anchor) + 1) if token.startswith(anchor, i)]
+            for cv_id, offsets in self.postings[token].items():
+                if cv_id not in candidates:
+                    continue
+                text = texts.get(cv_id)
+                if text is None:
+                    text = texts[cv_id] = self._text(cv_id)
+                for offset in offsets:
+                    for shift in shifts:
+                        start = offset + shift - anchor_offset
+                        if start >= 0 and text.startswith(keyword, start):
+                            results.setdefault(cv_id, []).append(start)
+        return results
+
+    def count(self, keyword: str) -> dict[int, int]:
+        """
+        Jumlah kemunculan 'keyword' per cv_id (hanya CV yang cocok).
+        """
+        return {cv_id: len(positions) for cv_id, positions in self.search(keyword).items()}
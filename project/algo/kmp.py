@@ -1,4 +1,5 @@
 # file: src/kmp_utils.py
+from array import array
 
 def compute_lps(pattern: str) -> list[int]:
     """
@@ -50,4 +51,87 @@ def kmp_search(text: str, pattern: str) -> list[int]:
                 j = lps[j - 1]
             else:
                 i += 1
-    return results
\ No newline at end of file
+    return results
+
+def compute_lps_table(pattern: bytes) -> array:
+    """
+    Versi byte dari compute_lps: tabel LPS sebagai array int ("i").
+    """
+    lps = array("i", bytes(4 * len(pattern)))
+    length = 0
+    for i in range(1, len(pattern)):
+        while length and pattern[i] != pattern[length]:
+            length = lps[length - 1]
+        if pattern[i] == pattern[length]:
+            length += 1
+        lps[i] = length
+    return lps
+
+def kmp_search_bytes(text, pattern: bytes, lps: array | None = None) -> list[int]:
+    """
+    KMP di atas bytes/memoryview (mis. teks UTF-8 dari CorpusStore).
+    Kembalikan list offset byte tempat pattern mulai cocok.
+    """
+    m = len(pattern)
+    if m == 0:
+        return []
+    if lps is None:
+        lps = compute_lps_table(pattern)
+    codes = tuple(pattern)  # indexing tuple lebih cepat daripada bytes di loop Python
+    results = []
+    j = 0
+    # teks tidak pernah mundur di KMP, jadi cukup iterasi byte per byte
+    for i, byte in enumerate(text):
+        while j and byte != codes[j]:
+            j = lps[j - 1]
+        if byte == codes[j]:
+            j += 1
+            if j == m:
+                results.append(i - m + 1)
+                j = lps[j - 1]
+    return results
+
+def kmp_count_bytes(text, pattern: bytes, lps: array | None = None) -> int:
+    """
+    Seperti kmp_search_bytes tetapi hanya menghitung jumlah kemunculan,
+    tanpa membuat list posisi.
+    """
+    m = len(pattern)
+    if m == 0:
+        return 0
+    if lps is None:
+        lps = compute_lps_table(pattern)
+    codes = tuple(pattern)
+    count = j = 0
+    for byte in text:
+        while j and byte != codes[j]:
+            j = lps[j - 1]
+        if byte == codes[j]:
+            j += 1
+            if j == m:
+                count += 1
+                j = lps[j - 1]
+    return count
+
+class KMPPattern:
+    """
+    Keyword yang sudah dikompilasi untuk KMP: byte UTF-8 + tabel LPS dihitung sekali,
+    lalu dipakai ulang untuk setiap CV (dan setiap query lewat cache pattern).
+    """
+    __slots__ = ("pattern", "lps")
+
+    def __init__(self, pattern: str | bytes):
+        self.pattern = pattern.encode("utf-8") if isinstance(pattern, str) else bytes(pattern)
+        self.lps = compute_lps_table(self.pattern)
+
+    def search(self, text) -> list[int]:
+        """
+        Offset byte semua kemunculan di teks bytes/memoryview.
+        """
+        return kmp_search_bytes(text, self.pattern, self.lps)
+
+    def count(self, text) -> int:
+        return kmp_count_bytes(text, self.pattern, self.lps)
+
+    def __repr__(self) -> str:
+        return f"KMPPattern({self.pattern!r})"
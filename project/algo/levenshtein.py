@@ -31,19 +31,82 @@ def levenshtein_distance(a: str, b: str) -> int:
     return dp[len_a][len_b]
 
 
+def build_peq(pattern: str) -> dict[str, int]:
+    """
+    Bitmask posisi setiap karakter di 'pattern' (bit i = pattern[i]).
+    """
+    peq: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        peq[char] = peq.get(char, 0) | (1 << i)
+    return peq
+
+
+def myers_distance(pattern: str, text: str, limit: int | None = None, peq: dict[str, int] | None = None) -> int:
+    """
+    Jarak Levenshtein dengan algoritma bit-vector Myers/Hyyro, O(len(text)) operasi bit.
+    Jika 'limit' diberikan, berhenti lebih awal dan kembalikan limit + 1
+    begitu jaraknya pasti melebihi limit.
+    """
+    m, n = len(pattern), len(text)
+    if limit is not None and abs(m - n) > limit:
+        return limit + 1
+    if m == 0:
+        return n
+    if peq is None:
+        peq = build_peq(pattern)
+
+    full = (1 << m) - 1
+    last_bit = 1 << (m - 1)
+    vertical_plus, vertical_minus = full, 0
+    score = m
+    for j, char in enumerate(text):
+        eq = peq.get(char, 0)
+        xv = eq | vertical_minus
+        xh = (((eq & vertical_plus) + vertical_plus) ^ vertical_plus) | eq
+        horizontal_plus = vertical_minus | (~(xh | vertical_plus) & full)
+        horizontal_minus = vertical_plus & xh
+        if horizontal_plus & last_bit:
+            score += 1
+        elif horizontal_minus & last_bit:
+            score -= 1
+        # sisa karakter text paling banyak menurunkan skor 1 per karakter
+        if limit is not None and score - (n - j - 1) > limit:
+            return limit + 1
+        horizontal_plus = ((horizontal_plus << 1) | 1) & full
+        horizontal_minus = (horizontal_minus << 1) & full
+        vertical_plus = horizontal_minus | (~(xv | horizontal_plus) & full)
+        vertical_minus = horizontal_plus & xv
+    return score
+
+
+def fuzzy_distance_limit(target_length: int, similarity_threshold: float = 0.125, max_distance: int = 4) -> int:
+    """
+    Ambang batas jarak edit (dinamis terhadap panjang keyword).
+    """
+    return min(math.ceil(similarity_threshold * target_length), max_distance)
+
+
 def fuzzy_text_search(text: str, target: str, similarity_threshold: float = 0.125, max_distance: int = 4) -> tuple[int, list[str]]:
     # Hitung ambang batas (edit_distance_limit) secara dinamis
     target_length = len(target)
     if target_length == 0:
         return 0, []
-    edit_distance_limit = min(math.ceil(similarity_threshold * target_length), max_distance)
+    edit_distance_limit = fuzzy_distance_limit(target_length, similarity_threshold, max_distance)
     word_list = text.split()
     match_count = 0
     found_matches = []
     target_lowercase = target.lower()
+    peq = build_peq(target_lowercase)
+    # kata yang sama cukup dihitung sekali
+    is_similar: dict[str, bool] = {}
     for current_word in word_list:
-        # edit_distance_limit sebagai threshold dinamis
-        if levenshtein_distance(current_word.lower(), target_lowercase) <= edit_distance_limit: 
+        word_lowercase = current_word.lower()
+        similar = is_similar.get(word_lowercase)
+        if similar is None:
+            # edit_distance_limit sebagai threshold dinamis
+            similar = myers_distance(target_lowercase, word_lowercase, edit_distance_limit, peq) <= edit_distance_limit
+            is_similar[word_lowercase] = similar
+        if similar:
             match_count += 1
             found_matches.append(current_word)
     return match_count, found_matches
@@ -0,0 +1,43 @@
+# Seleksi Top-K dengan bounded min-heap
+import heapq
+from itertools import count
+
+class TopK:
+    """
+    Menyimpan K item dengan skor tertinggi dalam min-heap berukuran K.
+    Jika skor sama, item dengan 'order' lebih kecil (masuk lebih dulu) menang,
+    sama seperti heapq.nlargest / sorted(..., reverse=True) yang stabil.
+    """
+    def __init__(self, k: int):
+        self.k = k
+        self._heap: list[tuple] = []
+        self._counter = count()
+        self.pushed = 0
+
+    def _key(self, score, order):
+        return (score, -order)
+
+    def push(self, score, item, order: int | None = None) -> bool:
+        """
+        Masukkan item; kembalikan True jika item masuk Top-K.
+        """
+        if order is None:
+            order = next(self._counter)
+        self.pushed += 1
+        entry = (*self._key(score, order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+            return True
+        if self.k > 0 and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def items(self) -> list:
+        """
+        Item terurut dari skor tertinggi.
+        """
+        return [entry[2] for entry in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
@@ -0,0 +1,61 @@
+# Benchmark: AhoCorasick (dict trie) vs CompiledAhoCorasick (tabel array)
+# Jalankan dari project/: python -m bench.bench_ahocor [jumlah_pattern]
+import sys
+import tracemalloc
+
+from bench.corpus import load_bench_texts, timed
+from algo.ahocor import AhoCorasick, CompiledAhoCorasick
+from algo.inverted_index import TOKEN_PATTERN
+
+def build_patterns(texts: list[str], count: int) -> list[str]:
+    """
+    Ambil 'count' token unik dari korpus sebagai kamus skill tiruan.
+    """
+    patterns = []
+    seen = set()
+    for text in texts:
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            if len(token) >= 3 and token not in seen:
+                seen.add(token)
+                patterns.append(token)
+    # tambah bigram jika vocabulary kurang
+    i = 0
+    while len(patterns) < count and i + 1 < len(patterns):
+        phrase = f"{patterns[i]} {patterns[i + 1]}"
+        if phrase not in seen:
+            seen.add(phrase)
+            patterns.append(phrase)
+        i += 1
+    return patterns[:count]
+
+def measure_build(cls, patterns):
+    # waktu build diukur tanpa tracemalloc (tracemalloc memperlambat alokasi)
+    automaton, seconds = timed(cls, patterns, repeat=1)
+    tracemalloc.start()
+    cls(patterns)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return automaton, seconds, peak
+
+def main():
+    pattern_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    texts = load_bench_texts()
+    corpus = "\n".join(text.lower() for text in texts)
+    patterns = build_patterns(texts, pattern_count)
+    megabytes = len(corpus.encode("utf-8")) / 1e6
+    print(f"{len(patterns)} patterns, corpus {megabytes:.2f} MB ({len(texts)} CVs)")
+
+    trie, trie_build, trie_memory = measure_build(AhoCorasick, patterns)
+    compiled, compiled_build, compiled_memory = measure_build(CompiledAhoCorasick, patterns)
+    print(f"{'':<22}{'build (s)':>12}{'peak mem (MB)':>15}{'scan (MB/s)':>14}")
+
+    trie_counts, trie_scan = timed(trie.count, corpus, repeat=1)
+    compiled_counts, compiled_scan = timed(compiled.count, corpus, repeat=1)
+    assert trie_counts == compiled_counts, "Hasil kedua automaton harus sama"
+
+    print(f"{'AhoCorasick (dict)':<22}{trie_build:>12.3f}{trie_memory / 1e6:>15.1f}{megabytes / trie_scan:>14.2f}")
+    print(f"{'CompiledAhoCorasick':<22}{compiled_build:>12.3f}{compiled_memory / 1e6:>15.1f}{megabytes / compiled_scan:>14.2f}")
+    print(f"states: {compiled.state_count}, alphabet classes: {compiled.stride - 1}, table: {compiled.nbytes / 1e6:.1f} MB")
+
+if __name__ == "__main__":
+    main()
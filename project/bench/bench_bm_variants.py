@@ -0,0 +1,31 @@
+# Benchmark varian Boyer-Moore (bad character + good suffix, Horspool, Sunday) vs KMP untuk keyword pendek dan frasa panjang
+# Jalankan dari project/: python -m bench.bench_bm_variants [keyword ...]
+import sys
+
+from bench.corpus import load_bench_texts, timed
+from algo.bm import BM_VARIANTS, bm_count_bytes
+from algo.kmp import compute_lps_table, kmp_count_bytes
+
+DEFAULT_KEYWORDS = ("sql", "excel", "python", "management", "accounts receivable", "microsoft office suite")
+
+def main():
+    keywords = sys.argv[1:] or list(DEFAULT_KEYWORDS)
+    corpus = memoryview("\n".join(text.lower() for text in load_bench_texts()).encode("utf-8"))
+    megabytes = len(corpus) / 1e6
+    names = ["KMP", *BM_VARIANTS]
+    print(f"corpus {megabytes:.2f} MB, throughput in MB/s (count-only, tables built once)")
+    print(f"{'keyword':<24}" + "".join(f"{name:>13}" for name in names) + "   winner")
+    for keyword in keywords:
+        pattern = keyword.encode("utf-8")
+        lps = compute_lps_table(pattern)
+        count, seconds = timed(kmp_count_bytes, corpus, pattern, lps)
+        throughput = {"KMP": megabytes / seconds}
+        for variant, (build_table, _) in BM_VARIANTS.items():
+            variant_count, seconds = timed(bm_count_bytes, corpus, pattern, variant, build_table(pattern))
+            assert variant_count == count, (variant, keyword)
+            throughput[variant] = megabytes / seconds
+        winner = max(throughput, key=throughput.get)
+        print(f"{keyword!r:<24}" + "".join(f"{throughput[name]:>13.1f}" for name in names) + f"   {winner}")
+
+if __name__ == "__main__":
+    main()
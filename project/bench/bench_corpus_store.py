@@ -0,0 +1,84 @@
+# Benchmark corpus store: waktu buka korpus, memori teks, dan kecepatan scan str vs memoryview mmap
+# Jalankan dari project/: python -m bench.bench_corpus_store [jumlah CV]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import load_bench_texts, timed
+from utils.corpus_store import CorpusStore, write_store
+from utils.search_engine import scan_texts
+from utils.text_cache import CACHE_VERSION, TextCache, atomic_write_json
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CV_COUNT = 5000
+SCAN_QUERIES = ((["accounting", "python"], "KMP"), (["accounting", "python"], "Aho-Corasick"))
+
+# Dijalankan di proses baru: muat korpus dengan satu cara, cetak RSS anonim/file (kB) dari /proc
+MEMORY_PROBE = """
+import sys
+from utils.corpus_store import CorpusStore
+from utils.text_cache import TextCache
+mode, path = sys.argv[1], sys.argv[2]
+if mode == "dict":
+    entries = TextCache(path).entries
+    corpus = [{"path": p, "filename": p, "text": entry["text"]} for p, entry in entries.items()]
+    del entries
+    lower_texts = [cv["text"].lower() for cv in corpus]
+else:
+    corpus = list(CorpusStore.open(path))
+    lower_texts = [cv.lower_view() for cv in corpus]
+    # Sentuh semua halaman seperti satu full scan (RssFile = page cache, bisa dibuang OS)
+    sum(bytes(view).count(b"a") for view in lower_texts)
+status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+print(int(status["RssAnon"].split()[0]), int(status["RssFile"].split()[0]))
+"""
+
+def replicate(texts: list[str], count: int) -> list[dict]:
+    return [{"path": f"cv-{i}.pdf", "filename": f"cv-{i}.pdf", "text": texts[i % len(texts)]} for i in range(count)]
+
+def memory_kb(mode: str, path: str) -> tuple[int, int]:
+    output = subprocess.run([sys.executable, "-c", MEMORY_PROBE, mode, path], cwd=PROJECT_DIRECTORY,
+                            capture_output=True, text=True, check=True).stdout
+    anon, file = output.split()
+    return int(anon), int(file)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CV_COUNT
+    corpus = replicate(load_bench_texts(), count)
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "text_cache.json")
+        # Entri cache palsu (tanpa file PDF): yang diukur hanya waktu parse JSON
+        atomic_write_json(cache_path, {"version": CACHE_VERSION, "entries": {
+            data["path"]: {"mtime": 0, "size": 0, "sha1": "", "text": data["text"]} for data in corpus}})
+        store_directory = os.path.join(tmp, "store")
+        start = time.perf_counter()
+        write_store(corpus, store_directory).close()
+        print(f"{count} CVs, store written in {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"(text cache {os.path.getsize(cache_path) / 1e6:.1f} MB)")
+
+        _, json_seconds = timed(lambda: len(TextCache(cache_path).entries))
+        _, store_seconds = timed(lambda: [cv.lower_view() for cv in CorpusStore.open(store_directory)])
+        print(f"open corpus: text cache JSON {json_seconds * 1000:8.1f} ms   corpus store {store_seconds * 1000:8.1f} ms")
+
+        for mode, path in (("dict", cache_path), ("store", store_directory)):
+            anon, file = memory_kb(mode, path)
+            print(f"{mode:<5} corpus + lowercase texts: RssAnon {anon / 1024:7.1f} MB   RssFile {file / 1024:7.1f} MB")
+
+        store = CorpusStore.open(store_directory)
+        lower_texts = [data["text"].lower() for data in corpus]
+        lower_views = [record.lower_view() for record in store]
+        total_mb = sum(len(view) for view in lower_views) / 1e6
+        for keywords, algorithm in SCAN_QUERIES:
+            expected, str_seconds = timed(scan_texts, lower_texts, keywords, algorithm)
+            result, view_seconds = timed(scan_texts, lower_views, keywords, algorithm)
+            assert result == expected, algorithm
+            print(f"scan {algorithm:<13} str {total_mb / str_seconds:7.1f} MB/s   "
+                  f"memoryview {total_mb / view_seconds:7.1f} MB/s")
+        del lower_views
+        store.close()
+
+if __name__ == "__main__":
+    main()
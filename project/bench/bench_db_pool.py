@@ -0,0 +1,87 @@
+# Benchmark: latensi "Summary" berulang, koneksi baru per klik vs connection pool
+# Jalankan dari project/: python -m bench.bench_db_pool [jumlah_lookup]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from utils.db import ConnectionPool, establish_connection, get_pool
+
+# Lookup satu baris seperti tombol "Summary" sebelum prefetch (aplikasi kini lewat ProfileCache)
+MYSQL_LOOKUP = """
+SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.date_of_birth,
+       ap.address, ap.phone_number, ad.application_role
+FROM ApplicantProfile ap
+JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+WHERE ad.cv_filename = %s
+"""
+
+SQLITE_LOOKUP = MYSQL_LOOKUP.replace("%s", "?")
+
+def build_sqlite_standin(path: str, applicants: int = 2000):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+    CREATE TABLE ApplicantProfile (applicant_id INTEGER PRIMARY KEY, first_name TEXT, last_name TEXT,
+                                   date_of_birth TEXT, address TEXT, phone_number TEXT);
+    CREATE TABLE ApplicationDetail (detail_id INTEGER PRIMARY KEY, applicant_id INTEGER,
+                                    application_role TEXT, cv_path TEXT, cv_filename TEXT);
+    CREATE INDEX idx_cv_filename ON ApplicationDetail (cv_filename);
+    """)
+    conn.executemany("INSERT INTO ApplicantProfile VALUES (?, ?, ?, ?, ?, ?)",
+                     [(i, f"First{i}", f"Last{i}", "1990-01-01", "Street", "0812") for i in range(1, applicants + 1)])
+    conn.executemany("INSERT INTO ApplicationDetail VALUES (?, ?, ?, ?, ?)",
+                     [(i, i, "Accountant", f"data/ACCOUNTANT/{i}.pdf", f"{i}.pdf") for i in range(1, applicants + 1)])
+    conn.commit()
+    conn.close()
+
+def run_lookups(get_connection, release, lookup, count: int) -> list[float]:
+    latencies = []
+    for i in range(count):
+        start = time.perf_counter()
+        conn = get_connection()
+        lookup(conn, i)
+        release(conn)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def report(label: str, latencies: list[float]):
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2]
+    p95 = ordered[int(len(ordered) * 0.95) - 1]
+    print(f"{label:<28} mean {sum(ordered) / len(ordered):7.3f} ms   p50 {p50:7.3f} ms   p95 {p95:7.3f} ms")
+
+def sqlite_lookup(conn, i):
+    conn.execute(SQLITE_LOOKUP, (f"{i % 2000 + 1}.pdf",)).fetchone()
+
+def mysql_lookup(conn, i):
+    cursor = conn.cursor(dictionary=True, buffered=True)
+    cursor.execute(MYSQL_LOOKUP, ("10554236.pdf",))
+    cursor.fetchone()
+    cursor.close()
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "standin.db")
+        build_sqlite_standin(path)
+        connect = lambda: sqlite3.connect(path, check_same_thread=False)
+        print(f"SQLite stand-in, {count} lookups")
+        report("fresh connection per lookup", run_lookups(connect, lambda conn: conn.close(), sqlite_lookup, count))
+        pool = ConnectionPool(connect)
+        report("ConnectionPool", run_lookups(pool.acquire, pool.release, sqlite_lookup, count))
+        pool.close_all()
+
+    try:
+        establish_connection().close()
+    except Exception as error:
+        print(f"MySQL not reachable ({type(error).__name__}), skipping MySQL numbers")
+        return
+    print(f"MySQL, {count} summary lookups")
+    report("fresh connection per lookup", run_lookups(establish_connection, lambda conn: conn.close(), mysql_lookup, count))
+    pool = get_pool()
+    report("ConnectionPool", run_lookups(pool.acquire, pool.release, mysql_lookup, count))
+
+if __name__ == "__main__":
+    main()
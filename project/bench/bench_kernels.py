@@ -0,0 +1,47 @@
+# Benchmark throughput (MB/s): KMP/BM/Aho-Corasick pada str vs kernel byte (bytes/memoryview, count-only)
+# Jalankan dari project/: python -m bench.bench_kernels [keyword ...]
+import sys
+
+from bench.corpus import load_bench_texts, timed
+from algo.ahocor import AhoCorasick, CompiledAhoCorasick
+from algo.bm import boyer_moore_count_bytes, boyer_moore_search, boyer_moore_search_bytes
+from algo.kmp import kmp_count_bytes, kmp_search, kmp_search_bytes
+
+DEFAULT_KEYWORDS = ("accounting", "python", "sql")
+
+def main():
+    keywords = sys.argv[1:] or list(DEFAULT_KEYWORDS)
+    corpus = "\n".join(text.lower() for text in load_bench_texts())
+    encoded = corpus.encode("utf-8")
+    view = memoryview(encoded)
+    megabytes = len(encoded) / 1e6
+    print(f"corpus {megabytes:.2f} MB, keywords: {', '.join(keywords)}")
+
+    for keyword in keywords:
+        pattern = keyword.encode("utf-8")
+        variants = (
+            ("KMP str (list)", lambda: len(kmp_search(corpus, keyword))),
+            ("KMP bytes (list)", lambda: len(kmp_search_bytes(encoded, pattern))),
+            ("KMP memoryview (count)", lambda: kmp_count_bytes(view, pattern)),
+            ("BM str (list)", lambda: len(boyer_moore_search(corpus, keyword))),
+            ("BM bytes (list)", lambda: len(boyer_moore_search_bytes(encoded, pattern))),
+            ("BM memoryview (count)", lambda: boyer_moore_count_bytes(view, pattern)),
+        )
+        counts = set()
+        print(f"\n{keyword!r}")
+        for label, function in variants:
+            count, seconds = timed(function)
+            counts.add(count)
+            print(f"  {label:<24}{megabytes / seconds:8.1f} MB/s  ({count} hits)")
+        assert len(counts) == 1, "Semua varian harus menemukan jumlah yang sama"
+
+    trie, compiled = AhoCorasick(keywords), CompiledAhoCorasick(keywords)
+    trie_counts, trie_seconds = timed(trie.count, corpus)
+    compiled_counts, compiled_seconds = timed(compiled.count, view)
+    assert trie_counts == compiled_counts
+    print(f"\nAho-Corasick ({len(keywords)} keywords, one pass)")
+    print(f"  {'dict trie str':<24}{megabytes / trie_seconds:8.1f} MB/s")
+    print(f"  {'compiled memoryview':<24}{megabytes / compiled_seconds:8.1f} MB/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# Benchmark: fuzzy_text_search (bit-vector Myers) vs DP Levenshtein per kata
+# Jalankan dari project/: python -m bench.bench_levenshtein
+import math
+
+from bench.corpus import load_bench_texts, timed
+from algo.levenshtein import levenshtein_distance, fuzzy_text_search
+
+KEYWORDS = ["python", "sql", "managment", "accounting", "acounts receivable", "excel", "leadership"]
+
+def fuzzy_text_search_dp(text: str, target: str, similarity_threshold: float = 0.125, max_distance: int = 4):
+    """
+    Implementasi lama: tabel DP penuh untuk setiap kata.
+    """
+    if not target:
+        return 0, []
+    edit_distance_limit = min(math.ceil(similarity_threshold * len(target)), max_distance)
+    target_lowercase = target.lower()
+    found_matches = [word for word in text.split()
+                     if levenshtein_distance(word.lower(), target_lowercase) <= edit_distance_limit]
+    return len(found_matches), found_matches
+
+def run_all(search, texts):
+    return [[search(text, keyword) for keyword in KEYWORDS] for text in texts]
+
+def main():
+    texts = load_bench_texts()
+    words = sum(len(text.split()) for text in texts)
+    print(f"{len(texts)} CVs, {words} words, {len(KEYWORDS)} keywords")
+
+    dp_results, dp_seconds = timed(run_all, fuzzy_text_search_dp, texts, repeat=1)
+    myers_results, myers_seconds = timed(run_all, fuzzy_text_search, texts, repeat=1)
+    assert dp_results == myers_results, "Hasil Myers harus sama dengan DP"
+
+    print(f"DP Levenshtein : {dp_seconds:8.3f} s")
+    print(f"Myers bit-vector: {myers_seconds:8.3f} s  ({dp_seconds / myers_seconds:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Benchmark: tabel pattern dibangun ulang per CV vs pattern terkompilasi dari cache, untuk query skill yang berulang
+# Jalankan dari project/: python -m bench.bench_pattern_cache [jumlah query]
+import sys
+
+from bench.corpus import load_bench_texts, timed
+from algo.ahocor import CompiledAhoCorasick
+from algo.bm import BMPattern, bm_count_bytes
+from algo.kmp import KMPPattern, kmp_count_bytes
+from utils.pattern_cache import PATTERN_CACHE, compile_automaton, compile_pattern
+
+# Pencarian skill yang biasa diulang recruiter sepanjang hari
+QUERIES = (["python", "sql"], ["accounts receivable", "excel"], ["customer service", "sales", "microsoft office"])
+
+def per_cv_tables(texts, queries, algorithm):
+    """
+    Perilaku lama: tabel LPS/geseran (atau automaton) dibuat ulang untuk setiap CV.
+    """
+    total = 0
+    for keywords in queries:
+        for text in texts:
+            if algorithm == "Aho-Corasick":
+                total += sum(CompiledAhoCorasick(keywords).scan_counts(text))
+                continue
+            for kw in keywords:
+                pattern = kw.encode("utf-8")
+                total += kmp_count_bytes(text, pattern) if algorithm == "KMP" else bm_count_bytes(text, pattern, algorithm)
+    return total
+
+def cached_patterns(texts, queries, algorithm):
+    total = 0
+    for keywords in queries:
+        if algorithm == "Aho-Corasick":
+            automaton = compile_automaton(keywords)
+            total += sum(sum(automaton.scan_counts(text)) for text in texts)
+            continue
+        patterns = [compile_pattern(algorithm, kw) for kw in keywords]
+        total += sum(pattern.count(text) for text in texts for pattern in patterns)
+    return total
+
+def compile_uncached(algorithm, keywords):
+    if algorithm == "Aho-Corasick":
+        return CompiledAhoCorasick(keywords)
+    return [KMPPattern(kw) if algorithm == "KMP" else BMPattern(kw, algorithm) for kw in keywords]
+
+def compile_cached(algorithm, keywords):
+    if algorithm == "Aho-Corasick":
+        return compile_automaton(keywords)
+    return [compile_pattern(algorithm, kw) for kw in keywords]
+
+def preprocessing_only(cv_count, queries, algorithm, cached):
+    """
+    Hanya biaya kompilasi pattern (tanpa scan): per CV tanpa cache, atau sekali per query lewat cache.
+    """
+    for keywords in queries:
+        if cached:
+            compile_cached(algorithm, keywords)
+        else:
+            for _ in range(cv_count):
+                compile_uncached(algorithm, keywords)
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    texts = [text.lower().encode("utf-8") for text in load_bench_texts()]
+    queries = list(QUERIES) * repeat
+    print(f"{len(texts)} CVs, {len(queries)} queries ({len(QUERIES)} distinct)")
+    for algorithm in ("KMP", "Boyer-Moore", "Sunday", "Aho-Corasick"):
+        PATTERN_CACHE.clear()
+        expected, per_cv_seconds = timed(per_cv_tables, texts, queries, algorithm, repeat=1)
+        total, cached_seconds = timed(cached_patterns, texts, queries, algorithm, repeat=1)
+        assert total == expected, algorithm
+        _, per_cv_build = timed(preprocessing_only, len(texts), queries, algorithm, False, repeat=1)
+        _, cached_build = timed(preprocessing_only, len(texts), queries, algorithm, True, repeat=1)
+        print(f"{algorithm:<13} per-CV tables {per_cv_seconds * 1000 / len(queries):7.1f} ms/query "
+              f"(compile {per_cv_build * 1000 / len(queries):6.2f})   "
+              f"cached patterns {cached_seconds * 1000 / len(queries):7.1f} ms/query "
+              f"(compile {cached_build * 1000 / len(queries):6.3f})")
+    stats = PATTERN_CACHE.stats()
+    print(f"pattern cache: {stats['size']} entries, hit rate {stats['hit_rate']:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Benchmark result cache: query pertama (scan penuh) vs query yang sama diulang, dan invalidasi saat korpus berubah
+# Jalankan dari project/: python -m bench.bench_result_cache [jumlah ulangan]
+import sys
+
+from bench.corpus import load_bench_texts, timed
+from utils.search_engine import SearchEngine
+
+# (keywords, algoritma, top_n) yang diulang recruiter
+QUERIES = ((["python", "sql"], "KMP", 10), (["accounts receivable", "excel"], "Sunday", 5),
+           (["pythn", "managment"], "Aho-Corasick", 10))
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    corpus = [{"path": str(i), "filename": f"{i}.pdf", "text": text} for i, text in enumerate(load_bench_texts())]
+    engine = SearchEngine(corpus, scan_workers=1)
+    print(f"{len(corpus)} CVs, each query repeated {repeat}x")
+    for keywords, algorithm, top_n in QUERIES:
+        first, first_seconds = timed(engine.search, keywords, algorithm, top_n, repeat=1)
+        cached, cached_seconds = timed(engine.search, keywords, algorithm, top_n, repeat=repeat)
+        assert cached.cached and cached.matches == first.matches
+        print(f"{algorithm:<13} {', '.join(keywords):<32} first {first_seconds * 1000:8.1f} ms   "
+              f"repeated {cached_seconds * 1000:7.3f} ms")
+
+    # CV baru: generation naik, query yang sama di-scan ulang
+    engine.add({"path": "new", "filename": "new.pdf", "text": "Python and SQL developer"})
+    keywords, algorithm, top_n = QUERIES[0]
+    result, seconds = timed(engine.search, keywords, algorithm, top_n, repeat=1)
+    print(f"after add(): cached={result.cached}, {seconds * 1000:.1f} ms (generation {engine.generation})")
+    stats = engine.result_cache.stats()
+    print(f"result cache: {stats['size']} entries, hits {stats['hits']}, misses {stats['misses']}, "
+          f"hit rate {stats['hit_rate']:.0%}")
+
+if __name__ == "__main__":
+    main()
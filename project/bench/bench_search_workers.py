@@ -0,0 +1,57 @@
+# Benchmark: scan exact di thread pemanggil vs di proses worker, dan lama handler UI tertahan
+# Jalankan dari project/: python -m bench.bench_search_workers [workers]
+import os
+import sys
+import tempfile
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import load_bench_texts, timed
+from utils.corpus_store import write_store
+from utils.search_engine import SearchEngine
+from utils.search_runner import SearchRunner
+
+QUERIES = ((["accounting", "python"], "KMP"), (["excel", "management"], "Boyer-Moore"), (["pythn"], "Aho-Corasick"))
+
+def main():
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else max(2, os.cpu_count() or 1)
+    corpus = [{"path": str(i), "filename": f"{i}.pdf", "text": text} for i, text in enumerate(load_bench_texts())]
+    store_directory = tempfile.TemporaryDirectory()
+    store = write_store(corpus, store_directory.name)
+    in_thread = SearchEngine(corpus, scan_workers=1)
+    # Korpus dict: teks batch di-pickle ke worker setiap query; CorpusStore: worker me-mmap store sekali
+    in_processes = SearchEngine(list(corpus), scan_workers=workers)
+    over_store = SearchEngine(list(store), scan_workers=workers)
+    for engine in (in_processes, over_store):
+        engine.search(["warmup"], "KMP")  # start proses worker di luar pengukuran
+    print(f"{len(corpus)} CVs, {workers} scan workers on {os.cpu_count()} CPU(s)")
+
+    def uncached(engine, keywords, algorithm):
+        engine.result_cache.clear()  # ukur scan, bukan result cache
+        return engine.search(keywords, algorithm, 10)
+
+    for keywords, algorithm in QUERIES:
+        _, thread_seconds = timed(uncached, in_thread, keywords, algorithm)
+        _, process_seconds = timed(uncached, in_processes, keywords, algorithm)
+        _, store_seconds = timed(uncached, over_store, keywords, algorithm)
+        print(f"{algorithm:<13} {', '.join(keywords):<22} thread {thread_seconds * 1000:7.1f} ms   "
+              f"processes (texts) {process_seconds * 1000:7.1f} ms   processes (store) {store_seconds * 1000:7.1f} ms")
+
+    # Handler UI hanya men-submit; klik ganda membatalkan query pertama
+    runner = SearchRunner(in_thread)
+    start = time.perf_counter()
+    runner.submit(["accounting"], "KMP", 10, lambda token, result: None)
+    _, future = runner.submit(["accounting"], "KMP", 10, lambda token, result: None)
+    handler_ms = (time.perf_counter() - start) * 1000
+    future.result()
+    total_ms = (time.perf_counter() - start) * 1000
+    print(f"double click: handlers returned after {handler_ms:.2f} ms, final result after {total_ms:.1f} ms "
+          f"(completed {runner.completed}, superseded {runner.superseded})")
+    runner.shutdown()
+    in_processes.close()
+    over_store.close()
+    store.close()
+    store_directory.cleanup()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Benchmark: kaskade regex DOTALL lama vs segmenter satu kali jalan (regex/sections.py)
+# Jalankan dari project/: python -m bench.bench_sections [--write-regression]
+# --write-regression menulis ulang test/data/section_regression.json dari extractor lama.
+import json
+import os
+import re
+import sys
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import load_bench_texts, timed
+from regex.extract_edu import extract_education_section
+from regex.extract_skill import extract_skills_from_resume
+from regex.sections import scan_sections
+
+REGRESSION_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               "test", "data", "section_regression.json")
+REGRESSION_CV_COUNT = 24
+
+# ---------- EXTRACTOR LAMA (acuan, disalin apa adanya tanpa print) ----------
+
+def legacy_education_section(text):
+    pattern1 = r'(?i)^education\s*\n(.*?)(?=^\w+\s*\n|\Z)'
+    pattern2 = r'(?i)education\s*\n((?:(?!^[A-Z][A-Za-z\s]+\n).*\n?)*)'
+    pattern3 = r'(?i)education\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work history)\s*\n|\Z)'
+    pattern4 = r'(?i)education and training\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work history)\s*\n|\Z)'
+    for pattern in (pattern1, pattern2, pattern3, pattern4):
+        match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        if match:
+            return match.group(1).strip()
+    return None
+
+def legacy_skills_from_resume(text):
+    pattern1 = r'(?i)^skills\s*\n(.*?)(?=^\w+\s*\n|\Z)'
+    pattern2 = r'(?i)skills\s*\n((?:(?!^[A-Z][A-Za-z\s]+\n).*\n?)*)'
+    pattern3 = r'(?i)skills\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work\s+history|highlights)\s*\n|\Z)'
+    for pattern in (pattern3, pattern1, pattern2):
+        match = re.search(pattern, text, re.MULTILINE | re.DOTALL)
+        if match:
+            result = match.group(1).strip()
+            if not re.search(r'(?i)(?:work\s+history|employment|experience|education)', result):
+                return result
+    return None
+
+# ---------- KASUS TEPI ----------
+
+EDGE_CASES = [
+    "",
+    "Education\n",
+    "Education",
+    "EDUCATION   \n\n  \nBachelor of Science : Accounting , 2010\nSkills\nExcel\n",
+    "Education\nBachelor\nMore text\n",
+    "Higher Education\nUniversity of Indonesia 2012\nExperience\nClerk\n",
+    "Higher Education\nMaster Of Science\nHarvard\n",
+    "Education and Training\nBS Accounting 2009\n\nProfessional\nSummary\nDetail oriented\n",
+    "Education and Training\nBS 2009\nWork History\nClerk\n",
+    "Education and Training\nBS 2009\nWork  History\nClerk\n",
+    "Skills\nExcel, Word\nExperience\nClerk 2010\n",
+    "Technical Skills\nPython, SQL\nHighlights\nFast learner\n",
+    "Technical Skills\nPython, SQL, employment law\nInterests\nChess\n",
+    "Summary\nSkills\nSkills\nExcel\nEducation\nBS\n",
+    "Skills \t\r\nPython; SQL\n2019\nEducation\nBS\n",
+    "skills\nWork History\nClerk\nskills\n",
+    "Soft skills\nteam work\n\nAdditional   Information\nnone\n",
+    "Education: Bachelor\nSkills: Excel\n",
+    "line one\nEDUCATION\r\nDiploma\nSKILLS\nExcel\nEXPERIENCE\n",
+]
+
+def load_texts() -> list[str]:
+    return load_bench_texts()
+
+def compare(texts: list[str]) -> int:
+    mismatches = 0
+    for text in texts:
+        for new, old in ((extract_education_section, legacy_education_section),
+                         (extract_skills_from_resume, legacy_skills_from_resume)):
+            if new(text) != old(text):
+                mismatches += 1
+                print(f"  MISMATCH {new.__name__}: {text[:60]!r}")
+    return mismatches
+
+def run_legacy(texts):
+    for text in texts:
+        legacy_education_section(text)
+        legacy_skills_from_resume(text)
+
+def run_segmenter(texts):
+    # Seperti utils.section_cache.extract_sections: satu scan lazy untuk kedua extractor
+    for text in texts:
+        scan = scan_sections(text)
+        extract_education_section(text, scan)
+        extract_skills_from_resume(text, scan)
+
+def write_regression(texts: list[str]):
+    """
+    Simpan korpus regresi: sebagian CV asli + kasus tepi, beserta output extractor lama.
+    """
+    samples = texts[::max(1, len(texts) // REGRESSION_CV_COUNT)][:REGRESSION_CV_COUNT] + EDGE_CASES
+    entries = [{"text": text, "education": legacy_education_section(text), "skills": legacy_skills_from_resume(text)}
+               for text in samples]
+    os.makedirs(os.path.dirname(REGRESSION_PATH), exist_ok=True)
+    with open(REGRESSION_PATH, "w", encoding="utf-8") as f:
+        json.dump(entries, f, ensure_ascii=False, indent=1)
+    print(f"Wrote {len(entries)} regression cases to {REGRESSION_PATH}")
+
+def main():
+    texts = load_texts()
+    if "--write-regression" in sys.argv:
+        write_regression(texts)
+
+    # Korpus asli, CV panjang (setiap CV digandakan 50x), dan CV panjang tanpa heading
+    # education/skills (semua pola lama dicoba sampai akhir teks)
+    long_texts = ["\n".join([t] * 50) for t in texts[:20]]
+    headingless = [re.sub(r"(?i)education|skills", "training", t) for t in long_texts]
+
+    checked = texts + EDGE_CASES + long_texts + headingless
+    print(f"{len(checked)} texts, mismatches vs legacy extractors: {compare(checked)}")
+    for label, corpus in (("corpus", texts), ("50x long CVs", long_texts), ("no headings", headingless)):
+        size_mb = sum(map(len, corpus)) / 1e6
+        _, legacy_seconds = timed(run_legacy, corpus)
+        _, new_seconds = timed(run_segmenter, corpus)
+        print(f"{label:<14} {size_mb:6.1f} MB   legacy {legacy_seconds * 1000:8.1f} ms "
+              f"({size_mb / legacy_seconds:5.1f} MB/s)   segmenter {new_seconds * 1000:8.1f} ms "
+              f"({size_mb / new_seconds:5.1f} MB/s)")
+
+if __name__ == "__main__":
+    main()
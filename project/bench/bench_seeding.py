@@ -0,0 +1,89 @@
+# Benchmark: seeding per baris (versi lama) vs batch executemany + ResumePicker O(1)
+# Jalankan dari project/: python -m bench.bench_seeding [jumlah_pelamar]
+# Insert memakai SQLite in-memory sebagai pengganti MySQL; untuk MySQL asli
+# gunakan: python -m utils.seeding --bulk 1000000
+import datetime
+import os
+import random
+import sqlite3
+import sys
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import DATA_DIRECTORY
+from faker import Faker
+from utils.pdf_to_text import list_cv_files
+from utils.seeding import FakeValuePool, assign_applicant_ids, generate_applicant_batches
+
+SCHEMA = """
+CREATE TABLE ApplicantProfile (applicant_id INTEGER PRIMARY KEY, first_name TEXT, last_name TEXT,
+                               date_of_birth TEXT, address TEXT, phone_number TEXT);
+CREATE TABLE ApplicationDetail (detail_id INTEGER PRIMARY KEY, applicant_id INTEGER,
+                                application_role TEXT, cv_path TEXT, cv_filename TEXT);
+"""
+sqlite3.register_adapter(datetime.date, datetime.date.isoformat)
+
+def load_positions() -> dict[str, list[str]]:
+    position_to_resumes = {}
+    for path in list_cv_files(DATA_DIRECTORY):
+        position_to_resumes.setdefault(os.path.basename(os.path.dirname(path)), []).append(path)
+    return position_to_resumes
+
+def seed_per_row(conn, candidate_count, position_to_resumes, data_generator):
+    """
+    Alur _insert_sample_data sebelum batching: satu INSERT + lastrowid per baris,
+    filter CV yang belum dipakai diulang untuk setiap pelamar.
+    """
+    cursor = conn.cursor()
+    utilized_resume_paths = set()
+    for _ in range(candidate_count):
+        cursor.execute("INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) "
+                       "VALUES (?, ?, ?, ?, ?)",
+                       (data_generator.first_name(), data_generator.last_name(),
+                        data_generator.date_of_birth(minimum_age=18, maximum_age=60),
+                        data_generator.address().replace("\n", ", "), data_generator.phone_number()))
+        current_applicant_id = cursor.lastrowid
+        available_positions = list(position_to_resumes)
+        random.shuffle(available_positions)
+        for job_position in available_positions[:random.randint(1, 3)]:
+            unused_resume_files = [f for f in position_to_resumes[job_position] if f not in utilized_resume_paths]
+            if not unused_resume_files:
+                continue
+            selected_resume_path = random.choice(unused_resume_files)
+            utilized_resume_paths.add(selected_resume_path)
+            resume_filename = os.path.basename(selected_resume_path)
+            cursor.execute("INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path, cv_filename) "
+                           "VALUES (?, ?, ?, ?)", (current_applicant_id, job_position, resume_filename, resume_filename))
+    conn.commit()
+
+def seed_batched(conn, candidate_count, position_to_resumes, values):
+    for applicant_rows, detail_rows in generate_applicant_batches(candidate_count, position_to_resumes, values,
+                                                                   synthetic_cvs=True):
+        conn.executemany("INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) "
+                         "VALUES (?, ?, ?, ?, ?)", applicant_rows)
+        # SQLite menjalankan executemany per baris: id pertama = id terakhir - jumlah baris + 1
+        first_applicant_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0] - len(applicant_rows) + 1
+        conn.executemany("INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path, cv_filename) "
+                         "VALUES (?, ?, ?, ?)", assign_applicant_ids(detail_rows, first_applicant_id))
+        conn.commit()
+
+def run(label, seed, candidate_count, *args):
+    conn = sqlite3.connect(":memory:")
+    conn.executescript(SCHEMA)
+    start = time.perf_counter()
+    seed(conn, candidate_count, *args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {elapsed:7.2f} s   {candidate_count / elapsed:9.0f} applicants/s")
+    conn.close()
+
+def main():
+    candidate_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    position_to_resumes = load_positions()
+    random.seed(0)
+    print(f"{candidate_count} applicants, {sum(map(len, position_to_resumes.values()))} real CVs")
+    run("per-row INSERT + Faker per row", seed_per_row, candidate_count, position_to_resumes, Faker())
+    run("batched executemany + value pool", seed_batched, candidate_count, position_to_resumes,
+        FakeValuePool(Faker()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Benchmark startup: waktu import modul aplikasi (python -X importtime) dan waktu sampai window bisa tampil
+# Jalankan dari project/: python -m bench.bench_startup
+import os
+import subprocess
+import sys
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import DATA_DIRECTORY
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Modul yang diimpor main.py saat startup (selain flet)
+STARTUP_MODULES = ("utils.corpus_loader", "utils.text_cache", "utils.search_engine", "utils.db", "utils.section_cache")
+# Modul berat yang dulu ikut terimpor lewat pdf_to_text, db dan seeding
+HEAVY_MODULES = ("fitz", "mysql.connector", "faker")
+
+def import_times(modules) -> tuple[float, list[tuple[int, str]], list[str]]:
+    """
+    Jalankan 'import modules' di proses baru dengan -X importtime.
+    Kembalikan (total ms, [(cumulative us, modul top-level)], modul berat yang ikut terimpor).
+    """
+    code = (f"import {', '.join(modules)}, sys; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_DIRECTORY,
+                               capture_output=True, text=True, check=True)
+    top_level = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):  # tanpa indentasi = diimpor langsung oleh -c
+            top_level.append((int(cumulative), name.strip()))
+    loaded_heavy = [name for name in completed.stdout.strip().split(",") if name]
+    return sum(us for us, _ in top_level) / 1000, sorted(top_level, reverse=True), loaded_heavy
+
+def time_to_window(deferred: bool) -> tuple[float, float]:
+    """
+    (ms sampai ft.app bisa dipanggil, ms sampai korpus lengkap) untuk loading sinkron vs background.
+    Daftar file diambil dari folder data/ (tanpa database).
+    """
+    from utils.corpus_loader import CorpusLoader
+    from utils.pdf_to_text import list_cv_files
+    from utils.search_engine import SearchEngine
+    from utils.text_cache import TextCache
+
+    start = time.perf_counter()
+    loader = CorpusLoader(DATA_DIRECTORY, SearchEngine([]), cache=TextCache(), list_files=list_cv_files)
+    if deferred:
+        loader.start()
+        window_ms = (time.perf_counter() - start) * 1000
+        loader.wait()
+    else:
+        loader.run()
+        window_ms = (time.perf_counter() - start) * 1000
+    return window_ms, (time.perf_counter() - start) * 1000
+
+def main():
+    lazy_ms, top_level, loaded_heavy = import_times(STARTUP_MODULES)
+    eager_ms, _, _ = import_times(STARTUP_MODULES + HEAVY_MODULES)
+    print(f"startup imports: {lazy_ms:7.1f} ms  (heavy modules loaded: {', '.join(loaded_heavy) or 'none'})")
+    print(f"with eager fitz/mysql/faker: {eager_ms:7.1f} ms")
+    for cumulative_us, name in top_level[:5]:
+        print(f"  {name:<24} {cumulative_us / 1000:7.1f} ms")
+
+    for label, deferred in (("synchronous load", False), ("background load", True)):
+        window_ms, corpus_ms = time_to_window(deferred)
+        print(f"{label:<17} window after {window_ms:8.1f} ms   corpus ready after {corpus_ms:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
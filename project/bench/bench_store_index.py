@@ -0,0 +1,63 @@
+# Benchmark startup dari CorpusStore: RSS dan waktu sampai search pertama, index dibangun ulang vs index.bin di-mmap
+# Jalankan dari project/: python -m bench.bench_store_index [jumlah CV]
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import bench.corpus  # noqa: F401  (menambahkan project/ ke sys.path)
+from bench.corpus import load_bench_texts
+from utils.corpus_store import write_store
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CV_COUNT = 5000
+
+# Dijalankan di proses baru (import sudah selesai sebelum jam dimulai): buka store, bangun engine,
+# jalankan satu query exact (Inverted Index) + fuzzy; cetak ms sampai hasil pertama dan RSS anonim/file (kB)
+STARTUP_PROBE = """
+import sys, time
+from utils.corpus_store import CorpusStore
+from utils.search_engine import SearchEngine
+mode, path = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+store = CorpusStore.open(path)
+if mode == "rebuild":
+    # Perilaku lama: index exact/fuzzy dibangun dari teks setiap startup
+    corpus = [{"path": cv.path, "filename": cv.filename, "text": cv.text} for cv in store]
+else:
+    corpus = list(store)
+engine = SearchEngine(corpus, scan_workers=1)
+result = engine.search(["accounting", "pyton"], "Inverted Index", 3)
+elapsed_ms = (time.perf_counter() - start) * 1000
+status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+print(f"{elapsed_ms:.1f}", int(status["RssAnon"].split()[0]), int(status["RssFile"].split()[0]), len(result.matches))
+"""
+
+def replicate(texts: list[str], count: int) -> list[dict]:
+    return [{"path": f"cv-{i}.pdf", "filename": f"cv-{i}.pdf", "text": texts[i % len(texts)]} for i in range(count)]
+
+def first_search(mode: str, path: str) -> tuple[float, int, int, int]:
+    output = subprocess.run([sys.executable, "-c", STARTUP_PROBE, mode, path], cwd=PROJECT_DIRECTORY,
+                            capture_output=True, text=True, check=True).stdout
+    elapsed_ms, anon, file, matches = output.split()
+    return float(elapsed_ms), int(anon), int(file), int(matches)
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CV_COUNT
+    corpus = replicate(load_bench_texts(), count)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        write_store(corpus, tmp).close()
+        index_mb = os.path.getsize(os.path.join(tmp, "index.bin")) / 1e6
+        print(f"{count} CVs, store + index written in {(time.perf_counter() - start) * 1000:.0f} ms "
+              f"(index.bin {index_mb:.1f} MB)")
+        results = {}
+        for mode in ("rebuild", "store"):
+            elapsed_ms, anon, file, matches = results[mode] = first_search(mode, tmp)
+            print(f"{mode:<8} first search after {elapsed_ms:9.1f} ms   RssAnon {anon / 1024:7.1f} MB   "
+                  f"RssFile {file / 1024:7.1f} MB")
+        assert results["rebuild"][3] == results["store"][3]
+
+if __name__ == "__main__":
+    main()
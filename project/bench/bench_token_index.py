@@ -0,0 +1,47 @@
+# Benchmark: lookup kosakata InvertedIndex (substring/prefix/suffix) dengan TokenIndex vs menelusuri semua token
+# Jalankan dari project/: python -m bench.bench_token_index [jumlah token]
+import random
+import sys
+
+from bench.corpus import load_bench_texts, timed
+from algo.inverted_index import TOKEN_PATTERN, TokenIndex
+
+DEFAULT_VOCABULARY_SIZE = 200_000
+# (bagian keyword, posisi): "sql" di tengah token, "account" awal token, "ing" akhir token
+RUNS = (("sql", "containing"), ("sq", "containing"), ("account", "starting_with"), ("ing", "ending_with"))
+
+def build_vocabulary(size: int) -> list[str]:
+    """
+    Token unik dari korpus, ditambah token acak sampai 'size' (kosakata korpus besar: nama, angka, typo).
+    """
+    vocabulary = set()
+    for text in load_bench_texts():
+        vocabulary.update(TOKEN_PATTERN.findall(text.lower()))
+    rng = random.Random(0)
+    while len(vocabulary) < size:
+        vocabulary.add("".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(rng.randint(2, 12))))
+    return list(vocabulary)
+
+def linear_lookup(vocabulary: list[str], run: str, kind: str) -> list[str]:
+    if kind == "starting_with":
+        return [token for token in vocabulary if token.startswith(run)]
+    if kind == "ending_with":
+        return [token for token in vocabulary if token.endswith(run)]
+    return [token for token in vocabulary if run in token]
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_VOCABULARY_SIZE
+    vocabulary = build_vocabulary(size)
+    tokens = TokenIndex()
+    _, build_seconds = timed(lambda: [tokens.add(token) for token in vocabulary], repeat=1)
+    tokens.starting_with("")  # list terurut dibangun sekali sebelum diukur
+    print(f"{len(vocabulary)} tokens, TokenIndex built in {build_seconds * 1000:.0f} ms")
+    for run, kind in RUNS:
+        expected, linear_seconds = timed(linear_lookup, vocabulary, run, kind)
+        found, index_seconds = timed(getattr(tokens, kind), run)
+        assert sorted(found) == sorted(expected), (run, kind)
+        print(f"{kind:<14} {run!r:<10} {len(found):6d} tokens   scan {linear_seconds * 1000:8.2f} ms   "
+              f"TokenIndex {index_seconds * 1000:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# file: bench/corpus.py
+# Helper korpus untuk script benchmark (jalankan dari project/: python -m bench.<nama>)
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data")
+
+def load_bench_texts(limit: int | None = None) -> list[str]:
+    """
+    Teks CV dari folder data/ (lewat TextCache, tanpa database).
+    Jika PyMuPDF tidak tersedia, pakai korpus sintetis.
+    """
+    try:
+        from utils.pdf_to_text import extract_text_from_pdf, list_cv_files
+        from utils.text_cache import TextCache
+    except ImportError:
+        return synthetic_texts(limit or 480)
+
+    cache = TextCache()
+    paths = list_cv_files(DATA_DIRECTORY)[:limit]
+    texts = [cache.get_text(path, extract_text_from_pdf) for path in paths]
+    cache.save()
+    return texts
+
+def synthetic_texts(count: int, words_per_text: int = 800, seed: int = 0) -> list[str]:
+    """
+    Teks acak mirip CV (kata-kata umum resume) untuk benchmark tanpa PDF.
+    """
+    vocabulary = ("accounting management python sql excel customer service sales "
+                  "analysis reporting payroll budget team project microsoft office "
+                  "communication leadership accounts receivable payable ledger "
+                  "training development marketing operations quality").split()
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(vocabulary) for _ in range(words_per_text)) for _ in range(count)]
+
+def timed(function, *args, repeat: int = 3):
+    """
+    Jalankan function beberapa kali, kembalikan (hasil terakhir, waktu terbaik dalam detik).
+    """
+    import time
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
@@ -1,30 +1,35 @@
-import flet as ft
 import time
+APP_START = time.perf_counter()  # untuk mengukur waktu sampai window pertama tampil
 import sys
 import os
 import webbrowser
+import threading
 
 # Add the parent directory (project/) to Python path
 # sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from algo.kmp import kmp_search
-from algo.bm import boyer_moore_search
-from algo.ahocor import AhoCorasick
-from algo.levenshtein import levenshtein_distance, fuzzy_text_search
-from utils.pdf_to_text import load_all_cv_texts
-from utils.db import get_applicant_by_cv_filename
-from regex.extract_exp import extract_experience_section
-from regex.extract_exp import extract_text_from_pdf
-from regex.extract_edu import extract_education_section
-from regex.extract_skill import extract_skills_from_resume
-import re
-from utils.seeding import setup_database_tables, populate_sample_data
-# Use heapq for more efficient top-N selection
-import heapq
+from utils.corpus_loader import CorpusLoader
+from utils.corpus_store import DEFAULT_STORE_DIRECTORY
+from utils.text_cache import TextCache
+from utils.search_engine import SearchEngine, ALGORITHMS, parse_keywords
+from utils.search_runner import SearchRunner
+from utils.db import get_applicant_by_cv_filename, prefetch_applicants
+from utils.section_cache import SectionCache
 
 # Dummy data sesuai SQL schema (ApplicantProfile dan ApplicationDetail)
-print("📄 Loading CVs from data/data ...")
-DUMMY_DATA = load_all_cv_texts("../data")  # atau "../data/data" tergantung run location
-print(f"✅ Loaded {len(DUMMY_DATA)} CVs.")
+# Diisi CorpusLoader di background setelah window tampil (dict, atau CVRecord dari corpus store)
+DUMMY_DATA: list[dict] = []
+# Mesin pencarian atas DUMMY_DATA (index exact + fuzzy, cache hasil fuzzy).
+# Dibuat di blok __main__: proses worker scan (spawn) mengimpor ulang modul ini
+# dan tidak boleh ikut membuat engine, runner atau mengimpor flet.
+ENGINE: SearchEngine | None = None
+# Pencarian dijalankan di thread worker; query baru menggantikan query lama
+RUNNER: SearchRunner | None = None
+# Jarak minimum antar render snapshot hasil pencarian sementara
+SNAPSHOT_RENDER_INTERVAL_SECONDS = 0.15
+# Loader korpus (dibuat di blok __main__ agar proses worker ekstraksi PDF tidak ikut memuat korpus)
+LOADER: CorpusLoader | None = None
+# Section experience/education/skills per CV (di-parse sekali, disimpan di .cache/)
+SECTION_CACHE: SectionCache | None = None
 
 # UI Flet untuk CV Analyzer App
 
@@ -35,7 +40,19 @@ def on_view_cv(path: str):
     else:
         print(f"❌ File not found: {abs_path}")
 
-def main(page: ft.Page):
+def prefetch_profiles_async(filenames: list[str]):
+    """
+    Prefetch profil (satu query IN) di background agar UI tidak menunggu database.
+    """
+    def worker():
+        try:
+            prefetch_applicants(filenames)
+        except Exception as e:
+            print(f"❌ Prefetch profil gagal: {e}")
+    threading.Thread(target=worker, daemon=True).start()
+
+def main(page: "ft.Page"):
+    import flet as ft  # hanya proses UI; proses worker mengimpor modul ini tanpa flet
     page.title = "CV Analyzer App"
     page.padding = 20
     
@@ -46,16 +63,12 @@ def main(page: ft.Page):
         border_radius=ft.border_radius.all(20)
     )
 
-    # Pilihan Algoritma Exact Match (KMP/BM)
+    # Pilihan Algoritma Exact Match (KMP/BM dan variannya)
     algo_dropdown = ft.Dropdown(
         label="Search Algorithm",
         width=200,
         border_radius=ft.border_radius.all(20),
-        options=[
-            ft.dropdown.Option("KMP"),
-            ft.dropdown.Option("Boyer-Moore"),
-            ft.dropdown.Option("Aho-Corasick")
-        ],
+        options=[ft.dropdown.Option(algorithm) for algorithm in ALGORITHMS],
         value="KMP"  # nilai default agar selalu ada pilihan
     )
 
@@ -94,134 +107,64 @@ def main(page: ft.Page):
     scan_info = ft.Text("0 CVs scanned in 0ms", italic=True)
     results_container = ft.Column(spacing=15)
 
-    def on_search(e):
-        # Mulai hitung waktu exact match
-        t0_exact = time.time()
-        keywords = [kw.strip().lower() for kw in (keywords_field.value or '').split(',') if kw.strip()]
-        exact_matches = []
-        
-        # Pre-lowercase all CV texts once
-        if not hasattr(DUMMY_DATA[0], '_lower_text'):
-            for data in DUMMY_DATA:
-                data['_lower_text'] = data['text'].lower()
-
-        # PHASE 1: Exact match search
-        search_func = kmp_search if algo_dropdown.value == "KMP" else boyer_moore_search
-        
-        for data in DUMMY_DATA:
-            total_matches = 0
-            details = []
-            for kw in keywords:
-                if algo_dropdown.value == "Aho-Corasick":
-                    positions = AhoCorasick.search(data['text'].lower(), [kw.lower()])
-                else:
-                    positions = search_func(data['_lower_text'], kw.lower())
-                count = len(positions)
-                if count:
-                    total_matches += count
-                    details.append((kw, count))
-
-            if total_matches:
-                is_all_matched = len(details)==len(keywords)
-                exact_matches.append((data, total_matches, details,is_all_matched))
-
-        # Sort exact matches by score
-        # Ensure all exact keywords are in the CV as highest priority
-        exact_matches = heapq.nlargest(len(exact_matches), exact_matches, key=lambda x: 1000*x[3]+x[1])
-        
-        top_n = int(top_matches.value or "3")
-        exact_ms = int((time.time() - t0_exact) * 1000)
-        
-        # DECISION POINT: Do we need fuzzy search?
-        if len(exact_matches) >= top_n:
-            # We have enough exact matches, no need for fuzzy search
-            fuzzy_used = False
-            fuzzy_ms = None
-            
-            # Just add match_type to exact matches
-            final_matches = []
-            for data, score, details, _ in exact_matches[:top_n]:
-                final_matches.append((data, score, details, "exact"))
-            
-            clear_fuzzy_results()
-            
+    # Progress pemuatan korpus di background
+    loading_bar = ft.ProgressBar(width=500, value=None)
+    loading_text = ft.Text("Loading CVs ...", italic=True, size=12)
+    loading_row = ft.Row([loading_bar, loading_text], spacing=10)
+
+    def on_loading_progress(loaded, total):
+        if LOADER.error is not None:
+            loading_bar.visible = False
+            loading_text.value = f"Loading CVs failed after {loaded} CVs: {LOADER.error}"
+        elif LOADER.done:
+            loading_row.visible = False
         else:
-            # We need fuzzy search to fill remaining slots
-            fuzzy_used = True
-            fuzzy_start = time.time()
-            clear_fuzzy_results()
-            
-            # Create lookup for exact matches for efficiency
-            exact_matches_lookup = {id(match_data): (match_score, match_details) 
-                                for match_data, match_score, match_details,_ in exact_matches}
-            
-            combined_matches = []
-            
-            # PHASE 2: Combined exact + fuzzy search
-            for data in DUMMY_DATA:
-                # Get exact match details if any
-                if id(data) in exact_matches_lookup:
-                    exact_score, exact_details = exact_matches_lookup[id(data)]
-                    exact_details = list(exact_details)
-                    exact_keywords_in_cv = {exact_kw for exact_kw, _ in exact_details}
-                else:
-                    exact_score = 0
-                    exact_details = []
-                    exact_keywords_in_cv = set()
-
-                # Run fuzzy search only for keywords without exact matches
-                fuzzy_score = 0
-                fuzzy_details = []
-                
-                for kw in keywords:
-                    if kw not in exact_keywords_in_cv:  # Only fuzzy search if no exact match
-                        count, matched_words = fuzzy_text_search(data['text'], kw)
-                        if count > 0:
-                            fuzzy_score += count
-                            fuzzy_details.append((kw, count))
-                            # Store fuzzy match results for popup
-                            if kw not in fuzzy_match_results:
-                                fuzzy_match_results[kw] = set()
-                            fuzzy_match_results[kw].update(matched_words)
-
-                # Skip if no matches found
-                if exact_score == 0 and fuzzy_score == 0:
-                    continue
-
-                # Determine match type
-                if exact_score > 0 and fuzzy_score == 0:
-                    match_type = "exact"
-                elif exact_score == 0 and fuzzy_score > 0:
-                    match_type = "fuzzy"
-                else:
-                    match_type = "mixed"
-                
-                # Combine results
-                total_display_score = exact_score + fuzzy_score
-                all_details = exact_details + fuzzy_details
-                # Priority: exact_score * 1000 + fuzzy_score (exact matches first)
-                priority_score =  exact_score * 10e6 + fuzzy_score + 1000 * len(all_details)  # Higher priority for more details
-                
-                combined_matches.append((data, total_display_score, all_details, priority_score, match_type))
+            loading_bar.value = loaded / total if total else None
+            loading_text.value = f"Loading CVs: {loaded}/{total if total is not None else '?'}"
+        page.update()
 
-            # Convert fuzzy match results sets to lists for popup display
-            for kw in fuzzy_match_results:
-                if isinstance(fuzzy_match_results[kw], set):
-                    fuzzy_match_results[kw] = list(fuzzy_match_results[kw])
+    # Mengubah keyword membatalkan pencarian yang sedang berjalan
+    keywords_field.on_change = lambda e: RUNNER.cancel()
 
-            # Sort by priority score and take top N
-            combined_matches = heapq.nlargest(len(combined_matches), combined_matches, key=lambda x: x[3])
-            final_matches = [(data, score, details, match_type) 
-                            for data, score, details, _, match_type in combined_matches[:top_n]]
-            
-            fuzzy_ms = int((time.time() - fuzzy_start) * 1000)
+    def on_search(e):
+        keywords = parse_keywords(keywords_field.value)
+        top_n = int(top_matches.value or "3")
+        # Snapshot Top-N sementara ditampilkan selama scan; render dibatasi agar UI tidak kebanjiran update
+        last_render = 0.0
+
+        def on_result(token, result):
+            nonlocal last_render
+            if not result.done and time.perf_counter() - last_render < SNAPSHOT_RENDER_INTERVAL_SECONDS:
+                return
+            if RUNNER.is_current(token):  # hasil query yang sudah digantikan dibuang
+                show_search_result(result, top_n)
+                last_render = time.perf_counter()
+
+        # Scan berjalan di thread worker; handler klik langsung kembali
+        RUNNER.submit(keywords, algo_dropdown.value, top_n, on_result)
+
+    def show_search_result(result, top_n):
+        clear_fuzzy_results()
+        fuzzy_match_results.update(result.fuzzy_words)
+        fuzzy_used = result.fuzzy_used
+        final_matches = [(match.data, match.score, match.details, match.match_type) for match in result.matches]
 
         # Update scan info
         total_found = len(final_matches)
-        scan_info.value = f"Exact Match: {len(DUMMY_DATA)} CVs scanned in {exact_ms}ms\n"
-        if fuzzy_used:
-            scan_info.value += f"Fuzzy Match: {fuzzy_ms}ms\n"
-        scan_info.value += f"Showing top {min(top_n, total_found)} of {total_found} matches"
+        if not result.done:
+            phase = "Fuzzy Match" if fuzzy_used else "Exact Match"
+            scan_info.value = (f"{phase}: {result.scanned}/{result.corpus_size} CVs scanned ... "
+                               f"(provisional top {total_found})")
+        else:
+            scan_info.value = f"Exact Match: {result.scanned} CVs scanned in {int(result.exact_ms)}ms\n"
+            if fuzzy_used:
+                scan_info.value += f"Fuzzy Match: {int(result.fuzzy_ms)}ms\n"
+            scan_info.value += f"Showing top {min(top_n, total_found)} of {total_found} matches"
+            if result.cached:
+                scan_info.value += f" (cached result, {result.total_ms:.2f}ms)"
+        if LOADER is not None and not LOADER.done:
+            loaded, total = LOADER.progress()
+            scan_info.value += f" (partial: {loaded}/{total if total is not None else '?'} CVs loaded so far)"
 
         # Set matches for pagination
         matches = final_matches
@@ -231,12 +174,19 @@ def main(page: ft.Page):
         current_page = 1
         total_pages = (len(matches) + items_per_page - 1) // items_per_page if matches else 1
 
+        # Profil seluruh Top-N diambil sekali (hasil akhir saja); Summary tiap kartu membaca dari cache
+        if result.done:
+            prefetch_profiles_async([data['filename'] for data, *_ in matches])
+
         def update_results_display():
             # Update UI
             results_container.controls.clear()
             start_idx = (current_page - 1) * items_per_page
             end_idx = start_idx + items_per_page
             current_matches = matches[start_idx:end_idx]
+            # Halaman ini: hanya profil yang kedaluwarsa/belum ada yang di-query ulang
+            if current_page > 1 and result.done:
+                prefetch_profiles_async([data['filename'] for data, *_ in current_matches])
 
             
 
@@ -332,13 +282,13 @@ def main(page: ft.Page):
             current_page += direction
             current_page = max(1, min(current_page, total_pages))
             update_results_display()
-        # Show/hide fuzzy matches button
-        fuzzy_matches_button.visible = fuzzy_used
+        # Show/hide fuzzy matches button (kata mirip baru tersedia di hasil akhir)
+        fuzzy_matches_button.visible = fuzzy_used and result.done
         page.update()
         # Initial display
         update_results_display()
-    # Add filename index at startup
-    filename_index = {cv["filename"]: cv for cv in DUMMY_DATA}
+    # Index filename -> CV diisi loader selama korpus dimuat
+    filename_index = LOADER.by_filename if LOADER is not None else {cv["filename"]: cv for cv in DUMMY_DATA}
 
     def show_summary_popup(page, filename):
         data = get_applicant_by_cv_filename(filename)
@@ -348,11 +298,6 @@ def main(page: ft.Page):
         else:
             # Use index for O(1) lookup instead of O(n) search
             cv_data = filename_index.get(filename)
-            full_cv_path = cv_data["path"] if cv_data else None
-            if full_cv_path:
-                print("if path exists:", os.path.exists(full_cv_path))
-            print(f"Full CV Path: {full_cv_path}")
-
 
             # Create content list starting with basic info
             content_items = [
@@ -364,17 +309,12 @@ def main(page: ft.Page):
                 ft.Divider(),
                 ft.Text("Work Experience:", weight=ft.FontWeight.BOLD),
             ]
-            # Jika file ditemukan, ekstrak pengalaman
-            # Jika file ditemukan, ekstrak pengalaman dan education
-            if full_cv_path and os.path.exists(full_cv_path):
-                text = extract_text_from_pdf(full_cv_path)
-                experiences = extract_experience_section(text)
-                education = extract_education_section(text)
-                skills = extract_skills_from_resume(text)
-                # print("text:", text)
-                # print("experiences:", experiences)
-                # print("education:", education)
-                # print("skills:", skills)
+            # Section diambil dari teks di DUMMY_DATA lewat cache (tanpa buka PDF lagi)
+            if cv_data:
+                sections = SECTION_CACHE.get(cv_data["text"])
+                experiences = sections["experience"]
+                education = sections["education"]
+                skills = sections["skills"]
                 # Add experience entries
                 if experiences:
                     for i, exp in enumerate(experiences, 1):    
@@ -446,7 +386,7 @@ def main(page: ft.Page):
         card_fuzzy_matches = {}
         if card_data:
             for kw in fuzzy_match_results.keys():
-                count, matched_words = fuzzy_text_search(card_data['text'], kw)
+                count, matched_words = ENGINE.fuzzy_result(ENGINE.cv_id_of(card_data), kw)
                 if count > 0:
                     card_fuzzy_matches[kw] = list(matched_words)
         else:
@@ -500,6 +440,7 @@ def main(page: ft.Page):
             ft.Column([search_button]),
             ft.Column([fuzzy_matches_button])
         ], alignment=ft.MainAxisAlignment.START, spacing=10),
+        loading_row,
         ft.Divider(),
         ft.Column([
             results_header,
@@ -516,12 +457,45 @@ def main(page: ft.Page):
     )
 
     page.add(scrollable_container)
+    print(f"🖼️ First paint after {(time.perf_counter() - APP_START) * 1000:.0f} ms")
+
+    if LOADER is not None:
+        LOADER.on_progress = on_loading_progress
+        on_loading_progress(*LOADER.progress())
+    else:
+        loading_row.visible = False
+        page.update()
+
+def on_corpus_loaded(loader: CorpusLoader):
+    if loader.store is not None:
+        print(f"✅ Loaded {loader.loaded} CVs in {loader.elapsed_ms():.0f} ms "
+              f"(corpus store, {loader.store.nbytes / 1e6:.1f} MB mapped).")
+    else:
+        print(f"✅ Loaded {loader.loaded} CVs in {loader.elapsed_ms():.0f} ms "
+              f"(cache hits: {TEXT_CACHE.hits}, misses: {TEXT_CACHE.misses}).")
+    SECTION_CACHE.prune(cv["text"] for cv in DUMMY_DATA)
+    # Parse section semua CV di background; Summary yang diklik lebih dulu diisi lazy
+    SECTION_CACHE.start_precompute(cv["text"] for cv in DUMMY_DATA)
 
 if __name__ == "__main__":
     # # 1) Setup DB dan isi data sampel MySQL
+    # from utils.seeding import setup_database_tables, populate_sample_data
     # setup_database_tables()
     # populate_sample_data()
 
-    # 2) Jalankan aplikasi Flet
-    ft.app(target=main)
+    import flet as ft
+    ENGINE = SearchEngine(DUMMY_DATA)
+    RUNNER = SearchRunner(ENGINE)
 
+    # 2) Muat teks CV di background (paralel, dengan cache di disk); window tampil tanpa menunggu
+    print("📄 Loading CVs from data/data in the background ...")
+    TEXT_CACHE = TextCache()
+    SECTION_CACHE = SectionCache()
+    LOADER = CorpusLoader("../data", ENGINE, cache=TEXT_CACHE, on_done=on_corpus_loaded,
+                          store_directory=DEFAULT_STORE_DIRECTORY)  # atau "../data/data" tergantung run location
+    LOADER.start()
+
+    # 3) Jalankan aplikasi Flet
+    ft.app(target=main)
+    RUNNER.shutdown()
+    ENGINE.close()
@@ -1,60 +1,31 @@
 import re
 from typing import List
-import fitz  # PyMuPDF
+from regex.sections import scan_sections
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    text = ""
-    with fitz.open(pdf_path) as doc:
-        for page in doc:
-            try:
-                text += page.get_text()
-            except AttributeError:
-                text += page.getText()
-    return text
-
-def extract_education_section(text):
+def extract_education_section(text, scan=None):
     """
     Fungsi untuk mengekstrak bagian Education dari teks resume
-    
+
     Args:
         text (str): Teks lengkap dari resume
-    
+        scan (SectionScan, optional): scan_sections(text) yang dipakai bersama extractor lain
+
     Returns:
         str: Bagian education yang ditemukan, atau None jika tidak ada
     """
-    
-    # Pattern 1: Menangkap dari "Education" hingga section berikutnya atau akhir dokumen
-    # Menggunakan case-insensitive matching
-    pattern1 = r'(?i)^education\s*\n(.*?)(?=^\w+\s*\n|\Z)'
-    
-    # Pattern 2: Alternative pattern yang lebih fleksibel
-    # Menangkap dari Education hingga baris yang dimulai dengan huruf kapital (section baru)
-    pattern2 = r'(?i)education\s*\n((?:(?!^[A-Z][A-Za-z\s]+\n).*\n?)*)'
-    
-    # Pattern 3: Pattern yang menangkap Education dan semua baris setelahnya
-    # hingga menemukan section baru atau kata kunci tertentu
-    pattern3 = r'(?i)education\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work history)\s*\n|\Z)'
-    
-    pattern4 = r'(?i)education and training\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work history)\s*\n|\Z)'
-    
-    # Coba pattern pertama
-    match = re.search(pattern1, text, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    
-    # Coba pattern kedua jika yang pertama tidak berhasil
-    match = re.search(pattern2, text, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    
-    # Coba pattern ketiga sebagai fallback
-    match = re.search(pattern3, text, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
-    
-    match = re.search(pattern4, text, re.MULTILINE | re.DOTALL)
-    if match:
-        return match.group(1).strip()
+    # Scan baris per baris (lazy, berhenti setelah isi section diketahui) (regex/sections.py), urutan fallback sama dengan pola lama:
+    # 1. baris "Education" hingga baris satu kata berikutnya
+    # 2. "...education" di akhir baris hingga akhir teks (kosong jika diikuti baris judul)
+    # 3. "...education and training" hingga heading section berikutnya
+    scan = scan or scan_sections(text)
+    edu_line = scan.first("edu_line")
+    if edu_line is not None:
+        return scan.until_word_line(edu_line)
+    # tanpa baris "Education" seluruh teks sudah di-scan, penanda lain sudah final
+    if scan.edu_tail is not None:
+        return scan.until_title_or_end(scan.edu_tail)
+    if scan.training_tail is not None:
+        return scan.until_stop(scan.training_tail, scan.edu_stops)
     return None
 
 def extract_education_simple(text: str) -> str:
@@ -111,6 +82,8 @@ def extract_education_simple(text: str) -> str:
 # print("- \\Z = akhir string")
 # print("- re.MULTILINE | re.DOTALL flags diperlukan")
 if __name__ == "__main__":
+    from utils.pdf_to_text import extract_text_from_pdf
+
     pdf_paths = [
         "../data/data/ACCOUNTANT/10554236.pdf",
         "../data/data/ACCOUNTANT/10674770.pdf",
@@ -1,120 +1,128 @@
 import re
-from typing import List
-import fitz  # PyMuPDF
-
-def extract_text_from_pdf(pdf_path: str) -> str:
-    text = ""
-    with fitz.open(pdf_path) as doc:
-        for page in doc:
-            try:
-                text += page.get_text()
-            except AttributeError:
-                text += page.getText()
-    return text
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterator, List
 
-def extract_experience_section(text: str) -> List[str]:
+# Satu alternation untuk semua format tanggal kerja (urutan cabang = prioritas jika mulai di posisi yang sama)
+_MONTHS = "January|February|March|April|May|June|July|August|September|October|November|December"
+_SHORT_MONTHS = "Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+DATE_RANGE_PATTERN = re.compile(
+    # January 2010 to Present 2012 (boleh terpotong line break di sekitar "to")
+    rf"(?:{_MONTHS})\s+\d{{4}}\s*\n?\s*to\s*\n?\s*(?:{_MONTHS}|Present)\s+\d{{4}}"
+    # MM/YYYY to MM/YYYY
+    r"|\b(?:0[1-9]|1[0-2])/\d{4}\s*to\s*(?:0[1-9]|1[0-2])/\d{4}\b"
+    # Aug 2005 to Aug 2007, Aug 2007 to Current
+    rf"|\b(?:{_SHORT_MONTHS})\s+\d{{4}}\s*to\s*(?:{_SHORT_MONTHS}|Current)\s*(?:\d{{4}})?\b"
+    # MM/YYYY - MM/YYYY
+    r"|\b(?:0[1-9]|1[0-2])/\d{4}\s*-\s*(?:0[1-9]|1[0-2])/\d{4}\b",
+    re.IGNORECASE
+)
+# Setiap rentang tanggal memuat tahun pertamanya diikuti "to" atau "-": hanya posisi ini yang dicoba
+_YEAR_ANCHOR = re.compile(r"\d{4}\s*(?:to|-)", re.IGNORECASE)
+_MONTH_LENGTHS = sorted({len(month) for month in f"{_MONTHS}|{_SHORT_MONTHS}".split("|")}, reverse=True)
+MAX_LABEL_WORDS = 10  # teks di sekitar tanggal dengan kata sebanyak ini tidak dianggap title/company
+
+def _is_label(text: str) -> bool:
+    return bool(text) and len(text.split()) < MAX_LABEL_WORDS
+
+def iter_date_ranges(text: str) -> Iterator[re.Match]:
     """
-    Ekstrak entri pengalaman kerja berdasarkan pola tanggal kerja,
-    menangani job title dan company info yang bisa di baris terpisah atau sama.
+    Sama dengan DATE_RANGE_PATTERN.finditer(text), tetapi pola lengkap hanya
+    dicocokkan di sekitar tahun yang diikuti "to"/"-", bukan di setiap posisi teks.
+    """
+    last_end = 0
+    for anchor in _YEAR_ANCHOR.finditer(text):
+        year_start = anchor.start()
+        if year_start < last_end:
+            continue
+        # Bulan berakhir tepat sebelum whitespace di depan tahun ("May 2010"), atau "MM/" untuk format angka
+        month_end = year_start
+        while month_end > 0 and text[month_end - 1].isspace():
+            month_end -= 1
+        candidates = [month_end - length for length in _MONTH_LENGTHS] if month_end < year_start else []
+        candidates.append(year_start - 3)
+        for candidate in sorted(candidates):
+            if candidate < last_end:
+                continue
+            match = DATE_RANGE_PATTERN.match(text, candidate)
+            if match:
+                last_end = match.end()
+                yield match
+                break
+
+def iter_experience_entries(text: str) -> Iterator[str]:
+    """
+    Entri pengalaman kerja satu per satu, urut sesuai posisi tanggal di teks.
+    Baris tiap match dicari dengan bisect pada tabel offset awal baris.
     """
     lines = text.split('\n')
-    results = []
-
-    # Update regex untuk menangani line breaks dan variasi format
-    date_pattern = re.compile(
-        r"(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s*\n?\s*to\s*\n?\s*(January|February|March|April|May|June|July|August|September|October|November|December|Present)\s+\d{4}",
-        re.IGNORECASE | re.MULTILINE
-    )
-    
-    # Tambahkan pattern untuk format MM/YYYY to MM/YYYY
-    numeric_date_pattern = re.compile(
-        r"\b(0[1-9]|1[0-2])/\d{4}\s*to\s*(0[1-9]|1[0-2])/\d{4}\b",
-        re.IGNORECASE
-    )
-
-    # Tambahkan pattern untuk format singkat bulan (Aug 2005 to Aug 2007, Aug 2007 to Current)
-    short_month_pattern = re.compile(
-        r"\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4}\s*to\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Current)\s*(?:\d{4})?\b",
-        re.IGNORECASE
-    )
-
-        # Tambahkan pattern untuk format MM/YYYY - MM/YYYY
-    numneric_range_pattern = re.compile(
-        r"\b(0[1-9]|1[0-2])/\d{4}\s*-\s*(0[1-9]|1[0-2])/\d{4}\b",
-        re.IGNORECASE
-    )
-    
-    # Gabungkan teks untuk menangani pattern yang tersebar di multiple lines
-    full_text = '\n'.join(lines)
-    
-    # Cari semua matches dari semua pattern
-    matches = (list(date_pattern.finditer(full_text)) + 
-               list(numeric_date_pattern.finditer(full_text)) + 
-               list(short_month_pattern.finditer(full_text)) +
-               list(numneric_range_pattern.finditer(full_text)))
-    
-    # Sort matches berdasarkan posisi dalam teks
-    matches.sort(key=lambda x: x.start())
-    
-    for match in matches:
+    line_starts = [0, *accumulate(len(line) + 1 for line in lines[:-1])]
+
+    for match in iter_date_ranges(text):
         match_start = match.start()
         match_end = match.end()
-        lines_before_match = full_text[:match_start].count('\n')
-        lines_after_match = full_text[:match_end].count('\n')
-        
+        lines_before_match = bisect_right(line_starts, match_start) - 1
+        lines_after_match = bisect_right(line_starts, match_end) - 1
+
         # Ambil tanggal yang sudah ditemukan
         date_info = match.group().replace('\n', ' ').strip()
-        
+
         title_line = ""
         company_line = ""
-        
-        # Cek apakah tanggal berada di tengah baris (ada teks sebelum dan sesudah)
-        current_line_start = full_text.rfind('\n', 0, match_start) + 1
-        current_line_end = full_text.find('\n', match_end)
-        if current_line_end == -1:
-            current_line_end = len(full_text)
-        
-        current_line = full_text[current_line_start:current_line_end].strip()
-        
+
+        # Baris tempat tanggal berada (tanggal bisa terpotong ke baris berikutnya)
+        current_line_start = line_starts[lines_before_match]
+        if lines_after_match + 1 < len(lines):
+            current_line_end = line_starts[lines_after_match + 1] - 1
+        else:
+            current_line_end = len(text)
+
+        current_line = text[current_line_start:current_line_end].strip()
+
         # Ekstrak bagian sebelum dan sesudah tanggal dalam baris yang sama
         text_before_date = current_line[:match_start - current_line_start].strip()
         text_after_date = current_line[match_end - current_line_start:].strip()
-        
+
         # Prioritas 1: Cek apakah ada teks di baris yang sama dengan tanggal
-        if text_before_date and len(text_before_date.split()) < 10:
+        if _is_label(text_before_date):
             title_line = text_before_date
-        elif text_after_date and len(text_after_date.split()) < 10:
+        elif _is_label(text_after_date):
             title_line = text_after_date
-        
+
         # Prioritas 2: Jika tidak ada di baris yang sama, cek baris sebelumnya
-        if not title_line and lines_before_match > 0 and lines_before_match < len(lines):
+        if not title_line and lines_before_match > 0:
             prev_line = lines[lines_before_match - 1].strip()
-            if len(prev_line.split()) < 10 and prev_line:
+            if _is_label(prev_line):
                 title_line = prev_line
-        
+
         # Prioritas 3: Ambil company info dari baris setelahnya jika tidak ada di baris yang sama
-        if not text_after_date and lines_after_match < len(lines):
-            next_line = lines[lines_after_match+1].strip()
-            if len(next_line.split()) < 10 and next_line:
-                company_line = next_line
-        elif text_after_date and not title_line:
+        if not text_after_date:
+            if lines_after_match + 1 < len(lines):
+                next_line = lines[lines_after_match + 1].strip()
+                if _is_label(next_line):
+                    company_line = next_line
+        elif not title_line and _is_label(text_after_date):
             # Jika text_after_date tidak dijadikan title, maka bisa jadi company
-            if len(text_after_date.split()) < 10:
-                company_line = text_after_date
-        
+            company_line = text_after_date
+
         # Jika ada text_before_date dan text_after_date, gunakan keduanya
-        if text_before_date and text_after_date:
-            if len(text_before_date.split()) < 10 and len(text_after_date.split()) < 10:
-                title_line = text_before_date
-                company_line = text_after_date
-        
+        if _is_label(text_before_date) and _is_label(text_after_date):
+            title_line = text_before_date
+            company_line = text_after_date
+
         # Gabungkan semua komponen
-        combined = "\n".join(filter(None, [title_line, date_info, company_line]))
-        results.append(combined)
+        yield "\n".join(filter(None, [title_line, date_info, company_line]))
 
-    return results
+def extract_experience_section(text: str) -> List[str]:
+    """
+    Ekstrak entri pengalaman kerja berdasarkan pola tanggal kerja,
+    menangani job title dan company info yang bisa di baris terpisah atau sama.
+    """
+    return list(iter_experience_entries(text))
 
 if __name__ == "__main__":
+    from utils.pdf_to_text import extract_text_from_pdf
+
     pdf_paths = [
         "../data/data/ACCOUNTANT/10554236.pdf",
         "../data/data/ACCOUNTANT/10674770.pdf",
@@ -127,4 +135,4 @@ if __name__ == "__main__":
         experiences = extract_experience_section(text)
         for exp in experiences:
             print(exp)
-            print("---")
\ No newline at end of file
+            print("---")
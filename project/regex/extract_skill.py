@@ -1,63 +1,32 @@
 import re
 from typing import List
-import fitz  # PyMuPDF
+from regex.sections import scan_sections, FOREIGN_SECTION
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    text = ""
-    with fitz.open(pdf_path) as doc:
-        for page in doc:
-            try:
-                text += page.get_text()
-            except AttributeError:
-                text += page.getText()
-    return text
-
-def extract_skills_from_resume(text):
+def extract_skills_from_resume(text, scan=None):
     """
-    Fungsi untuk mengekstrak bagian Skills dari teks resume
+    Fungsi untuk mengekstrak bagian Skills dari teks resume.
+    'scan' (opsional): scan_sections(text) yang dipakai bersama extractor lain.
     """
-    
-    # Pattern 1: Menangkap dari "skills" hingga section berikutnya atau akhir dokumen
-    # Menggunakan case-insensitive matching
-    pattern1 = r'(?i)^skills\s*\n(.*?)(?=^\w+\s*\n|\Z)'
-    
-    # Pattern 2: Alternative pattern yang lebih fleksibel
-    # Menangkap dari skills hingga baris yang dimulai dengan huruf kapital (section baru)
-    pattern2 = r'(?i)skills\s*\n((?:(?!^[A-Z][A-Za-z\s]+\n).*\n?)*)'
-    
-    
-    # Pattern 3: Pattern yang menangkap skills dan semua baris setelahnya
-    # hingga menemukan section baru atau kata kunci tertentu
-    pattern3 = r'(?i)skills\s*\n(.*?)(?=\n(?:experience|skills|certifications|interests|additional\s+information|professional\s+summary|summary|accomplishments|work\s+history|highlights)\s*\n|\Z)'
-    
-    # Coba semua pattern
-    patterns = [pattern1, pattern2, pattern3]
-    
-    # Coba pattern ketiga sebagai fallback
-    match = re.search(pattern3, text, re.MULTILINE | re.DOTALL)
-    if match:
-        result = match.group(1).strip()
-        print(match.group(1).strip())
-        if not re.search(r'(?i)(?:work\s+history|employment|experience|education)', result):
-            return result
-    
-    # Coba pattern pertama
-    match = re.search(pattern1, text, re.MULTILINE | re.DOTALL)
-    if match:
-        result = match.group(1).strip()
-        print(match.group(1).strip())
-        if not re.search(r'(?i)(?:work\s+history|employment|experience|education)', result):
-            return result
-    
-    # Coba pattern kedua jika yang pertama tidak berhasil
-    match = re.search(pattern2, text, re.MULTILINE | re.DOTALL)
-    if match:
-        result = match.group(1).strip()
-        print(match.group(1).strip())
-        if not re.search(r'(?i)(?:work\s+history|employment|experience|education)', result):
+    # Scan baris per baris (lazy, berhenti setelah isi section diketahui) (regex/sections.py), kandidat dicoba berurutan:
+    # 1. "...skills" di akhir baris hingga heading section berikutnya
+    # 2. baris "Skills" hingga baris satu kata berikutnya
+    # 3. "...skills" di akhir baris hingga akhir teks (kosong jika diikuti baris judul)
+    scan = scan or scan_sections(text)
+    def candidates():
+        # Dibuat satu per satu: kandidat berikutnya (dan scan lanjutan) hanya jika yang sebelumnya ditolak
+        skills_tail = scan.first("skills_tail")
+        if skills_tail is None:
+            return
+        yield scan.until_stop(skills_tail, scan.skills_stops)
+        skills_line = scan.first("skills_line")
+        if skills_line is not None:
+            yield scan.until_word_line(skills_line)
+        yield scan.until_title_or_end(skills_tail)
+
+    for result in candidates():
+        # Tolak jika section lain (experience/education) ikut terambil
+        if not FOREIGN_SECTION.search(result):
             return result
-    
-    
     return None
 
 def extract_skills_simple(text):
@@ -141,6 +110,8 @@ def extract_skills_simple(text):
 # print("3. Flexible Pattern:")
 # print(r"(?i)(?:^|\n)Skills\s*[:\-]?\s*\n?(.*?)(?=\n(?:[A-Z][a-zA-Z\s]*(?:\n|:)|$))")
 if __name__ == "__main__":
+    from utils.pdf_to_text import extract_text_from_pdf
+
     pdf_paths = [
         "../data/data/ACCOUNTANT/10554236.pdf",
         "../data/data/ACCOUNTANT/10674770.pdf",
@@ -0,0 +1,209 @@
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+
+# Heading section yang dikenali segmenter (nama kanonik -> variasi penulisan, lowercase)
+SECTION_HEADINGS = {
+    "summary": ("summary", "professional summary", "executive summary", "career overview",
+                "profile", "professional profile", "objective", "career objective"),
+    "highlights": ("highlights", "skill highlights", "skills highlights", "core qualifications", "qualifications"),
+    "experience": ("experience", "work experience", "professional experience", "work history",
+                   "employment history", "employment", "experience and employment"),
+    "education": ("education", "education and training", "educational background", "academic background"),
+    "skills": ("skills", "technical skills", "key skills", "computer skills", "relevant skills"),
+    "certifications": ("certifications", "certification", "licenses", "licenses and certifications"),
+    "accomplishments": ("accomplishments", "achievements", "awards", "honors"),
+    "interests": ("interests", "hobbies"),
+    "languages": ("languages",),
+    "affiliations": ("affiliations", "professional affiliations"),
+    "projects": ("projects",),
+    "additional_information": ("additional information",),
+    "presentations": ("presentations", "publications"),
+}
+MAX_HEADING_LENGTH = 60  # baris lebih panjang dari ini tidak dianggap heading
+SCAN_BLOCK_SIZE = 4096   # karakter yang di-fold dan di-split sekaligus saat scan lazy
+
+_HEADING_NAMES = {alias: name for name, aliases in SECTION_HEADINGS.items() for alias in aliases}
+
+# Case folding yang panjangnya tetap: sama persis dengan (?i) regex untuk huruf ASCII.
+# Selain A-Z (dan tanda Kelvin yang lower()-nya "k"), regex juga mencocokkan İ/ı dengan i dan ſ dengan s.
+_FOLD_PAIRS = (("\u0130", "i"), ("\u0131", "i"), ("\u017f", "s"))
+
+# Keyword batas section pada pola lama (...)(?=\n(?:keyword)\s*\n|\Z)
+_EDU_STOP_WORDS = {"experience", "skills", "certifications", "interests", "summary", "accomplishments"}
+_SKILLS_STOP_WORDS = _EDU_STOP_WORDS | {"highlights"}
+# (?i) pada teks asli sama dengan match biasa pada fold_case(teks)
+_EDU_STOP_PHRASE = re.compile(r"(?i)(?:additional\s+information|professional\s+summary|work history)\s*\n")
+_SKILLS_STOP_PHRASE = re.compile(r"(?i)(?:additional\s+information|professional\s+summary|work\s+history)\s*\n")
+_PHRASE_STARTS = ("additional", "professional", "work")
+
+_KEYWORD_NEWLINE = re.compile(r"\s*\n")
+# Baris judul (huruf/spasi) tepat setelah heading: pola lama menganggap section kosong
+_TITLE_BLOCK = re.compile(r"(?i)[A-Z][A-Za-z\s]+\n")
+# Hasil skills yang memuat kata-kata ini berarti section lain ikut terambil
+FOREIGN_SECTION = re.compile(r"(?i)(?:work\s+history|employment|experience|education)")
+
+@dataclass
+class Section:
+    name: str     # nama kanonik dari SECTION_HEADINGS
+    heading: int  # offset awal baris heading
+    start: int    # offset awal isi section
+    end: int      # offset akhir isi (eksklusif)
+
+class SectionScan:
+    """
+    Jalan baris per baris atas teks CV, secara lazy: baris hanya diproses sampai
+    penanda yang diminta extractor diketahui, sehingga heading di awal CV panjang
+    tidak memaksa seluruh teks di-scan (seperti regex lama yang berhenti di match pertama).
+    """
+    def __init__(self, text: str):
+        self.text = text
+        self._sections: list[Section] = []
+        self.word_lines: list[int] = []
+        self.edu_stops: list[int] = []
+        self.skills_stops: list[int] = []
+        # offset awal isi setelah keyword (kemunculan pertama)
+        self.edu_line: int | None = None
+        self.skills_line: int | None = None
+        self.edu_tail: int | None = None
+        self.training_tail: int | None = None
+        self.skills_tail: int | None = None
+        self.done = False  # True setelah seluruh teks di-scan
+        self._line_start = 0  # awal baris berikutnya yang belum diproses
+        self._block: list[str] = []  # baris (sudah di-fold) dari blok teks yang sedang di-scan
+        self._block_index = 0
+
+    def _scan_until(self, found) -> None:
+        while not self.done and not found():
+            self._scan_line()
+
+    def _scan_line(self) -> None:
+        text = self.text
+        text_length = len(text)
+        line_start = self._line_start
+        if self._block_index == len(self._block):
+            # fold + split per blok (bukan per baris, bukan seluruh teks); blok berakhir di batas baris
+            block_end = text.find("\n", line_start + SCAN_BLOCK_SIZE)
+            self._block = fold_case(text[line_start:block_end if block_end >= 0 else text_length]).split("\n")
+            self._block_index = 0
+        line = self._block[self._block_index]
+        self._block_index += 1
+        line_end = line_start + len(line)
+        stripped = line.rstrip()
+
+        if stripped and line_end < text_length:
+            # Baris satu kata (\w+ lalu whitespace): batas pola ^\w+\s*\n
+            if stripped.replace("_", "a").isalnum():
+                self.word_lines.append(line_start)
+                if stripped == "education":
+                    if self.edu_line is None:
+                        self.edu_line = _after_keyword(text, line_start + len(stripped))
+                elif stripped == "skills" and self.skills_line is None:
+                    self.skills_line = _after_keyword(text, line_start + len(stripped))
+                if line_start > 0:
+                    if stripped in _EDU_STOP_WORDS:
+                        self.edu_stops.append(line_start)
+                    if stripped in _SKILLS_STOP_WORDS:
+                        self.skills_stops.append(line_start)
+
+            # Frasa batas ("work history", "professional\nsummary", ...) boleh lintas baris
+            if line_start > 0 and line.startswith(_PHRASE_STARTS):
+                if _EDU_STOP_PHRASE.match(text, line_start):
+                    self.edu_stops.append(line_start)
+                if _SKILLS_STOP_PHRASE.match(text, line_start):
+                    self.skills_stops.append(line_start)
+
+            # Keyword di akhir baris, mis. "Technical Skills" atau "Education and Training"
+            if stripped.endswith("education and training"):
+                if self.training_tail is None:
+                    self.training_tail = _after_keyword(text, line_start + len(stripped))
+            elif stripped.endswith("education"):
+                if self.edu_tail is None:
+                    self.edu_tail = _after_keyword(text, line_start + len(stripped))
+            elif stripped.endswith("skills") and self.skills_tail is None:
+                self.skills_tail = _after_keyword(text, line_start + len(stripped))
+
+        if len(stripped) <= MAX_HEADING_LENGTH:
+            name = _HEADING_NAMES.get(" ".join(stripped.split()).rstrip(":").rstrip())
+            if name:
+                if self._sections:
+                    self._sections[-1].end = line_start
+                self._sections.append(Section(name, line_start, min(line_end + 1, text_length), text_length))
+
+        self._line_start = line_end + 1
+        self.done = self._line_start > text_length
+
+    def first(self, marker: str) -> int | None:
+        """
+        Nilai penanda kemunculan pertama ('edu_line', 'skills_tail', ...), scan hanya sampai ditemukan.
+        """
+        self._scan_until(lambda: getattr(self, marker) is not None)
+        return getattr(self, marker)
+
+    @property
+    def sections(self) -> list[Section]:
+        self._scan_until(lambda: self.done)
+        return self._sections
+
+    def section_text(self, name: str) -> str | None:
+        """
+        Isi section pertama dengan nama kanonik 'name'.
+        """
+        for section in self.sections:
+            if section.name == name:
+                return self.text[section.start:section.end].strip()
+        return None
+
+    def _first_at_or_after(self, positions: list[int], offset: int) -> int:
+        # posisi dicatat urut, jadi cukup scan sampai ada posisi >= offset
+        self._scan_until(lambda: positions and positions[-1] >= offset)
+        i = bisect_left(positions, offset)
+        return positions[i] if i < len(positions) else len(self.text)
+
+    def until_word_line(self, start: int) -> str:
+        """
+        Isi dari 'start' sampai awal baris satu kata berikutnya, atau akhir teks.
+        """
+        return self.text[start:self._first_at_or_after(self.word_lines, start)].strip()
+
+    def until_stop(self, start: int, stops: list[int]) -> str:
+        """
+        Isi dari 'start' sampai sebelum newline yang diikuti baris keyword 'stops', atau akhir teks.
+        """
+        end = self._first_at_or_after(stops, start + 1)
+        return self.text[start:end - 1 if end < len(self.text) else end].strip()
+
+    def until_title_or_end(self, start: int) -> str:
+        """
+        Kosong jika isi diawali baris judul (huruf/spasi), selain itu seluruh sisa teks.
+        """
+        if _TITLE_BLOCK.match(self.text, start):
+            return ""
+        return self.text[start:].strip()
+
+def fold_case(text: str) -> str:
+    """
+    Lowercase dengan panjang dan offset yang sama dengan teks asli.
+    """
+    if not text.isascii():
+        for char, replacement in _FOLD_PAIRS:
+            text = text.replace(char, replacement)
+    return text.lower()
+
+def _after_keyword(text: str, keyword_end: int) -> int:
+    # \s*\n greedy: isi section dimulai setelah newline terakhir pada whitespace setelah keyword
+    return _KEYWORD_NEWLINE.match(text, keyword_end).end()
+
+def scan_sections(text: str) -> SectionScan:
+    """
+    SectionScan untuk teks CV: heading section beserta rentangnya, dan penanda
+    yang dipakai extractor education/skills. Baris di-scan saat dibutuhkan;
+    berikan scan yang sama ke kedua extractor agar baris tidak di-scan dua kali.
+    """
+    return SectionScan(text)
+
+def segment_sections(text: str) -> list[Section]:
+    """
+    Semua section (heading yang dikenali) beserta rentang offset-nya, urut sesuai teks.
+    """
+    return list(scan_sections(text).sections)
@@ -1,7 +1,7 @@
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from algo.ahocor import AhoCorasick
+from algo.ahocor import AhoCorasick, CompiledAhoCorasick
 
 
 def test_aho_search_found():
@@ -18,8 +18,34 @@ def test_aho_search_empty_pattern():
     # pola kosong dianggap tidak valid, kembalikan []
     assert AhoCorasick.search("anything", "") == [], "Pattern kosong harus []"
 
+def test_aho_search_mismatch_on_non_root():
+    # mismatch di node non-root tidak boleh melewatkan karakter saat ini
+    assert AhoCorasick.search("ababc", ["abc"]) == [(2, "abc")]
+    assert AhoCorasick.search("aab", ["ab"]) == [(1, "ab")]
+
+def test_aho_count_multi_keyword():
+    ac = AhoCorasick(["he", "she", "his", "hers", "he"])
+    assert ac.count("ushers and his hero") == {"he": 2, "she": 1, "his": 1, "hers": 1}
+
+def test_compiled_matches_trie():
+    text = "ushers and his hero, ababc"
+    words = ["he", "she", "his", "hers", "abc", "zzz"]
+    compiled = CompiledAhoCorasick(words)
+    found = {(i, compiled.words[pattern_id]) for i, pattern_id in compiled.scan(text)}
+    assert found == set(AhoCorasick.search(text, words))
+    assert compiled.count(text) == AhoCorasick(words).count(text)
+
+def test_compiled_scan_counts():
+    compiled = CompiledAhoCorasick(["sql", "mysql"])
+    assert compiled.scan_counts("mysql, sql, nosql") == [3, 1]
+    assert compiled.scan_counts(b"sql") == [1, 0], "Input bytes juga didukung"
+
 if __name__ == "__main__":
     test_aho_search_found()
     test_aho_search_no_match()
     test_aho_search_empty_pattern()
+    test_aho_search_mismatch_on_non_root()
+    test_aho_count_multi_keyword()
+    test_compiled_matches_trie()
+    test_compiled_scan_counts()
     print("✓ Semua test aho lulus.")
@@ -1,7 +1,10 @@
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from algo.bm import build_last_occurrence, boyer_moore_search
+import random
+from algo.bm import (BM_VARIANTS, bm_count_bytes, bm_search_bytes, boyer_moore_count_bytes, boyer_moore_search,
+                     boyer_moore_search_bytes, build_bad_character_table, build_good_suffix_table,
+                     build_horspool_table, build_last_occurrence, build_sunday_table)
 
 def test_build_last_occurrence(string="CBAABCAAAB"):
     # pola 'AAAB'
@@ -25,10 +28,58 @@ def test_bm_search_overlap():
     # pola 'ABA' di 'ABABA' muncul di 0 dan 2
     assert boyer_moore_search("ABABA", "ABA") == [0,2], "Overlap matches gagal"
 
+def test_build_bad_character_table():
+    table = build_bad_character_table(b"AAAB")
+    assert len(table) == 256 and table[ord("A")] == 2 and table[ord("B")] == 3 and table[ord("C")] == -1
+
+def test_bm_bytes_matches_str_version():
+    # Pada teks ASCII offset byte = index karakter; bytes dan memoryview memberi hasil sama
+    rng = random.Random(0)
+    for _ in range(300):
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 60)))
+        pattern = "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+        expected = boyer_moore_search(text, pattern)
+        encoded = text.encode()
+        assert boyer_moore_search_bytes(encoded, pattern.encode()) == expected, (text, pattern)
+        assert boyer_moore_count_bytes(memoryview(encoded), pattern.encode()) == len(expected), (text, pattern)
+
+def test_bm_bytes_utf8_and_empty_pattern():
+    text = "café crème, café".encode("utf-8")
+    assert boyer_moore_search_bytes(text, "café".encode("utf-8")) == [0, 14], "Offset dalam byte UTF-8"
+    assert boyer_moore_count_bytes(text, "crème".encode("utf-8")) == 1
+    assert boyer_moore_search_bytes(text, b"") == [] and boyer_moore_count_bytes(text, b"") == 0
+
+def test_build_good_suffix_table():
+    # Contoh buku Charras & Lecroq; mismatch di index terakhir selalu geser 1
+    assert build_good_suffix_table(b"GCAGAGAG").tolist() == [7, 7, 7, 2, 7, 4, 7, 1]
+    assert build_good_suffix_table(b"ANPANMAN").tolist() == [6, 6, 6, 6, 6, 3, 8, 1]
+    assert build_good_suffix_table(b"ABAB").tolist() == [2, 2, 4, 1], "Geseran full match = periode pattern"
+
+def test_horspool_and_sunday_tables():
+    horspool, sunday = build_horspool_table(b"abcab"), build_sunday_table(b"abcab")
+    assert (horspool[ord("a")], horspool[ord("b")], horspool[ord("c")], horspool[ord("z")]) == (1, 3, 2, 5)
+    assert (sunday[ord("a")], sunday[ord("b")], sunday[ord("c")], sunday[ord("z")]) == (2, 1, 3, 6)
+
+def test_bm_variants_match_naive_search():
+    rng = random.Random(1)
+    for _ in range(2000):
+        text = bytes(rng.choice(b"ab c") for _ in range(rng.randint(0, 40)))
+        pattern = bytes(rng.choice(b"ab c") for _ in range(rng.randint(1, 6)))
+        expected = [i for i in range(len(text) - len(pattern) + 1) if text[i:i + len(pattern)] == pattern]
+        for variant, (build_table, _) in BM_VARIANTS.items():
+            assert bm_search_bytes(text, pattern, variant) == expected, (variant, text, pattern)
+            assert bm_count_bytes(memoryview(text), pattern, variant, build_table(pattern)) == len(expected)
+
 if __name__ == "__main__":
     test_build_last_occurrence()
     test_bm_search_found()
     test_bm_search_no_match()
     test_bm_search_empty_pattern()
     test_bm_search_overlap()
+    test_build_bad_character_table()
+    test_bm_bytes_matches_str_version()
+    test_bm_bytes_utf8_and_empty_pattern()
+    test_build_good_suffix_table()
+    test_horspool_and_sunday_tables()
+    test_bm_variants_match_naive_search()
     print("✓ Semua test bm lulus.")
@@ -0,0 +1,73 @@
+import sys
+import os
+import subprocess
+import tempfile
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.corpus_loader import CorpusLoader
+from utils.search_engine import SearchEngine
+from utils.text_cache import TextCache
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEXTS = {
+    "a.pdf": "Python developer, SQL and MySQL",
+    "b.pdf": "Accountant: Excel, SQL reports",
+    "c.pdf": "Chef. Cooking and kitchen management",
+}
+
+def _cached_corpus(tmp):
+    """
+    File PDF palsu yang teksnya sudah ada di TextCache (tidak perlu PyMuPDF), plus satu file rusak.
+    """
+    cache = TextCache(os.path.join(tmp, "cache.json"))
+    paths = []
+    for filename, text in TEXTS.items():
+        path = os.path.join(tmp, filename)
+        with open(path, "w") as f:
+            f.write(text)
+        cache.store(path, text)
+        paths.append(path)
+    broken = os.path.join(tmp, "broken.pdf")
+    with open(broken, "w") as f:
+        f.write("not a pdf")
+    return cache, sorted(paths + [broken])
+
+def test_loader_fills_engine_in_background():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache, paths = _cached_corpus(tmp)
+        engine = SearchEngine([])
+        progress, finished = [], []
+        loader = CorpusLoader(tmp, engine, cache=cache, workers=1, list_files=lambda folder: paths,
+                              on_progress=lambda loaded, total: progress.append((loaded, total)),
+                              on_done=finished.append)
+        loader.start()
+        assert loader.wait(timeout=30) and loader.done
+        assert loader.error is None and finished == [loader]
+        assert [data["filename"] for data in engine.corpus] == ["a.pdf", "b.pdf", "c.pdf"]
+        assert [os.path.basename(path) for path in loader.errors] == ["broken.pdf"], "PDF rusak dilewati dan dicatat"
+        assert progress[-1] == (3, 4) and loader.by_filename["b.pdf"]["text"] == TEXTS["b.pdf"]
+
+        expected = SearchEngine([dict(data) for data in engine.corpus]).search(["sql"], "KMP", 3)
+        result = engine.search(["sql"], "KMP", 3)
+        assert [(m.cv_id, m.score) for m in result.matches] == [(m.cv_id, m.score) for m in expected.matches]
+
+def test_loader_reports_listing_error():
+    def failing_list(folder):
+        raise ConnectionError("database offline")
+    loader = CorpusLoader("missing", SearchEngine([]), list_files=failing_list)
+    loader.run()
+    assert loader.done and isinstance(loader.error, ConnectionError) and loader.loaded == 0
+
+def test_startup_imports_stay_light():
+    # Modul yang diimpor main.py saat startup tidak boleh ikut memuat PyMuPDF, MySQL connector atau Faker
+    code = ("import sys, utils.corpus_loader, utils.search_runner, utils.db, utils.section_cache; "
+            "print(sorted(m for m in ('fitz', 'mysql', 'faker', 'concurrent.futures.process') if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIRECTORY,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]", output
+
+if __name__ == "__main__":
+    test_loader_fills_engine_in_background()
+    test_loader_reports_listing_error()
+    test_startup_imports_stay_light()
+    print("✓ Semua test corpus loader lulus.")
@@ -0,0 +1,172 @@
+import sys
+import os
+import tempfile
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algo.fuzzy_index import FuzzyIndex
+from algo.inverted_index import InvertedIndex
+from utils.corpus_loader import CorpusLoader
+from utils.corpus_store import LOWER_BLOB, META_FILENAME, CorpusStore, write_store
+from utils.search_engine import ALGORITHMS, PROCESS_SCAN_MIN_CVS, SearchEngine
+from utils.store_index import INDEX_FILENAME, StoreInvertedIndex
+from utils.text_cache import TextCache
+
+CORPUS = [
+    {"path": "a.pdf", "filename": "a.pdf", "text": "Python developer. Python, SQL and MySQL"},
+    {"path": "b.pdf", "filename": "b.pdf", "text": "Accountant: accounts receivable, Excel, SQL reports"},
+    {"path": "c.pdf", "filename": "c.pdf", "text": "Pyhton scripting and management of excel sheets"},
+    {"path": "d.pdf", "filename": "d.pdf", "text": "Chef. Cooking and kitchen MANAGEMENT — Café crème"},
+    {"path": "e.pdf", "filename": "e.pdf", "text": ""},
+]
+
+def _summary(result):
+    return [(m.cv_id, m.score, m.details, m.match_type) for m in result.matches]
+
+def test_store_round_trip():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = write_store(CORPUS, tmp)
+        assert len(store) == len(CORPUS)
+        for record, data in zip(store, CORPUS):
+            assert record["path"] == data["path"] and record.get("filename") == data["filename"]
+            assert record["text"] == data["text"] and store.lower_text(record.cv_id) == data["text"].lower()
+            assert bytes(record.lower_view()) == data["text"].lower().encode("utf-8")
+        assert store[3].get("missing", "-") == "-"
+        assert store.nbytes == sum(len(data["text"].encode()) + len(data["text"].lower().encode()) for data in CORPUS)
+        store.close()
+
+def test_empty_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = write_store([], tmp)
+        assert store is not None and len(store) == 0 and store.nbytes == 0 and store.is_fresh([])
+        store.close()
+
+def test_freshness_tracks_source_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "a.pdf")
+        with open(pdf, "w") as f:
+            f.write("v1")
+        store = write_store([{"path": pdf, "text": "v1"}], os.path.join(tmp, "store"), [pdf])
+        assert store.is_fresh([pdf]) and not store.is_fresh([pdf, pdf])
+        with open(pdf, "w") as f:
+            f.write("version 2")
+        assert not store.is_fresh([pdf]), "PDF berubah: store harus dibuat ulang"
+        os.remove(pdf)
+        assert not store.is_fresh([pdf])
+        store.close()
+
+def test_incomplete_store_is_rejected():
+    with tempfile.TemporaryDirectory() as tmp:
+        assert CorpusStore.open(tmp) is None, "Belum ada store"
+        write_store(CORPUS, tmp).close()
+        with open(os.path.join(tmp, LOWER_BLOB), "ab") as f:
+            f.write(b"extra")
+        assert CorpusStore.open(tmp) is None, "Ukuran blob tidak cocok dengan offset"
+        write_store(CORPUS, tmp).close()
+        with open(os.path.join(tmp, META_FILENAME), "w") as f:
+            f.write("{broken")
+        assert CorpusStore.open(tmp) is None
+        write_store(CORPUS, tmp).close()
+        with open(os.path.join(tmp, INDEX_FILENAME), "r+b") as f:
+            f.truncate(16)
+        assert CorpusStore.open(tmp) is None, "index.bin lebih pendek dari layout di meta"
+
+def test_store_indexes_match_memory_indexes():
+    texts = [data["text"] for data in CORPUS] + ["Crème brûlée, SQL++ and C++; naïve\ud800 café-bar"]
+    keywords = ["sql", "sq", "python", "café", "é c", "ème", "++", "c++", "l++ a", "management of", "bar", "zzz"]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = write_store([{"path": f"{i}.pdf", "text": text} for i, text in enumerate(texts)], tmp)
+        index, fuzzy_index = store.indexes()
+        memory_index, memory_fuzzy = InvertedIndex(texts), FuzzyIndex(texts)
+        for keyword in keywords:
+            # Posisi index store dalam byte di teks lowercase UTF-8
+            expected = {cv_id: [len(texts[cv_id].lower()[:p].encode("utf-8", "surrogatepass")) for p in positions]
+                        for cv_id, positions in memory_index.search(keyword).items()}
+            assert index.search(keyword) == expected, keyword
+        for keyword in ["pyton", "managment", "cafe", "sql", "creme"]:
+            assert fuzzy_index.search(keyword) == memory_fuzzy.search(keyword), keyword
+            assert fuzzy_index.search_counts(keyword) == memory_fuzzy.search_counts(keyword), keyword
+            assert fuzzy_index.matched_forms(keyword, [0]) == memory_fuzzy.matched_forms(keyword, [0]), keyword
+            for cv_id in range(len(texts)):
+                assert fuzzy_index.matched_words(keyword, cv_id) == memory_fuzzy.matched_words(keyword, cv_id)
+
+        # Hanya CV yang sudah dimuat engine (0..size-1) yang terlihat
+        index, fuzzy_index = store.indexes(2)
+        assert index.count("sql") == {0: 2, 1: 1} and index.count("++") == {}
+        assert set(fuzzy_index.search_counts("excel")) == {1}
+        store.close()
+
+def test_search_over_store_matches_dict_corpus():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = write_store(CORPUS, tmp)
+        from_dicts, from_store = SearchEngine(CORPUS), SearchEngine(list(store))
+        assert all(isinstance(text, memoryview) for text in from_store.lower_texts)
+        # Index dipakai langsung dari store, tidak dibangun ulang dari teks
+        assert len(from_store.index.segments) == 1 and isinstance(from_store.index.segments[0][0], StoreInvertedIndex)
+        for algorithm in ALGORITHMS:
+            for keywords in (["sql"], ["python", "excel"], ["management", "café"], ["pyton"]):
+                expected = from_dicts.search(keywords, algorithm, 5)
+                result = from_store.search(keywords, algorithm, 5)
+                assert _summary(result) == _summary(expected), (algorithm, keywords)
+        store.close()
+
+def test_process_scan_over_store():
+    corpus = [dict(data, path=f"{i}-{data['path']}") for i in range(PROCESS_SCAN_MIN_CVS // len(CORPUS) + 1)
+              for data in CORPUS]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = write_store(corpus, tmp)
+        engine = SearchEngine(list(store), scan_workers=2)
+        try:
+            for algorithm in ALGORITHMS:
+                expected = SearchEngine(corpus).search(["sql", "excel"], algorithm, 10)
+                assert _summary(engine.search(["sql", "excel"], algorithm, 10)) == _summary(expected), algorithm
+            # Worker membaca store sendiri: batch dikirim sebagai rentang cv_id, bukan teks
+            assert engine._store_range(0, len(store)) == (0, len(store))
+            # CV yang bukan dari store (add() dict) tetap di-scan lewat teks batch
+            extra = {"path": "extra.pdf", "filename": "extra.pdf", "text": "SQL and Excel expert"}
+            engine.add(extra)
+            corpus.append(extra)
+            assert engine._store_range(len(store) - 1, len(store) + 1) is None
+            for algorithm in ("KMP", "Inverted Index"):
+                expected = SearchEngine(corpus).search(["sql", "excel", "exel"], algorithm, len(corpus))
+                result = engine.search(["sql", "excel", "exel"], algorithm, len(corpus))
+                assert _summary(result) == _summary(expected), algorithm
+        finally:
+            engine.close()
+            store.close()
+
+def test_loader_reuses_store_on_next_start():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = TextCache(os.path.join(tmp, "cache.json"))
+        paths = []
+        for data in CORPUS[:3]:
+            path = os.path.join(tmp, data["filename"])
+            with open(path, "w") as f:
+                f.write(data["text"])
+            cache.store(path, data["text"])
+            paths.append(path)
+        store_directory = os.path.join(tmp, "store")
+
+        def load():
+            loader = CorpusLoader(tmp, SearchEngine([]), cache=cache, workers=1, list_files=lambda folder: paths,
+                                  store_directory=store_directory)
+            loader.run()
+            assert loader.error is None and loader.loaded == 3
+            return loader
+
+        cold = load()
+        assert cold.store is None and CorpusStore.open(store_directory).is_fresh(paths)
+        warm = load()
+        assert warm.store is not None and warm.by_filename["b.pdf"]["text"] == CORPUS[1]["text"]
+        assert _summary(warm.engine.search(["sql"], "KMP", 3)) == _summary(cold.engine.search(["sql"], "KMP", 3))
+        warm.store.close()
+
+if __name__ == "__main__":
+    test_store_round_trip()
+    test_empty_store()
+    test_freshness_tracks_source_files()
+    test_incomplete_store_is_rejected()
+    test_store_indexes_match_memory_indexes()
+    test_search_over_store_matches_dict_corpus()
+    test_process_scan_over_store()
+    test_loader_reuses_store_on_next_start()
+    print("✓ Semua test corpus store lulus.")
@@ -0,0 +1,169 @@
+import sys
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.db import ConnectionPool, ProfileCache
+import utils.pdf_to_text as pdf_to_text
+
+def _sqlite_connect():
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+def test_pool_reuses_connection():
+    pool = ConnectionPool(_sqlite_connect, size=2)
+    with pool.connection() as conn:
+        first = conn
+    with pool.connection() as conn:
+        assert conn is first, "Koneksi harus dipakai ulang"
+    assert pool.stats["created"] == 1 and pool.stats["reused"] == 1
+
+def test_pool_recycles_old_connection():
+    pool = ConnectionPool(_sqlite_connect, size=1, recycle_seconds=0)
+    with pool.connection() as conn:
+        first = conn
+    with pool.connection() as conn:
+        assert conn is not first
+    assert pool.stats["recycled"] == 1
+
+def test_pool_replaces_dead_connection():
+    pool = ConnectionPool(_sqlite_connect, size=1)
+    with pool.connection() as conn:
+        first = conn
+    first.close()  # koneksi mati di pool, health check harus menolak
+    with pool.connection() as conn:
+        assert conn is not first
+        assert conn.execute("SELECT 1").fetchone() == (1,)
+    assert pool.stats["failed_checks"] == 1
+
+def test_pool_blocks_until_release_and_times_out():
+    pool = ConnectionPool(_sqlite_connect, size=1, timeout=0.05)
+    conn = pool.acquire()
+    try:
+        pool.acquire()
+        assert False, "Pool penuh harus TimeoutError"
+    except TimeoutError:
+        pass
+    threading.Timer(0.01, pool.release, args=(conn,)).start()
+    pool.timeout = 2
+    assert pool.acquire() is conn
+
+def test_pool_rolls_back_open_transaction():
+    pool = ConnectionPool(_sqlite_connect, size=1)
+    with pool.connection() as conn:
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.commit()
+        conn.execute("INSERT INTO t VALUES (1)")
+    with pool.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+
+def test_profile_cache_prefetches_page_in_one_query():
+    calls = []
+    def fetch_many(filenames):
+        calls.append(list(filenames))
+        return {name: {"first_name": name} for name in filenames if name != "missing.pdf"}
+    profiles = ProfileCache(fetch_many, maxsize=16, ttl=60)
+    page = ["1.pdf", "../data/HR/2.pdf", "missing.pdf", "1.pdf"]
+    result = profiles.prefetch(page)
+    assert calls == [["1.pdf", "2.pdf", "missing.pdf"]], "Satu query untuk seluruh halaman"
+    assert result["2.pdf"] == {"first_name": "2.pdf"} and result["missing.pdf"] is None
+    # Summary per kartu dan CV tanpa profil dibaca dari cache
+    assert profiles.get("2.pdf") == {"first_name": "2.pdf"}
+    assert profiles.get("missing.pdf") is None
+    profiles.prefetch(["2.pdf", "3.pdf"])
+    assert calls[1:] == [["3.pdf"]] and profiles.queries == 2
+
+def test_profile_cache_waits_for_in_flight_fetch():
+    calls = []
+    started, release = threading.Event(), threading.Event()
+    def fetch_many(filenames):
+        calls.append(list(filenames))
+        started.set()
+        release.wait(2)
+        return {name: {"first_name": name} for name in filenames}
+    profiles = ProfileCache(fetch_many, maxsize=16, ttl=60)
+    page = threading.Thread(target=profiles.prefetch, args=(["1.pdf", "2.pdf"],))
+    page.start()
+    started.wait(2)
+    # Klik "Summary" saat prefetch halaman masih berjalan: menunggu, bukan query kedua
+    summary = {}
+    click = threading.Thread(target=lambda: summary.update(profile=profiles.get("2.pdf")))
+    click.start()
+    click.join(0.05)  # beri waktu thread kedua sampai di prefetch()
+    assert click.is_alive(), "get() harus menunggu fetch yang sedang berjalan"
+    release.set()
+    page.join(2)
+    click.join(2)
+    assert summary["profile"] == {"first_name": "2.pdf"}
+    assert calls == [["1.pdf", "2.pdf"]] and profiles.queries == 1
+
+class _LegacyDatabase:
+    """
+    Koneksi palsu ke database lama: kolom cv_filename belum ada, atau backfill-nya belum selesai.
+    """
+    def __init__(self, has_column=False, unmigrated=0):
+        self.has_column = has_column
+        self.unmigrated = unmigrated
+        self.statements = []
+
+    def cursor(self, **kwargs):
+        return _LegacyCursor(self)
+
+class _LegacyCursor:
+    def __init__(self, database):
+        self.database = database
+        self.result = []
+
+    def execute(self, query, params=None):
+        query = " ".join(query.split())
+        self.database.statements.append(query)
+        if "information_schema.COLUMNS" in query:
+            self.result = [(int(self.database.has_column),)]
+        elif "cv_filename IS NULL AND cv_path IS NOT NULL" in query:
+            self.result = [(self.database.unmigrated,)]
+        elif "cv_filename" in query and query.startswith("SELECT DISTINCT"):
+            assert self.database.has_column, "Unknown column 'ad.cv_filename'"
+            self.result = [{"cv_filename": "1.pdf"}]
+
+    def fetchone(self):
+        return self.result[0]
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+def _list_filenames(database):
+    original = pdf_to_text.pooled_connection
+    pdf_to_text.pooled_connection = contextmanager(lambda: (yield database))
+    try:
+        return pdf_to_text.get_list_of_filename("unused")
+    finally:
+        pdf_to_text.pooled_connection = original
+
+def test_list_of_filename_never_migrates():
+    database = _LegacyDatabase(has_column=False)
+    try:
+        _list_filenames(database)
+    except RuntimeError as error:
+        assert "python -m utils.seeding --migrate" in str(error)
+    else:
+        raise AssertionError("Database tanpa kolom cv_filename harus error dengan perintah migrasi")
+    # Backfill terhenti di tengah: tetap jalan, tapi diberi peringatan; tidak ada DDL/UPDATE dari jalur baca
+    partial = _LegacyDatabase(has_column=True, unmigrated=3)
+    assert _list_filenames(partial) == ["1.pdf"]
+    for statements in (database.statements, partial.statements):
+        assert not any(query.startswith(("ALTER", "CREATE", "UPDATE")) for query in statements)
+
+if __name__ == "__main__":
+    test_pool_reuses_connection()
+    test_pool_recycles_old_connection()
+    test_pool_replaces_dead_connection()
+    test_pool_blocks_until_release_and_times_out()
+    test_pool_rolls_back_open_transaction()
+    test_profile_cache_prefetches_page_in_one_query()
+    test_profile_cache_waits_for_in_flight_fetch()
+    test_list_of_filename_never_migrates()
+    print("✓ Semua test connection pool lulus.")
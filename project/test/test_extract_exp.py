@@ -0,0 +1,47 @@
+import sys
+import os
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from regex.extract_exp import DATE_RANGE_PATTERN, extract_experience_section, iter_date_ranges, iter_experience_entries
+
+CV_TEXT = """Experience
+Staff Accountant
+January 2010
+to
+Present 2015
+Company Name City , State
+Cashier Aug 2005 to Current Store Name
+Clerk
+05/2001 - 12/2004
+Office Name
+"""
+
+def test_experience_entries():
+    assert extract_experience_section(CV_TEXT) == [
+        "Staff Accountant\nJanuary 2010 to Present 2015\nCompany Name City , State",
+        "Cashier\nAug 2005 to Current\nStore Name",
+        "Clerk\n05/2001 - 12/2004\nOffice Name",
+    ]
+    entries = iter_experience_entries(CV_TEXT)
+    assert next(entries).startswith("Staff Accountant"), "Entri dihasilkan satu per satu"
+
+def test_overlapping_formats_counted_once():
+    # "May" cocok untuk pola bulan penuh dan singkat; dulu entri ini muncul dua kali
+    assert extract_experience_section("Clerk\nMay 2010 to May 2012\nShop\n") == ["Clerk\nMay 2010 to May 2012\nShop"]
+
+def test_date_on_last_line():
+    assert extract_experience_section("Manager\n01/2010 to 02/2012") == ["Manager\n01/2010 to 02/2012"]
+    assert extract_experience_section("") == []
+
+def test_anchored_scan_matches_finditer():
+    texts = [CV_TEXT, "xmay 2010 to june 2011", "MAY   \n 2010to\ncurrent", "13/2010 to 12/2011 01/2010-02/2011",
+             "jun 2010 to jun", "June 2010 to Junee 2011 Jun 2010 to Jun2011", "ſep 2010 to İ"]
+    for text in texts:
+        assert [m.span() for m in iter_date_ranges(text)] == [m.span() for m in DATE_RANGE_PATTERN.finditer(text)], text
+
+if __name__ == "__main__":
+    test_experience_entries()
+    test_overlapping_formats_counted_once()
+    test_date_on_last_line()
+    test_anchored_scan_matches_finditer()
+    print("✓ Semua test experience lulus.")
@@ -0,0 +1,52 @@
+import sys
+import os
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algo.fuzzy_index import BKTree, FuzzyIndex
+from algo.levenshtein import fuzzy_text_search
+
+TEXTS = [
+    "Project Managment and management of teams. Management reports",
+    "Python developer, pyhton scripts and python tooling",
+    "Accounting clerk",
+]
+
+def test_bktree_search():
+    tree = BKTree()
+    for word in ["book", "books", "cake", "boo", "cape", "cart", "book"]:
+        tree.add(word)
+    assert tree.size == 6, "Kata duplikat tidak boleh ditambahkan dua kali"
+    found = {word for word, _ in tree.search("bok", 1)}
+    assert found == {"book", "boo"}, f"Got {found}"
+
+def test_fuzzy_index_matches_text_search():
+    index = FuzzyIndex(TEXTS)
+    for keyword in ["management", "python", "acounting", "java"]:
+        expected = {}
+        for cv_id, text in enumerate(TEXTS):
+            count, words = fuzzy_text_search(text, keyword)
+            if count:
+                expected[cv_id] = (count, words)
+                # urutan kata sama dengan kemunculan di teks
+                assert index.matched_words(keyword, cv_id) == (count, words), keyword
+        result = index.search(keyword)
+        assert result == expected, f"{keyword}: {result} != {expected}"
+
+def test_fuzzy_index_counts_and_words_per_cv():
+    index = FuzzyIndex(TEXTS)
+    full = index.search("python")
+    assert index.search_counts("python") == {cv_id: count for cv_id, (count, _) in full.items()}
+    assert index.matched_words("python", 1) == full[1]
+    assert index.matched_words("python", 2) == (0, [])
+    assert index.matched_forms("management") == {"Managment", "management", "Management"}
+    assert index.matched_forms("management", exclude_cv_ids=[0]) == set()
+
+def test_fuzzy_index_empty_keyword():
+    assert FuzzyIndex(TEXTS).search("") == {}
+
+if __name__ == "__main__":
+    test_bktree_search()
+    test_fuzzy_index_matches_text_search()
+    test_fuzzy_index_counts_and_words_per_cv()
+    test_fuzzy_index_empty_keyword()
+    print("✓ Semua test fuzzy index lulus.")
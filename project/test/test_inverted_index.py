@@ -0,0 +1,83 @@
+import sys
+import os
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import random
+
+from algo.inverted_index import InvertedIndex, TokenIndex
+from algo.kmp import kmp_search
+
+TEXTS = [
+    "Senior Accountant. Accounts Receivable, accounts payable and MySQL reports.",
+    "Python developer; SQL, NoSQL and C++ experience. python scripting",
+    "Nothing relevant here",
+]
+
+def _kmp_reference(keyword):
+    results = {}
+    for cv_id, text in enumerate(TEXTS):
+        positions = kmp_search(text.lower(), keyword.lower())
+        if positions:
+            results[cv_id] = positions
+    return results
+
+def test_index_single_token():
+    index = InvertedIndex(TEXTS)
+    assert index.count("python") == {1: 2}
+    assert index.search("python") == _kmp_reference("python")
+
+def test_index_substring_inside_token():
+    # 'sql' juga cocok di dalam 'mysql' dan 'nosql', sama seperti KMP
+    index = InvertedIndex(TEXTS)
+    assert index.count("sql") == {0: 1, 1: 2}
+    assert index.search("sql") == _kmp_reference("sql")
+
+def test_index_phrase_and_symbols():
+    index = InvertedIndex(TEXTS)
+    for keyword in ["accounts receivable", "c++", "++", "e, s", "ts pay", "t. a"]:
+        assert index.search(keyword) == _kmp_reference(keyword), keyword
+
+def test_index_reads_each_text_once_per_query():
+    lower_texts = [text.lower() for text in TEXTS]
+    reads = []
+    index = InvertedIndex(text_source=lambda cv_id: reads.append(cv_id) or lower_texts[cv_id])
+    for text in TEXTS:
+        index.add(text)
+    # 'sql' cocok dengan token 'sql', 'mysql' dan 'nosql': teks CV 1 tetap dibaca sekali
+    assert index.search("sql") == _kmp_reference("sql")
+    assert sorted(reads) == [0, 1]
+
+def test_index_no_match():
+    index = InvertedIndex(TEXTS)
+    assert index.search("java") == {}
+    assert index.search("") == {}
+
+def test_token_index_matches_vocabulary_scan():
+    rng = random.Random(0)
+    vocabulary = {"".join(rng.choice("abcs") for _ in range(rng.randint(1, 7))) for _ in range(400)}
+    tokens = TokenIndex()
+    for token in vocabulary:
+        tokens.add(token)
+    for run in ["a", "sc", "abc", "cabs", "bbbb", "x"]:
+        assert sorted(tokens.containing(run)) == sorted(t for t in vocabulary if run in t), run
+        assert sorted(tokens.starting_with(run)) == sorted(t for t in vocabulary if t.startswith(run)), run
+        assert sorted(tokens.ending_with(run)) == sorted(t for t in vocabulary if t.endswith(run)), run
+
+def test_index_sees_tokens_added_after_query():
+    index = InvertedIndex(TEXTS)
+    assert index.count("sql") == {0: 1, 1: 2}
+    # Hasil lookup kosakata yang sudah di-cache tidak menyembunyikan token baru
+    index.add("PostgreSQL and sqlite")
+    assert index.count("sql") == {0: 1, 1: 2, 3: 2}
+    assert index.count("sq") == {0: 1, 1: 2, 3: 2}
+    assert index.count("sql ") == {0: 1, 1: 1, 3: 1}
+
+if __name__ == "__main__":
+    test_index_single_token()
+    test_index_substring_inside_token()
+    test_index_phrase_and_symbols()
+    test_index_reads_each_text_once_per_query()
+    test_index_no_match()
+    test_token_index_matches_vocabulary_scan()
+    test_index_sees_tokens_added_after_query()
+    print("✓ Semua test inverted index lulus.")
@@ -3,7 +3,8 @@ import sys
 import os
 # Add the parent directory (project/) to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from algo.kmp import compute_lps, kmp_search
+import random
+from algo.kmp import compute_lps, compute_lps_table, kmp_count_bytes, kmp_search, kmp_search_bytes
 
 def test_compute_lps_basic():
     # pola 'AAAB'
@@ -28,10 +29,34 @@ def test_kmp_search_overlap():
     # pola 'ABA' di 'ABABA' muncul di 0 dan 2
     assert kmp_search("ABABA", "ABA") == [0,2], "Overlap matches gagal"
 
+def test_compute_lps_table_matches_compute_lps():
+    for pattern in ("AAAB", "ABABCABAB", "aabaaab", "x"):
+        assert compute_lps_table(pattern.encode()).tolist() == compute_lps(pattern)
+
+def test_kmp_bytes_matches_str_version():
+    # Pada teks ASCII offset byte = index karakter; bytes dan memoryview memberi hasil sama
+    rng = random.Random(0)
+    for _ in range(300):
+        text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 60)))
+        pattern = "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+        expected = kmp_search(text, pattern)
+        encoded = text.encode()
+        assert kmp_search_bytes(encoded, pattern.encode()) == expected, (text, pattern)
+        assert kmp_count_bytes(memoryview(encoded), pattern.encode()) == len(expected), (text, pattern)
+
+def test_kmp_bytes_utf8_and_empty_pattern():
+    text = "café crème, café".encode("utf-8")
+    assert kmp_search_bytes(text, "café".encode("utf-8")) == [0, 14], "Offset dalam byte UTF-8"
+    assert kmp_count_bytes(text, "crème".encode("utf-8")) == 1
+    assert kmp_search_bytes(text, b"") == [] and kmp_count_bytes(text, b"") == 0
+
 if __name__ == "__main__":
     test_compute_lps_basic()
     test_kmp_search_found()
     test_kmp_search_no_match()
     test_kmp_search_empty_pattern()
     test_kmp_search_overlap()
+    test_compute_lps_table_matches_compute_lps()
+    test_kmp_bytes_matches_str_version()
+    test_kmp_bytes_utf8_and_empty_pattern()
     print("✓ Semua test KMP lulus.")
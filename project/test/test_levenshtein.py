@@ -2,7 +2,7 @@ import sys
 import os
 # Add the parent directory (project/) to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from algo.levenshtein import levenshtein_distance
+from algo.levenshtein import levenshtein_distance, myers_distance, fuzzy_text_search
 
 def test_levenshtein():
     test_cases = [
@@ -18,5 +18,19 @@ def test_levenshtein():
         print(f"Distance('{a}', '{b}') = {result} | Expected: {expected}")
         assert result == expected, f"Mismatch on '{a}' <-> '{b}'"
 
+def test_myers_distance():
+    for a, b in [("kitten", "sitting"), ("flaw", "lawn"), ("gumbo", "gambol"), ("", "abc"), ("abc", "")]:
+        assert myers_distance(a, b) == levenshtein_distance(a, b), f"Mismatch on '{a}' <-> '{b}'"
+
+def test_myers_distance_limit():
+    # jarak 3 > limit 1, cukup dikembalikan nilai di atas limit
+    assert myers_distance("kitten", "sitting", limit=1) > 1
+    assert myers_distance("kitten", "sitting", limit=3) == 3
+    assert myers_distance("a", "abcdef", limit=2) > 2
+
+def test_fuzzy_text_search():
+    count, words = fuzzy_text_search("Managment and management, MANAGEMENT team", "management")
+    assert (count, words) == (3, ["Managment", "management,", "MANAGEMENT"])
+
 # Jalankan test
 test_levenshtein()
@@ -0,0 +1,49 @@
+import sys
+import os
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.lru_cache import LRUCache
+
+def test_lru_eviction_order():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # 'a' jadi yang terbaru dipakai
+    cache.put("c", 3)           # 'b' yang dibuang
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+def test_lru_stats():
+    cache = LRUCache(maxsize=4)
+    cache.put((0, "python", 0.125), (2, ["python", "pyhton"]))
+    cache.get((0, "python", 0.125))
+    cache.get((1, "python", 0.125))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+
+def test_lru_get_or_compute_caches_none():
+    cache = LRUCache(maxsize=4)
+    calls = []
+    compute = lambda: calls.append(1)
+    assert cache.get_or_compute("k", compute) is None
+    assert cache.get_or_compute("k", compute) is None
+    assert len(calls) == 1, "Nilai None juga harus tersimpan di cache"
+
+def test_lru_ttl_expiry():
+    now = [0.0]
+    cache = LRUCache(maxsize=4, ttl=10, clock=lambda: now[0])
+    cache.put("a", 1)
+    now[0] = 9.9
+    assert cache.get("a") == 1
+    now[0] = 10.0
+    assert "a" not in cache and cache.get("a") is None
+    assert cache.expirations == 1 and len(cache) == 0
+
+if __name__ == "__main__":
+    test_lru_eviction_order()
+    test_lru_stats()
+    test_lru_get_or_compute_caches_none()
+    test_lru_ttl_expiry()
+    print("✓ Semua test LRU cache lulus.")
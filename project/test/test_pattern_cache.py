@@ -0,0 +1,52 @@
+import sys
+import os
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algo.bm import BM_VARIANTS, BMPattern, boyer_moore_search
+from algo.kmp import KMPPattern, kmp_search
+from utils.pattern_cache import PATTERN_CACHE, compile_automaton, compile_pattern
+
+TEXT = "accounts receivable, accounts payable; cafe accounts"  # ASCII: offset byte = index karakter
+
+def test_compiled_patterns_match_plain_search():
+    encoded = TEXT.encode("utf-8")
+    for keyword in ("accounts", "a", "payable", "missing"):
+        expected = kmp_search(TEXT, keyword)
+        assert KMPPattern(keyword).search(encoded) == expected
+        assert KMPPattern(keyword).count(memoryview(encoded)) == len(expected)
+        for variant in BM_VARIANTS:
+            pattern = BMPattern(keyword, variant)
+            assert pattern.search(encoded) == boyer_moore_search(TEXT, keyword), (variant, keyword)
+            assert pattern.count(memoryview(encoded)) == len(expected), (variant, keyword)
+
+def test_empty_and_unknown_patterns():
+    assert KMPPattern("").count(b"abc") == 0 and BMPattern("").count(b"abc") == 0
+    try:
+        BMPattern("sql", "KMP")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Varian tidak dikenal harus ValueError")
+
+def test_pattern_cache_reuses_compiled_objects():
+    PATTERN_CACHE.clear()
+    hits = PATTERN_CACHE.hits
+    first = compile_pattern("KMP", "sql")
+    assert compile_pattern("KMP", "sql") is first, "Keyword yang sama dipakai ulang lintas query"
+    assert compile_pattern("Sunday", "sql") is not first, "Key cache memuat algoritma"
+    assert isinstance(compile_pattern("Horspool", "sql"), BMPattern)
+    automaton = compile_automaton(["sql", "excel"])
+    assert compile_automaton(("sql", "excel")) is automaton and compile_automaton(["excel", "sql"]) is not automaton
+    assert PATTERN_CACHE.hits - hits == 2 and len(PATTERN_CACHE) == 5
+    try:
+        compile_pattern("Inverted Index", "sql")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Algoritma tanpa pattern harus ValueError")
+
+if __name__ == "__main__":
+    test_compiled_patterns_match_plain_search()
+    test_empty_and_unknown_patterns()
+    test_pattern_cache_reuses_compiled_objects()
+    print("✓ Semua test pattern cache lulus.")
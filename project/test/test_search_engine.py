@@ -0,0 +1,159 @@
+import sys
+import os
+import heapq
+import threading
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algo.kmp import kmp_search
+from algo.levenshtein import fuzzy_text_search
+from utils.lru_cache import LRUCache
+from utils.search_engine import SearchEngine, ALGORITHMS, normalize_keywords, parse_keywords
+
+CORPUS = [
+    {"path": "a.pdf", "filename": "a.pdf", "text": "Python developer. Python, SQL and MySQL. Managment skills"},
+    {"path": "b.pdf", "filename": "b.pdf", "text": "Accountant: accounts receivable, Excel, SQL reports"},
+    {"path": "c.pdf", "filename": "c.pdf", "text": "Pyhton scripting and management of excel sheets"},
+    {"path": "d.pdf", "filename": "d.pdf", "text": "Chef. Cooking and kitchen management"},
+    {"path": "e.pdf", "filename": "e.pdf", "text": "Sales: exel, sequel, pythn"},
+]
+
+def _reference_search(corpus, keywords, top_n):
+    """
+    Ranking versi lama on_search (full scan + full sort) sebagai acuan.
+    """
+    exact_matches = []
+    for data in corpus:
+        details = []
+        for kw in keywords:
+            count = len(kmp_search(data['text'].lower(), kw))
+            if count:
+                details.append((kw, count))
+        if details:
+            exact_matches.append((data, sum(c for _, c in details), details, len(details) == len(keywords)))
+    exact_matches = heapq.nlargest(len(exact_matches), exact_matches, key=lambda x: 1000*x[3]+x[1])
+    if len(exact_matches) >= top_n:
+        return [(data['filename'], score, details, "exact") for data, score, details, _ in exact_matches[:top_n]]
+
+    lookup = {id(data): (score, details) for data, score, details, _ in exact_matches}
+    combined = []
+    for data in corpus:
+        exact_score, exact_details = lookup.get(id(data), (0, []))
+        exact_keywords = {kw for kw, _ in exact_details}
+        fuzzy_details = []
+        for kw in keywords:
+            if kw not in exact_keywords:
+                count, _ = fuzzy_text_search(data['text'], kw)
+                if count:
+                    fuzzy_details.append((kw, count))
+        fuzzy_score = sum(c for _, c in fuzzy_details)
+        if exact_score == 0 and fuzzy_score == 0:
+            continue
+        match_type = "exact" if fuzzy_score == 0 else "fuzzy" if exact_score == 0 else "mixed"
+        all_details = list(exact_details) + fuzzy_details
+        priority = exact_score * 10e6 + fuzzy_score + 1000 * len(all_details)
+        combined.append((data['filename'], exact_score + fuzzy_score, all_details, priority, match_type))
+    combined = heapq.nlargest(len(combined), combined, key=lambda x: x[3])
+    return [(name, score, details, match_type) for name, score, details, _, match_type in combined[:top_n]]
+
+def test_parse_keywords():
+    assert parse_keywords(" React, Express ,, HTML ") == ["react", "express", "html"]
+    assert parse_keywords(None) == []
+
+def test_engine_matches_reference_ranking():
+    engine = SearchEngine(CORPUS)
+    for keywords in [["python"], ["python", "sql"], ["excel", "management"], ["sql", "cooking", "exel"], ["java"]]:
+        for top_n in [1, 2, 3, 5]:
+            expected = _reference_search(CORPUS, keywords, top_n)
+            for algorithm in ALGORITHMS:
+                result = engine.search(keywords, algorithm, top_n)
+                got = [(m.data['filename'], m.score, m.details, m.match_type) for m in result.matches]
+                assert got == expected, f"{algorithm} {keywords} top{top_n}: {got} != {expected}"
+
+def test_engine_fuzzy_fallback_and_cache():
+    engine = SearchEngine(CORPUS)
+    result = engine.search(["python"], "KMP", top_n=5)
+    assert result.fuzzy_used and result.fuzzy_ms is not None
+    assert result.exact_total == 1
+    # 'Pyhton' berjarak 2 dari 'python' (> limit 1), jadi hanya 'pythn' yang cocok
+    assert result.fuzzy_words == {"python": ["pythn"]}
+    typo_cv = next(m.cv_id for m in result.matches if m.data['filename'] == "e.pdf")
+    hits_before = engine.fuzzy_cache.hits
+    assert engine.fuzzy_result(typo_cv, "python") == (1, ["pythn"])
+    assert engine.fuzzy_cache.hits == hits_before + 1, "Popup harus membaca dari cache"
+
+def test_engine_without_fuzzy():
+    result = SearchEngine(CORPUS).search(["python"], "Boyer-Moore", top_n=5, fuzzy=False)
+    assert not result.fuzzy_used
+    assert [m.data['filename'] for m in result.matches] == ["a.pdf"]
+
+def test_engine_unknown_algorithm():
+    try:
+        SearchEngine(CORPUS).search(["python"], "Rabin-Karp")
+    except ValueError:
+        return
+    assert False, "Algoritma tidak dikenal harus ValueError"
+
+def test_iter_search_snapshots():
+    engine = SearchEngine(CORPUS)
+    for keywords, algorithm in [(["sql"], "KMP"), (["python", "excel"], "Aho-Corasick"), (["sql"], "Inverted Index")]:
+        snapshots = list(engine.iter_search(keywords, algorithm, top_n=3, batch_size=2))
+        final = snapshots[-1]
+        assert final.done and not any(snapshot.done for snapshot in snapshots[:-1])
+        expected = engine.search(keywords, algorithm, top_n=3)
+        assert [(m.cv_id, m.score, m.match_type) for m in final.matches] == \
+               [(m.cv_id, m.score, m.match_type) for m in expected.matches]
+        assert final.fuzzy_words == expected.fuzzy_words and final.scanned == final.corpus_size == 5
+        scanned = [snapshot.scanned for snapshot in snapshots if not snapshot.fuzzy_used]
+        assert scanned == sorted(scanned), "Snapshot exact mengikuti urutan scan"
+    # KMP dengan batch 2 pada 5 CV: snapshot setelah 2 dan 4 CV
+    assert [r.scanned for r in engine.iter_search(["sql"], "KMP", 1, batch_size=2)] == [2, 4, 5]
+
+def test_iter_search_cancel():
+    engine = SearchEngine(CORPUS)
+    cancel = threading.Event()
+    results = []
+    for result in engine.iter_search(["python"], "KMP", top_n=5, batch_size=1, cancel=cancel):
+        results.append(result)
+        cancel.set()
+    assert len(results) == 1 and not results[0].done, "Pencarian berhenti tanpa hasil akhir"
+
+def test_result_cache_hits_and_invalidation():
+    engine = SearchEngine(list(CORPUS))
+    first = engine.search(["python", "sql"], "KMP", 3)
+    assert not first.cached and engine.result_cache.stats()["misses"] == 1
+    again = engine.search([" Python", "SQL "], "KMP", 3)
+    assert again.cached and again.done and again.matches == first.matches and engine.result_cache.hits == 1
+    assert normalize_keywords([" Python", "", "SQL "]) == ("python", "sql")
+    # Mengubah hasil yang dikembalikan tidak boleh merusak entri cache
+    again.matches[0].details.append(("java", 99))
+    again.matches.clear()
+    first.fuzzy_words["python"] = ["changed"]
+    assert engine.search(["python", "sql"], "KMP", 3).matches == SearchEngine(CORPUS).search(["python", "sql"], "KMP", 3).matches
+    assert not engine.search(["python", "sql"], "KMP", 2).cached, "top_n ikut key cache"
+    assert not engine.search(["python", "sql"], "Sunday", 3).cached, "Algoritma ikut key cache"
+
+    # Korpus berubah: generation naik, hasil lama tidak dipakai lagi
+    engine.add({"path": "f.pdf", "filename": "f.pdf", "text": "Python, Python, SQL, SQL, SQL"})
+    fresh = engine.search(["python", "sql"], "KMP", 3)
+    assert not fresh.cached and fresh.matches[0].data["filename"] == "f.pdf" and fresh.corpus_size == 6
+
+def test_result_cache_ttl():
+    now = [0.0]
+    engine = SearchEngine(CORPUS)
+    engine.result_cache = LRUCache(maxsize=4, ttl=60, clock=lambda: now[0])
+    engine.search(["excel"], "KMP", 3)
+    assert engine.search(["excel"], "KMP", 3).cached
+    now[0] = 61.0
+    assert not engine.search(["excel"], "KMP", 3).cached and engine.result_cache.expirations == 1
+
+if __name__ == "__main__":
+    test_parse_keywords()
+    test_engine_matches_reference_ranking()
+    test_engine_fuzzy_fallback_and_cache()
+    test_engine_without_fuzzy()
+    test_engine_unknown_algorithm()
+    test_iter_search_snapshots()
+    test_iter_search_cancel()
+    test_result_cache_hits_and_invalidation()
+    test_result_cache_ttl()
+    print("✓ Semua test search engine lulus.")
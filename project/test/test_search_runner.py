@@ -0,0 +1,75 @@
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.search_engine import PROCESS_SCAN_MIN_CVS, SearchEngine
+from utils.search_runner import SearchRunner
+
+CORPUS = [
+    {"path": "a.pdf", "filename": "a.pdf", "text": "Python developer. Python, SQL and MySQL"},
+    {"path": "b.pdf", "filename": "b.pdf", "text": "Accountant: accounts receivable, Excel, SQL reports"},
+    {"path": "c.pdf", "filename": "c.pdf", "text": "Pyhton scripting and management of excel sheets"},
+    {"path": "d.pdf", "filename": "d.pdf", "text": "Chef. Cooking and kitchen management"},
+]
+
+def _summary(result):
+    return [(m.cv_id, m.score, m.details, m.match_type) for m in result.matches]
+
+def test_newer_query_supersedes_older():
+    engine = SearchEngine(CORPUS)
+    runner = SearchRunner(engine)
+    first_snapshot, gate = threading.Event(), threading.Event()
+    old_results, new_results = [], []
+
+    def on_old(token, result):
+        old_results.append(result)
+        first_snapshot.set()
+        gate.wait(5)
+
+    old_token, old_future = runner.submit(["sql"], "KMP", 3, on_old, batch_size=1)
+    assert first_snapshot.wait(5)
+    new_token, new_future = runner.submit(["excel"], "KMP", 3, lambda token, result: new_results.append(result))
+    gate.set()
+    assert old_future.result(5) is None and len(old_results) == 1, "Snapshot query lama setelah digantikan dibuang"
+    final = new_future.result(5)
+    assert final.done and new_results[-1] is final and runner.is_current(new_token) and not runner.is_current(old_token)
+    assert _summary(final) == _summary(engine.search(["excel"], "KMP", 3))
+    assert (runner.completed, runner.superseded) == (1, 1)
+    runner.shutdown()
+
+def test_queued_query_skipped_and_cancel():
+    executor = ThreadPoolExecutor(max_workers=1)
+    busy = threading.Event()
+    executor.submit(busy.wait, 5)  # worker sibuk: query berikut masih di antrean
+    runner = SearchRunner(SearchEngine(CORPUS), executor)
+    calls = []
+    _, first = runner.submit(["sql"], "KMP", 3, lambda token, result: calls.append("first"))
+    _, second = runner.submit(["sql"], "KMP", 3, lambda token, result: calls.append("second"))
+    runner.cancel()
+    busy.set()
+    assert first.result(5) is None and second.result(5) is None
+    assert calls == [] and runner.superseded == 2, "Klik ganda tidak menjalankan scan yang sudah basi"
+    executor.shutdown()
+
+def test_process_scan_matches_in_thread_scan():
+    corpus = [dict(data, filename=f"{i}-{data['filename']}") for i in range(PROCESS_SCAN_MIN_CVS // len(CORPUS) + 1)
+              for data in CORPUS]
+    in_thread = SearchEngine(corpus, scan_workers=1)
+    in_processes = SearchEngine(list(corpus), scan_workers=2)
+    try:
+        for keywords, algorithm in [(["sql", "python"], "KMP"), (["excel"], "Aho-Corasick"), (["pythn"], "Boyer-Moore")]:
+            expected = in_thread.search(keywords, algorithm, 5)
+            assert _summary(in_processes.search(keywords, algorithm, 5)) == _summary(expected)
+            in_processes.result_cache.clear()  # paksa scan ulang agar snapshot dari proses worker teruji
+            streamed = list(in_processes.iter_search(keywords, algorithm, 5, batch_size=60))
+            assert len(streamed) > 1 and _summary(streamed[-1]) == _summary(expected)
+    finally:
+        in_processes.close()
+
+if __name__ == "__main__":
+    test_newer_query_supersedes_older()
+    test_queued_query_skipped_and_cancel()
+    test_process_scan_matches_in_thread_scan()
+    print("✓ Semua test search runner lulus.")
@@ -0,0 +1,68 @@
+import sys
+import os
+import tempfile
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.section_cache import SectionCache, extract_sections, text_digest
+
+CV_TEXT = """Skills
+Python, SQL, Excel
+Experience
+01/2019 to Current
+Data Analyst Company Name City , State
+Built monthly reports
+Education
+Bachelor of Science : Statistics , 2018 Institut Teknologi Bandung
+"""
+
+def _counting_extractor(calls):
+    def extractor(text):
+        calls.append(text)
+        return extract_sections(text)
+    return extractor
+
+def test_section_cache_lazy_and_persisted():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cv_sections.json")
+        calls = []
+        cache = SectionCache(cache_path, extractor=_counting_extractor(calls))
+        first = cache.get(CV_TEXT)
+        assert cache.get(CV_TEXT) == first and len(calls) == 1
+        assert first == extract_sections(CV_TEXT)
+        cache.save()
+
+        # Cache hangat: extractor (regex) tidak dipanggil sama sekali
+        reloaded = SectionCache(cache_path, extractor=_counting_extractor(calls))
+        assert reloaded.get(CV_TEXT) == first
+        assert len(calls) == 1 and reloaded.hits == 1
+
+def test_section_cache_precompute_and_prune():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cv_sections.json")
+        calls = []
+        cache = SectionCache(cache_path, extractor=_counting_extractor(calls))
+        texts = [CV_TEXT, CV_TEXT + "\nInterests\nChess", CV_TEXT]
+        cache.start_precompute(texts).join()
+        assert len(calls) == 2, "Teks yang sama hanya di-parse sekali"
+        assert os.path.exists(cache_path)
+        cache.prune(texts[:1])
+        assert cache.stats()["entries"] == 1
+        assert cache.lookup(texts[1]) is None and cache.lookup(CV_TEXT) is not None
+
+def test_section_cache_lone_surrogate():
+    # Teks hasil ekstraksi PDF yang rusak bisa memuat surrogate tunggal
+    text = CV_TEXT.replace("Python", "Py\udc80thon")
+    assert text_digest("a\udc80b") != text_digest("ab")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cv_sections.json")
+        cache = SectionCache(cache_path)
+        sections = cache.get(text)
+        cache.save()
+        reloaded = SectionCache(cache_path)
+        assert reloaded.get(text) == sections and reloaded.hits == 1
+
+if __name__ == "__main__":
+    test_section_cache_lazy_and_persisted()
+    test_section_cache_precompute_and_prune()
+    test_section_cache_lone_surrogate()
+    print("✓ Semua test section cache lulus.")
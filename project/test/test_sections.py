@@ -0,0 +1,63 @@
+import sys
+import os
+import json
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from regex.extract_edu import extract_education_section
+from regex.extract_skill import extract_skills_from_resume
+from regex.sections import fold_case, scan_sections, segment_sections
+
+REGRESSION_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "section_regression.json")
+
+CV_TEXT = """John Doe
+Professional Summary
+Detail oriented accountant
+Skills:
+Excel, SAP
+Work History
+01/2019 to Current Accountant
+Education
+Bachelor of Science : Accounting , 2018
+"""
+
+def test_extractors_match_legacy_regression():
+    # Output extractor regex lama (kaskade DOTALL), dibuat dengan: python -m bench.bench_sections --write-regression
+    with open(REGRESSION_PATH, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    assert len(cases) > 20
+    for case in cases:
+        assert extract_education_section(case["text"]) == case["education"], case["text"][:60]
+        assert extract_skills_from_resume(case["text"]) == case["skills"], case["text"][:60]
+
+def test_segment_sections_spans():
+    sections = segment_sections(CV_TEXT)
+    assert [section.name for section in sections] == ["summary", "skills", "experience", "education"]
+    assert [CV_TEXT[s.start:s.end].strip() for s in sections] == [
+        "Detail oriented accountant",
+        "Excel, SAP",
+        "01/2019 to Current Accountant",
+        "Bachelor of Science : Accounting , 2018",
+    ]
+    assert scan_sections(CV_TEXT).section_text("skills") == "Excel, SAP"
+    assert scan_sections(CV_TEXT).section_text("languages") is None
+
+def test_scan_is_lazy_and_shareable():
+    long_text = "Skills\nExcel, SAP\nExperience\nClerk\n" + CV_TEXT + "filler line\n" * 10000
+    scan = scan_sections(long_text)
+    assert extract_skills_from_resume(long_text, scan) == "Excel, SAP"
+    assert not scan.done, "Skills di awal CV tidak perlu scan sampai akhir teks"
+    assert extract_education_section(long_text, scan) == extract_education_section(long_text)
+    assert len(scan.sections) == 6 and scan.done
+    assert scan_sections(long_text) is not scan, "Tidak ada cache global yang menahan teks CV"
+
+def test_fold_case_keeps_offsets():
+    assert fold_case("İSKILLS") == "iskills"
+    assert fold_case("ſKILLS\n") == "skills\n"
+    assert len(fold_case("Straße İ")) == len("Straße İ")
+
+if __name__ == "__main__":
+    test_extractors_match_legacy_regression()
+    test_segment_sections_spans()
+    test_scan_is_lazy_and_shareable()
+    test_fold_case_keeps_offsets()
+    print("✓ Semua test section lulus.")
@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.seeding import ResumePicker, assign_applicant_ids, generate_applicant_batches
+
+POSITIONS = {
+    "ACCOUNTANT": [f"data/ACCOUNTANT/{i}.pdf" for i in range(5)] + ["data/ACCOUNTANT/notes.txt"],
+    "CHEF": [f"data/CHEF/{i}.pdf" for i in range(10, 13)],
+    "HR": [],
+}
+
+class StaticValues:
+    """
+    Pengganti Faker yang deterministik.
+    """
+    def first_name(self): return "Ana"
+    def last_name(self): return "Budi"
+    def date_of_birth(self, minimum_age=18, maximum_age=60): return "1990-01-01"
+    def address(self): return "Jl. Ganesha 10\nBandung"
+    def phone_number(self): return "0812"
+
+def test_resume_picker_uses_each_cv_once():
+    picker = ResumePicker(POSITIONS)
+    assert sorted(picker.positions) == ["ACCOUNTANT", "CHEF"]
+    picked = [picker.pick("CHEF") for _ in range(4)]
+    assert sorted(picked[:3]) == sorted(POSITIONS["CHEF"]) and picked[3] is None
+
+def test_batches_reference_applicants_by_offset():
+    random.seed(1)
+    batches = list(generate_applicant_batches(7, POSITIONS, StaticValues(), batch_size=3))
+    assert [len(applicants) for applicants, _ in batches] == [3, 3, 1]
+    applicant_rows = [row for applicants, _ in batches for row in applicants]
+    assert len(applicant_rows[0]) == 5 and applicant_rows[0][3] == "Jl. Ganesha 10, Bandung", "Tanpa applicant_id"
+    for applicants, details in batches:
+        assert all(0 <= row[0] < len(applicants) for row in details), "Detail merujuk posisi pelamar di batch"
+    detail_rows = [row for _, details in batches for row in details]
+    filenames = [row[3] for row in detail_rows]
+    assert len(filenames) == len(set(filenames)) <= 8, "CV asli tidak boleh dipakai dua kali"
+    assert all(row[2] == row[3] for row in detail_rows)
+
+def test_assign_applicant_ids():
+    # id dari AUTO_INCREMENT: baris pertama INSERT multi-row = LAST_INSERT_ID()
+    rows = [(0, "Chef", "1.pdf", "1.pdf"), (2, "Hr", "2.pdf", "2.pdf")]
+    assert assign_applicant_ids(rows, 500) == [(500, "Chef", "1.pdf", "1.pdf"), (502, "Hr", "2.pdf", "2.pdf")]
+
+def test_batches_fill_synthetic_cvs():
+    random.seed(2)
+    batches = generate_applicant_batches(50, POSITIONS, StaticValues(), synthetic_cvs=True)
+    filenames = [row[3] for _, details in batches for row in details]
+    assert len(filenames) == len(set(filenames))
+    assert sum(not name.startswith("synthetic-") for name in filenames) == 8
+    assert len(filenames) >= 50, "Setiap pelamar minimal punya satu CV"
+
+if __name__ == "__main__":
+    test_resume_picker_uses_each_cv_once()
+    test_batches_reference_applicants_by_offset()
+    test_assign_applicant_ids()
+    test_batches_fill_synthetic_cvs()
+    print("✓ Semua test seeding lulus.")
@@ -0,0 +1,93 @@
+import sys
+import os
+import tempfile
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.text_cache import TextCache, atomic_write_json, read_json
+
+def _fake_extractor(calls):
+    def extract(path):
+        calls.append(path)
+        with open(path, "rb") as f:
+            return f.read().decode()
+    return extract
+
+def test_cache_hit_after_save():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "a.pdf")
+        with open(pdf, "wb") as f:
+            f.write(b"hello world")
+        cache_path = os.path.join(tmp, "cache.json")
+        calls = []
+
+        cache = TextCache(cache_path)
+        assert cache.get_text(pdf, _fake_extractor(calls)) == "hello world"
+        cache.save()
+        assert cache.stats() == {"entries": 1, "hits": 0, "misses": 1}
+
+        warm = TextCache(cache_path)
+        assert warm.get_text(pdf, _fake_extractor(calls)) == "hello world"
+        assert warm.hits == 1 and warm.misses == 0
+        assert len(calls) == 1, "File yang tidak berubah tidak boleh diekstrak ulang"
+
+def test_cache_reextracts_changed_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "a.pdf")
+        with open(pdf, "wb") as f:
+            f.write(b"old")
+        cache = TextCache(os.path.join(tmp, "cache.json"))
+        calls = []
+        cache.get_text(pdf, _fake_extractor(calls))
+
+        with open(pdf, "wb") as f:
+            f.write(b"new text")
+        assert cache.get_text(pdf, _fake_extractor(calls)) == "new text"
+        assert len(calls) == 2
+
+def test_cache_hit_when_only_mtime_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf = os.path.join(tmp, "a.pdf")
+        with open(pdf, "wb") as f:
+            f.write(b"same")
+        cache = TextCache(os.path.join(tmp, "cache.json"))
+        calls = []
+        cache.get_text(pdf, _fake_extractor(calls))
+        os.utime(pdf, ns=(0, 0))
+        cache.get_text(pdf, _fake_extractor(calls))
+        assert len(calls) == 1, "Isi sama (hash sama) harus tetap hit"
+
+def test_corrupt_cache_file_is_ignored():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_path = os.path.join(tmp, "cache.json")
+        with open(cache_path, "w") as f:
+            f.write("{not json")
+        cache = TextCache(cache_path)
+        assert cache.entries == {}
+
+def test_lone_surrogates_round_trip():
+    # Dua surrogate yang diekstrak terpisah (teks PDF rusak) tidak boleh tergabung jadi satu karakter astral
+    high, low = b"\xed\xa0\x80".decode("utf-8", "surrogatepass"), b"\xed\xb0\x80".decode("utf-8", "surrogatepass")
+    text = high + low
+    assert text == "\ud800\udc00" and len(text) == 2
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "payload.json")
+        payload = {"entries": {"a.pdf": {"text": text, "forms": ["x\udc80", "plain"]}}}
+        atomic_write_json(path, payload)
+        assert read_json(path) == payload
+
+        pdf = os.path.join(tmp, "a.pdf")
+        with open(pdf, "wb") as f:
+            f.write(b"pdf")
+        cache = TextCache(os.path.join(tmp, "cache.json"))
+        cache.get_text(pdf, lambda path: text)
+        cache.save()
+        warm = TextCache(os.path.join(tmp, "cache.json"))
+        assert warm.get_text(pdf, lambda path: "re-extracted") == text and warm.hits == 1
+
+if __name__ == "__main__":
+    test_cache_hit_after_save()
+    test_cache_reextracts_changed_file()
+    test_cache_hit_when_only_mtime_changes()
+    test_corrupt_cache_file_is_ignored()
+    test_lone_surrogates_round_trip()
+    print("✓ Semua test text cache lulus.")
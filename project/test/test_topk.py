@@ -0,0 +1,30 @@
+import sys
+import os
+import heapq
+import random
+# Add the parent directory (project/) to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from algo.topk import TopK
+
+def test_topk_matches_nlargest_with_ties():
+    rng = random.Random(7)
+    for _ in range(200):
+        items = [(rng.randint(0, 5), f"cv{i}") for i in range(rng.randint(0, 30))]
+        k = rng.randint(1, 10)
+        ranking = TopK(k)
+        for score, name in items:
+            ranking.push(score, name)
+        expected = [name for _, name in heapq.nlargest(k, items, key=lambda x: x[0])]
+        assert ranking.items() == expected
+
+def test_topk_explicit_order_any_push_sequence():
+    items = [(3, 0), (5, 1), (3, 2), (5, 3), (1, 4)]
+    ranking = TopK(3)
+    for score, order in reversed(items):
+        ranking.push(score, order, order)
+    assert ranking.items() == [1, 3, 0]
+
+if __name__ == "__main__":
+    test_topk_matches_nlargest_with_ties()
+    test_topk_explicit_order_any_push_sequence()
+    print("✓ Semua test top-k lulus.")
@@ -0,0 +1,116 @@
+# file: utils/corpus_loader.py
+# Memuat korpus CV di background agar window aplikasi bisa langsung tampil
+import threading
+import time
+
+from utils.corpus_store import CorpusStore, CorpusStoreWriter
+from utils.pdf_to_text import PDF_WORKERS, iter_cv_texts, list_corpus_files
+from utils.text_cache import TextCache
+
+PROGRESS_INTERVAL_SECONDS = 0.1  # jarak minimum antar callback progress
+
+class CorpusLoader:
+    """
+    Membaca teks CV (cache dulu, sisanya ekstraksi paralel) di thread daemon
+    dan menambahkan setiap CV ke SearchEngine begitu tersedia. Pencarian
+    selama loading memakai CV yang sudah masuk; wait() menunggu sampai selesai.
+    Dengan 'store_directory', korpus dibaca dari CorpusStore (mmap) jika masih
+    sesuai dengan daftar PDF; jika tidak, store ditulis ulang sambil memuat.
+    """
+    def __init__(self, cv_root_folder: str, engine, cache: TextCache | None = None,
+                 workers: int = PDF_WORKERS, list_files=list_corpus_files, on_progress=None, on_done=None,
+                 store_directory: str | None = None):
+        self.cv_root_folder = cv_root_folder
+        self.store_directory = store_directory
+        self.store: CorpusStore | None = None
+        self.engine = engine
+        self.cache = cache
+        self.workers = workers
+        self.list_files = list_files
+        self.on_progress = on_progress  # dipanggil (loaded, total) dari thread loader
+        self.on_done = on_done          # dipanggil (loader) setelah semua CV dimuat
+        self.by_filename: dict[str, dict] = {}
+        self.errors: dict[str, str] = {}
+        self.loaded = 0
+        self.total: int | None = None
+        self.error: Exception | None = None
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def progress(self) -> tuple[int, int | None]:
+        return self.loaded, self.total
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Tunggu sampai korpus selesai dimuat; False jika timeout.
+        """
+        return self._done.wait(timeout)
+
+    def _report(self):
+        if self.on_progress is not None:
+            self.on_progress(self.loaded, self.total)
+
+    def run(self):
+        self.started_at = time.perf_counter()
+        try:
+            pdf_paths = self.list_files(self.cv_root_folder)
+            self.total = len(pdf_paths)
+            self._report()
+            last_report = time.perf_counter()
+            loaded_paths = []
+            writer = None
+            store = CorpusStore.open(self.store_directory) if self.store_directory else None
+            if store is not None and store.is_fresh(pdf_paths):
+                self.store = store
+                documents = iter(store)
+            else:
+                if store is not None:
+                    store.close()
+                if self.store_directory:
+                    writer = CorpusStoreWriter(self.store_directory, pdf_paths)
+                documents = iter_cv_texts(pdf_paths, self.cache, self.workers, self.errors)
+            for data in documents:
+                self.engine.add(data)
+                self.by_filename[data["filename"]] = data
+                loaded_paths.append(data["path"])
+                if writer is not None:
+                    writer.append(data)
+                self.loaded += 1
+                if time.perf_counter() - last_report >= PROGRESS_INTERVAL_SECONDS:
+                    self._report()
+                    last_report = time.perf_counter()
+            if writer is not None:
+                # Dipakai mulai startup berikutnya; sesi ini tetap memakai teks yang sudah dimuat
+                written = writer.close()
+                if written is not None:
+                    written.close()
+            if self.cache is not None and self.store is None:
+                self.cache.prune(loaded_paths)
+                self.cache.save()
+        except Exception as error:
+            # Mis. database tidak bisa diakses: aplikasi tetap jalan dengan korpus yang sudah ada
+            self.error = error
+            print(f"❌ Loading CVs failed: {type(error).__name__}: {error}")
+        finally:
+            self.finished_at = time.perf_counter()
+            self._done.set()
+            self._report()
+            if self.on_done is not None:
+                self.on_done(self)
+
+    def elapsed_ms(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000
@@ -0,0 +1,219 @@
+# file: utils/corpus_store.py
+# Korpus CV ringkas di disk: blob UTF-8 (teks asli + lowercase) yang di-mmap, array offset, record __slots__,
+# plus index exact/fuzzy siap pakai (index.bin) agar startup tidak membangun ulang index dari teks
+import mmap
+import os
+from array import array
+
+from utils.store_index import (ENCODING_ERRORS, INDEX_FILENAME, StoreFuzzyIndex, StoreIndexBuilder,
+                               StoreInvertedIndex, map_sections, write_sections)
+from utils.text_cache import CACHE_DIRECTORY, atomic_write_json, read_json
+
+STORE_VERSION = 2  # 2: index.bin (posting token + kosakata fuzzy)
+DEFAULT_STORE_DIRECTORY = os.path.join(CACHE_DIRECTORY, "corpus")
+META_FILENAME = "meta.json"
+TEXT_BLOB = "text.bin"    # teks asli (untuk Summary/section)
+LOWER_BLOB = "lower.bin"  # teks lowercase (dinormalisasi untuk exact match)
+OFFSETS_FILENAME = "offsets.bin"
+
+def source_fingerprint(path: str) -> list:
+    stat = os.stat(path)
+    return [os.path.abspath(path), stat.st_size, stat.st_mtime_ns]
+
+class CVRecord:
+    """
+    Metadata satu CV tanpa teks; teks dibaca dari blob saat diminta.
+    record["path"], record["text"] dan record.get(...) tetap bisa dipakai seperti dict korpus lama.
+    """
+    __slots__ = ("store", "cv_id", "path", "filename")
+
+    def __init__(self, store: "CorpusStore", cv_id: int, path: str, filename: str):
+        self.store = store
+        self.cv_id = cv_id
+        self.path = path
+        self.filename = filename
+
+    @property
+    def text(self) -> str:
+        return self.store.text(self.cv_id)
+
+    def lower_view(self) -> memoryview:
+        return self.store.lower_view(self.cv_id)
+
+    def __getitem__(self, key: str):
+        if key not in ("path", "filename", "text"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"CVRecord({self.cv_id}, {self.filename!r})"
+
+def _map_blob(path: str):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""  # mmap tidak bisa memetakan file kosong
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+class CorpusStore:
+    """
+    Korpus read-only hasil CorpusStoreWriter. Teks tidak disimpan sebagai objek Python:
+    blob di-mmap (dibaca OS sesuai kebutuhan) dan slice lowercase untuk search tanpa salinan.
+    Index exact/fuzzy juga di-mmap dari index.bin (lihat indexes()).
+    """
+    def __init__(self, directory: str, meta: dict, text_blob, lower_blob, text_offsets: array, lower_offsets: array,
+                 index_blob=b"", sections: dict[str, memoryview] | None = None):
+        self.directory = directory
+        self.sources = meta["sources"]
+        self._text_blob = text_blob
+        self._lower_blob = lower_blob
+        self._lower_view = memoryview(lower_blob)
+        self._text_offsets = text_offsets
+        self._lower_offsets = lower_offsets
+        self._index_blob = index_blob
+        self._sections = sections or {}
+        self.records = [CVRecord(self, cv_id, path, os.path.basename(path)) for cv_id, path in enumerate(meta["paths"])]
+
+    @classmethod
+    def open(cls, directory: str = DEFAULT_STORE_DIRECTORY) -> "CorpusStore | None":
+        """
+        Buka store di 'directory'; None jika belum ada, versinya lain, atau file tidak lengkap.
+        """
+        try:
+            meta = read_json(os.path.join(directory, META_FILENAME))
+            if not isinstance(meta, dict) or meta.get("version") != STORE_VERSION:
+                return None
+            count = len(meta["paths"])
+            offsets = array("q")
+            with open(os.path.join(directory, OFFSETS_FILENAME), "rb") as f:
+                offsets.frombytes(f.read())
+            text_blob = _map_blob(os.path.join(directory, TEXT_BLOB))
+            lower_blob = _map_blob(os.path.join(directory, LOWER_BLOB))
+            index_blob = _map_blob(os.path.join(directory, INDEX_FILENAME))
+            sections = map_sections(index_blob, meta["index"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        text_offsets, lower_offsets = offsets[:count + 1], offsets[count + 1:]
+        # Crash di tengah penulisan: ukuran blob tidak cocok dengan offset di meta
+        if (len(offsets) != 2 * (count + 1) or text_offsets[-1] != len(text_blob)
+                or lower_offsets[-1] != len(lower_blob)):
+            return None
+        return cls(directory, meta, text_blob, lower_blob, text_offsets, lower_offsets, index_blob, sections)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, cv_id: int) -> CVRecord:
+        return self.records[cv_id]
+
+    def text(self, cv_id: int) -> str:
+        start, end = self._text_offsets[cv_id], self._text_offsets[cv_id + 1]
+        return self._text_blob[start:end].decode("utf-8", ENCODING_ERRORS)
+
+    def lower_view(self, cv_id: int) -> memoryview:
+        """
+        Teks lowercase CV sebagai slice memoryview dari blob (tanpa salinan).
+        """
+        return self._lower_view[self._lower_offsets[cv_id]:self._lower_offsets[cv_id + 1]]
+
+    def lower_text(self, cv_id: int) -> str:
+        return str(self.lower_view(cv_id), "utf-8", ENCODING_ERRORS)
+
+    def is_fresh(self, pdf_paths: list[str]) -> bool:
+        """
+        True jika store dibuat dari daftar PDF yang sama dan tidak ada file yang berubah.
+        """
+        try:
+            return self.sources == [source_fingerprint(path) for path in pdf_paths]
+        except OSError:
+            return False
+
+    def indexes(self, size: int | None = None) -> tuple[StoreInvertedIndex, StoreFuzzyIndex]:
+        """
+        Index exact dan fuzzy untuk CV 0..size-1 (default semua), langsung di atas array index.bin.
+        'size' boleh dinaikkan kemudian (atribut .size) saat record berikutnya dimuat.
+        """
+        size = len(self) if size is None else size
+        return (StoreInvertedIndex(self._sections, self._lower_blob, self._lower_offsets, size),
+                StoreFuzzyIndex(self._sections, size))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._text_blob) + len(self._lower_blob)
+
+    def close(self):
+        """
+        Lepas mmap; record dan view dari store ini tidak boleh dipakai lagi.
+        Selama masih ada slice lower_view() yang dipegang (mis. oleh SearchEngine),
+        mmap lowercase baru dilepas saat slice terakhir dibuang.
+        """
+        self._lower_view.release()
+        for section in self._sections.values():
+            section.release()
+        for blob in (self._text_blob, self._lower_blob, self._index_blob):
+            if isinstance(blob, mmap.mmap):
+                try:
+                    blob.close()
+                except BufferError:
+                    pass
+
+class CorpusStoreWriter:
+    """
+    Menulis store secara streaming (satu CV per append) ke file sementara;
+    close() memindahkannya ke tempatnya, meta.json ditulis paling akhir.
+    """
+    def __init__(self, directory: str = DEFAULT_STORE_DIRECTORY, pdf_paths: list[str] = ()):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        # Fingerprint seluruh daftar PDF (termasuk yang gagal diekstrak) untuk is_fresh()
+        self.sources = [source_fingerprint(path) for path in pdf_paths]
+        self.paths: list[str] = []
+        self._offsets = {TEXT_BLOB: array("q", [0]), LOWER_BLOB: array("q", [0])}
+        self._files = {name: open(os.path.join(directory, name + ".tmp"), "wb") for name in self._offsets}
+        self._index = StoreIndexBuilder()
+
+    def append(self, data: dict):
+        text = data["text"]
+        lower = text.lower()
+        self._index.add(text, lower)
+        for name, content in ((TEXT_BLOB, text), (LOWER_BLOB, lower)):
+            encoded = content.encode("utf-8", ENCODING_ERRORS)
+            self._files[name].write(encoded)
+            offsets = self._offsets[name]
+            offsets.append(offsets[-1] + len(encoded))
+        self.paths.append(data["path"])
+
+    def close(self) -> CorpusStore | None:
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+        offsets_tmp = os.path.join(self.directory, OFFSETS_FILENAME + ".tmp")
+        with open(offsets_tmp, "wb") as f:
+            self._offsets[TEXT_BLOB].tofile(f)
+            self._offsets[LOWER_BLOB].tofile(f)
+        # Index disusun sekali saat store ditulis; startup berikutnya cukup me-mmap hasilnya
+        layout = write_sections(os.path.join(self.directory, INDEX_FILENAME + ".tmp"), self._index.sections())
+        self._index = None
+        for name in (TEXT_BLOB, LOWER_BLOB, OFFSETS_FILENAME, INDEX_FILENAME):
+            os.replace(os.path.join(self.directory, name + ".tmp"), os.path.join(self.directory, name))
+        atomic_write_json(os.path.join(self.directory, META_FILENAME),
+                          {"version": STORE_VERSION, "paths": self.paths, "sources": self.sources, "index": layout})
+        return CorpusStore.open(self.directory)
+
+def write_store(records, directory: str = DEFAULT_STORE_DIRECTORY, pdf_paths: list[str] = ()) -> CorpusStore | None:
+    """
+    Tulis semua record (dict dengan 'path' dan 'text') ke store baru dan buka hasilnya.
+    """
+    writer = CorpusStoreWriter(directory, pdf_paths)
+    for data in records:
+        writer.append(data)
+    return writer.close()
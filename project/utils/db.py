@@ -1,5 +1,10 @@
 # file: db.py
-import mysql.connector
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from utils.lru_cache import LRUCache
 RESUME_DIRECTORY = "../data/data"  # Root folder where roles and CVs are stored
 TOTAL_CANDIDATES = 200
 
@@ -10,28 +15,274 @@ DB_CONFIG = {
     'database': "tubes3_seeding"
 }
 
+# Pengaturan connection pool
+POOL_SIZE = 5
+POOL_RECYCLE_SECONDS = 1800   # koneksi lebih tua dari ini dibuka ulang
+POOL_TIMEOUT_SECONDS = 10     # lama menunggu koneksi kosong sebelum error
+
+# Cache profil pelamar (hasil prefetch satu halaman / Top-N)
+PROFILE_CACHE_SIZE = 2048
+PROFILE_CACHE_TTL_SECONDS = 300
+PREFETCH_BATCH_SIZE = 1000    # maksimal nilai dalam satu IN (...)
+
 # ---------- DATABASE SETUP ----------
 
 def establish_connection():
+    import mysql.connector  # diimpor saat koneksi pertama, bukan saat startup
     return mysql.connector.connect(**DB_CONFIG)
 
-def get_applicant_by_cv_filename(filename: str):
-    conn = establish_connection()
-    cursor = conn.cursor(dictionary=True, buffered=True)
+def is_connection_alive(conn) -> bool:
+    """
+    Health check: ping server MySQL, atau SELECT 1 untuk koneksi DB-API lain (mis. sqlite3).
+    """
+    try:
+        if hasattr(conn, "is_connected"):
+            return conn.is_connected()
+        conn.execute("SELECT 1")
+        return True
+    except Exception:
+        return False
+
+class ConnectionPool:
+    """
+    Pool koneksi sederhana yang aman untuk banyak thread.
+    Koneksi dicek (health check) sebelum dipakai ulang dan dibuka ulang
+    setelah berumur 'recycle_seconds'.
+    """
+    def __init__(self, connect, size: int = POOL_SIZE, recycle_seconds: float = POOL_RECYCLE_SECONDS,
+                 timeout: float = POOL_TIMEOUT_SECONDS, health_check=is_connection_alive):
+        self._connect = connect
+        self.size = size
+        self.recycle_seconds = recycle_seconds
+        self.timeout = timeout
+        self.health_check = health_check
+        self._idle: deque = deque()        # (conn, waktu dibuat)
+        self._created_at: dict[int, float] = {}
+        self._in_use = 0
+        self._condition = threading.Condition()
+        self.stats = {"created": 0, "reused": 0, "recycled": 0, "failed_checks": 0}
+
+    def _open(self):
+        conn = self._connect()
+        self._created_at[id(conn)] = time.monotonic()
+        self.stats["created"] += 1
+        return conn
+
+    def _discard(self, conn):
+        self._created_at.pop(id(conn), None)
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """
+        Ambil koneksi dari pool (atau buka baru jika pool belum penuh).
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._condition:
+            while not self._idle and self._in_use >= self.size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No database connection available after {self.timeout}s")
+                self._condition.wait(remaining)
+            self._in_use += 1
+            conn = self._idle.pop() if self._idle else None
 
-    query = """
-    SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.date_of_birth,
-           ap.address, ap.phone_number, ad.application_role
-    FROM ApplicantProfile ap
-    JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
-    WHERE ad.cv_path LIKE %s
+        try:
+            if conn is not None:
+                age = time.monotonic() - self._created_at.get(id(conn), 0)
+                if age > self.recycle_seconds:
+                    self.stats["recycled"] += 1
+                    self._discard(conn)
+                    conn = None
+                elif not self.health_check(conn):
+                    self.stats["failed_checks"] += 1
+                    self._discard(conn)
+                    conn = None
+                else:
+                    self.stats["reused"] += 1
+            return conn if conn is not None else self._open()
+        except BaseException:
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, conn, broken: bool = False):
+        """
+        Kembalikan koneksi ke pool. Transaksi yang masih terbuka di-rollback.
+        """
+        if not broken and getattr(conn, "in_transaction", False):
+            try:
+                conn.rollback()
+            except Exception:
+                broken = True
+        with self._condition:
+            self._in_use -= 1
+            if broken:
+                self._discard(conn)
+            else:
+                self._idle.append(conn)
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        except BaseException:
+            self.release(conn, broken=not self.health_check(conn))
+            raise
+        self.release(conn)
+
+    def close_all(self):
+        with self._condition:
+            while self._idle:
+                self._discard(self._idle.pop())
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+def get_pool() -> ConnectionPool:
+    """
+    Pool bersama untuk semua helper database (dibuat saat pertama dipakai).
     """
-    cursor.execute(query, (f'%/{filename}',))
-    result = cursor.fetchone()
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ConnectionPool(establish_connection)
+        return _pool
+
+def pooled_connection():
+    """
+    Context manager: with pooled_connection() as conn: ...
+    """
+    return get_pool().connection()
+
+# ---------- SKEMA ----------
+
+MIGRATE_COMMAND = "python -m utils.seeding --migrate"
 
+def has_cv_filename_column(database) -> bool:
+    cursor = database.cursor()
+    cursor.execute("""
+    SELECT COUNT(*) FROM information_schema.COLUMNS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ApplicationDetail' AND COLUMN_NAME = 'cv_filename'
+    """)
+    found = cursor.fetchone()[0] > 0
     cursor.close()
-    conn.close()
-    return result
+    return found
+
+def count_unmigrated_rows(database) -> int:
+    """
+    Baris ApplicationDetail yang punya cv_path tapi belum di-backfill cv_filename
+    (mis. migrasi terhenti di tengah); baris ini tidak ikut dicari.
+    """
+    cursor = database.cursor()
+    cursor.execute("SELECT COUNT(*) FROM ApplicationDetail WHERE cv_filename IS NULL AND cv_path IS NOT NULL")
+    count = cursor.fetchone()[0]
+    cursor.close()
+    return count
+
+# ---------- PROFIL PELAMAR ----------
+
+APPLICANTS_BY_CV_QUERY = """
+SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.date_of_birth,
+       ap.address, ap.phone_number, ad.application_role, ad.cv_filename
+FROM ApplicantProfile ap
+JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+WHERE ad.cv_filename IN ({placeholders})
+"""
+
+def fetch_applicants_by_cv_filenames(filenames: list[str]) -> dict[str, dict]:
+    """
+    Profil untuk banyak CV sekaligus: satu query IN (...) per PREFETCH_BATCH_SIZE nama file.
+    Kembalikan dict cv_filename -> profil (hanya yang ditemukan).
+    """
+    profiles: dict[str, dict] = {}
+    if not filenames:
+        return profiles
+    with pooled_connection() as conn:
+        cursor = conn.cursor(dictionary=True, buffered=True)
+        for start in range(0, len(filenames), PREFETCH_BATCH_SIZE):
+            batch = filenames[start:start + PREFETCH_BATCH_SIZE]
+            cursor.execute(APPLICANTS_BY_CV_QUERY.format(placeholders=", ".join(["%s"] * len(batch))), batch)
+            for row in cursor.fetchall():
+                # Sama seperti fetchone(): baris pertama untuk tiap nama file
+                profiles.setdefault(row.pop('cv_filename'), row)
+        cursor.close()
+    return profiles
+
+class ProfileCache:
+    """
+    Cache profil pelamar per nama file CV (LRU + TTL).
+    prefetch() mengambil semua profil yang belum ada dengan satu query,
+    CV tanpa profil juga dicatat (None) agar tidak di-query ulang.
+    Nama file yang sedang di-fetch thread lain tidak di-query dua kali: pemanggil menunggu hasilnya.
+    """
+    def __init__(self, fetch_many=fetch_applicants_by_cv_filenames, maxsize: int = PROFILE_CACHE_SIZE,
+                 ttl: float | None = PROFILE_CACHE_TTL_SECONDS):
+        self.fetch_many = fetch_many
+        self.cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.queries = 0
+        self._lock = threading.Lock()
+        self._pending: dict[str, threading.Event] = {}  # nama file -> event fetch yang sedang berjalan
+
+    def _fetch(self, names: list[str]) -> dict[str, dict | None]:
+        with self._lock:
+            self.queries += 1
+        fetched = self.fetch_many(names)
+        profiles = {name: fetched.get(name) for name in names}
+        for name, profile in profiles.items():
+            self.cache.put(name, profile)
+        return profiles
+
+    def prefetch(self, filenames) -> dict[str, dict | None]:
+        """
+        Pastikan profil semua 'filenames' ada di cache; kembalikan nama file -> profil.
+        """
+        names = list(dict.fromkeys(os.path.basename(name) for name in filenames))
+        with self._lock:
+            in_flight = {name: self._pending[name] for name in names if name in self._pending}
+            missing = [name for name in names if name not in in_flight and name not in self.cache]
+            done = threading.Event()
+            for name in missing:
+                self._pending[name] = done
+        profiles = {}
+        if missing:
+            try:
+                profiles.update(self._fetch(missing))
+            finally:
+                with self._lock:
+                    for name in missing:
+                        del self._pending[name]
+                done.set()
+        for event in set(in_flight.values()):
+            event.wait()
+        # Fetch thread lain gagal (atau entri sudah terbuang): ambil sendiri
+        retry = [name for name in in_flight if name not in self.cache]
+        if retry:
+            profiles.update(self._fetch(retry))
+        return {name: profiles[name] if name in profiles else self.cache.get(name) for name in names}
+
+    def get(self, filename: str) -> dict | None:
+        return self.prefetch([filename])[os.path.basename(filename)]
+
+    def clear(self):
+        self.cache.clear()
+
+PROFILE_CACHE = ProfileCache()
+
+def prefetch_applicants(filenames) -> dict[str, dict | None]:
+    """
+    Ambil profil untuk seluruh CV di satu halaman hasil / Top-N sekaligus.
+    """
+    return PROFILE_CACHE.prefetch(filenames)
+
+def get_applicant_by_cv_filename(filename: str):
+    # Lewat cache: CV yang sudah di-prefetch tidak perlu round trip lagi
+    return PROFILE_CACHE.get(filename)
 
 if __name__ == "__main__":
     filename = "10554236.pdf"
@@ -0,0 +1,26 @@
+# file: utils/pattern_cache.py
+# Cache pattern terkompilasi (KMP/BM/Aho-Corasick) lintas CV dan lintas query
+from algo.ahocor import CompiledAhoCorasick
+from algo.bm import BM_VARIANTS, BMPattern
+from algo.kmp import KMPPattern
+from utils.lru_cache import LRUCache
+
+PATTERN_CACHE_SIZE = 512  # keyword (atau set keyword Aho-Corasick) yang disimpan per proses
+PATTERN_CACHE = LRUCache(maxsize=PATTERN_CACHE_SIZE)
+
+def compile_pattern(algorithm: str, keyword: str) -> KMPPattern | BMPattern:
+    """
+    KMPPattern / BMPattern untuk keyword, diambil dari PATTERN_CACHE dengan key (algorithm, keyword).
+    """
+    if algorithm == "KMP":
+        return PATTERN_CACHE.get_or_compute((algorithm, keyword), lambda: KMPPattern(keyword))
+    if algorithm in BM_VARIANTS:
+        return PATTERN_CACHE.get_or_compute((algorithm, keyword), lambda: BMPattern(keyword, algorithm))
+    raise ValueError(f"Unknown algorithm: {algorithm}")
+
+def compile_automaton(keywords) -> CompiledAhoCorasick:
+    """
+    Automaton Aho-Corasick untuk satu set keyword (urutan dipertahankan), juga lewat PATTERN_CACHE.
+    """
+    keywords = tuple(keywords)
+    return PATTERN_CACHE.get_or_compute(("Aho-Corasick", keywords), lambda: CompiledAhoCorasick(list(keywords)))
@@ -1,19 +1,16 @@
 
-import fitz  # PyMuPDF
 import os
-import mysql.connector
+from utils.db import MIGRATE_COMMAND, count_unmigrated_rows, has_cv_filename_column, pooled_connection
+from utils.text_cache import TextCache
 
-DB_CONFIG = {
-    'host': "localhost",
-    'user': "root",
-    'password': "12345",
-    'database': "tubes3_seeding"
-}
+# Jumlah proses worker untuk ekstraksi PDF paralel (bisa di-override lewat env PDF_WORKERS)
+PDF_WORKERS = int(os.environ.get("PDF_WORKERS", os.cpu_count() or 1))
 
 def extract_text_from_pdf(pdf_path: str) -> str:
     """
     Ekstrak teks dari file PDF menjadi satu string.
     """
+    import fitz  # PyMuPDF, diimpor saat PDF pertama diekstrak
     text = ""
     with fitz.open(pdf_path) as doc:
         for page in doc:
@@ -26,44 +23,130 @@ def extract_text_from_pdf(pdf_path: str) -> str:
                 text += page.getText()
     return text
 
-def establish_connection():
-    return mysql.connector.connect(**DB_CONFIG)
-
 def get_list_of_filename(cv_root_folder: str):
-    conn = establish_connection()
-    cursor = conn.cursor(dictionary=True, buffered=True)
+    with pooled_connection() as conn:
+        # Migrasi skema tidak dijalankan dari sini (hanya baca); beri tahu perintah migrasinya
+        if not has_cv_filename_column(conn):
+            raise RuntimeError(f"Kolom ApplicationDetail.cv_filename belum ada, jalankan: {MIGRATE_COMMAND}")
+        unmigrated = count_unmigrated_rows(conn)
+        if unmigrated:
+            print(f"⚠️ {unmigrated} baris ApplicationDetail belum punya cv_filename dan tidak ikut dicari, "
+                  f"jalankan: {MIGRATE_COMMAND}")
+
+        cursor = conn.cursor(dictionary=True, buffered=True)
 
-    query = """SELECT DISTINCT ad.cv_path FROM ApplicationDetail ad"""
-    cursor.execute(query)
-    results = cursor.fetchall()
+        query = """SELECT DISTINCT ad.cv_filename FROM ApplicationDetail ad WHERE ad.cv_filename IS NOT NULL"""
+        cursor.execute(query)
+        results = cursor.fetchall()
 
-    cursor.close()
-    conn.close()
-    return [os.path.basename(result['cv_path']) for result in results]
+        cursor.close()
+    return [result['cv_filename'] for result in results]
 
-def load_all_cv_texts(cv_root_folder: str) -> list[dict]:
+def _extract_worker(pdf_path: str) -> tuple[str, str | None, str | None]:
     """
-    Memuat semua file PDF dari folder data/ dan mengubahnya menjadi teks.
-    Mengembalikan list of dicts dengan key: 'path', 'role', 'text'.
+    Dijalankan di proses worker: kembalikan (path, text, error).
+    """
+    try:
+        return pdf_path, extract_text_from_pdf(pdf_path), None
+    except Exception as error:
+        return pdf_path, None, f"{type(error).__name__}: {error}"
+
+def iter_extracted_texts(pdf_paths: list[str], workers: int = PDF_WORKERS):
+    """
+    Yield (path, text, error) untuk setiap PDF, urut sesuai pdf_paths,
+    segera setelah worker selesai mengekstrak file tersebut.
+    """
+    if workers <= 1 or len(pdf_paths) < 2:
+        yield from map(_extract_worker, pdf_paths)
+        return
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing hanya diimpor jika ada PDF baru
+    workers = min(workers, len(pdf_paths))
+    # chunk kecil agar beban antar worker tetap seimbang
+    chunksize = max(1, len(pdf_paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_extract_worker, pdf_paths, chunksize=chunksize)
+
+def extract_texts_parallel(pdf_paths: list[str], workers: int = PDF_WORKERS) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    Ekstrak banyak PDF sekaligus menggunakan process pool.
+    Mengembalikan (texts, errors): dict path -> teks dan dict path -> pesan error.
+    Kegagalan satu file tidak menghentikan batch.
+    """
+    texts, errors = {}, {}
+    for pdf_path, text, error in iter_extracted_texts(pdf_paths, workers):
+        if error is None:
+            texts[pdf_path] = text
+        else:
+            errors[pdf_path] = error
+    return texts, errors
+
+def list_cv_files(cv_root_folder: str, allowed_filenames=None) -> list[str]:
     """
-    all_cv_data = []
-    list_of_filenames = get_list_of_filename(cv_root_folder)
-    for role in os.listdir(cv_root_folder):
+    Daftar path PDF di cv_root_folder/[ROLE]/, terurut agar hasil deterministik.
+    """
+    pdf_paths = []
+    for role in sorted(os.listdir(cv_root_folder)):
         role_folder = os.path.join(cv_root_folder, role)
         if not os.path.isdir(role_folder):
             continue
 
-        for filename in os.listdir(role_folder):
-            if filename.lower().endswith(".pdf") and filename in list_of_filenames:
-                # print(f"Processing {filename} in {role_folder}")
-                full_path = os.path.join(role_folder, filename)
-                extracted = extract_text_from_pdf(full_path)
-                all_cv_data.append({
-                    "path": full_path,
-                    "filename": filename,
-                    "text": extracted
-                })
+        for filename in sorted(os.listdir(role_folder)):
+            if filename.lower().endswith(".pdf") and (allowed_filenames is None or filename in allowed_filenames):
+                pdf_paths.append(os.path.join(role_folder, filename))
+    return pdf_paths
+
+def list_corpus_files(cv_root_folder: str) -> list[str]:
+    """
+    Path PDF di cv_root_folder yang terdaftar di tabel ApplicationDetail.
+    """
+    return list_cv_files(cv_root_folder, set(get_list_of_filename(cv_root_folder)))
 
+def iter_cv_texts(pdf_paths: list[str], cache: TextCache | None = None,
+                  workers: int = PDF_WORKERS, errors: dict | None = None):
+    """
+    Yield dict {'path', 'filename', 'text'} per CV, urut sesuai pdf_paths.
+    Teks dari cache langsung dikeluarkan; sisanya diekstrak paralel dan
+    dikeluarkan begitu selesai. File yang gagal dilewati dan dicatat di 'errors'.
+    """
+    cached_texts = {}
+    pending = []
+    for full_path in pdf_paths:
+        cached = cache.lookup(full_path) if cache is not None else None
+        if cached is None:
+            pending.append(full_path)
+        else:
+            cached_texts[full_path] = cached
+
+    extracted = iter_extracted_texts(pending, workers)
+    for full_path in pdf_paths:
+        text = cached_texts.get(full_path)
+        if text is None:
+            _, text, error = next(extracted)
+            if error is not None:
+                print(f"⚠️ Failed to extract {full_path}: {error}")
+                if errors is not None:
+                    errors[full_path] = error
+                continue
+            if cache is not None:
+                cache.store(full_path, text)
+        yield {
+            "path": full_path,
+            "filename": os.path.basename(full_path),
+            "text": text
+        }
+
+def load_all_cv_texts(cv_root_folder: str, cache: TextCache | None = None,
+                      workers: int = PDF_WORKERS, errors: dict | None = None) -> list[dict]:
+    """
+    Memuat semua file PDF dari folder data/ dan mengubahnya menjadi teks.
+    Mengembalikan list of dicts dengan key: 'path', 'filename', 'text'.
+    Jika 'cache' diberikan, hanya file yang berubah yang diekstrak ulang.
+    File yang gagal diekstrak dilewati dan dicatat di 'errors' (path -> pesan).
+    """
+    all_cv_data = list(iter_cv_texts(list_corpus_files(cv_root_folder), cache, workers, errors))
+    if cache is not None:
+        cache.prune(data["path"] for data in all_cv_data)
+        cache.save()
     return all_cv_data
 
 def test_pdf_extraction():
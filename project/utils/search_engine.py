@@ -0,0 +1,493 @@
+# file: utils/search_engine.py
+# Mesin pencarian CV tanpa UI: exact match (KMP/BM/Aho-Corasick/Inverted Index) + fuzzy fallback
+import os
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field, replace
+
+from algo.inverted_index import InvertedIndex
+from algo.fuzzy_index import FuzzyIndex
+from algo.topk import TopK
+from utils.corpus_store import ENCODING_ERRORS, CorpusStore
+from utils.lru_cache import LRUCache
+from utils.pattern_cache import compile_automaton, compile_pattern
+
+ALGORITHMS = ("KMP", "Boyer-Moore", "Horspool", "Sunday", "Aho-Corasick", "Inverted Index")
+FUZZY_THRESHOLD = 0.125
+FUZZY_CACHE_SIZE = 4096
+# Hasil search() per (keyword, algoritma, top_n, ..., generasi korpus); query yang diulang tidak di-scan lagi
+RESULT_CACHE_SIZE = 256
+RESULT_CACHE_TTL_SECONDS = 600.0
+SNAPSHOT_BATCH_SIZE = 50  # iter_search(): snapshot Top-N sementara setiap N CV
+# Jumlah proses untuk scan exact KMP/BM/Aho-Corasick (bisa di-override lewat env SEARCH_WORKERS)
+SEARCH_WORKERS = int(os.environ.get("SEARCH_WORKERS", os.cpu_count() or 1))
+PROCESS_SCAN_MIN_CVS = 200  # korpus lebih kecil dari ini di-scan di thread pemanggil
+
+@dataclass
+class SearchMatch:
+    cv_id: int
+    data: dict
+    score: int
+    details: list[tuple[str, int]]
+    match_type: str  # "exact", "fuzzy" atau "mixed"
+
+@dataclass
+class SearchResult:
+    keywords: list[str]
+    algorithm: str
+    top_n: int
+    matches: list[SearchMatch] = field(default_factory=list)
+    scanned: int = 0
+    corpus_size: int = 0
+    done: bool = False  # False untuk snapshot sementara dari iter_search()
+    exact_total: int = 0
+    fuzzy_used: bool = False
+    # keyword -> semua kata mirip di korpus (untuk popup "Fuzzy Matches")
+    fuzzy_words: dict[str, list[str]] = field(default_factory=dict)
+    exact_ms: float = 0.0
+    fuzzy_ms: float | None = None
+    total_ms: float = 0.0
+    cached: bool = False  # True jika diambil dari result cache engine
+
+def parse_keywords(raw: str | None) -> list[str]:
+    """
+    "React, Express ,html" -> ["react", "express", "html"]
+    """
+    return [kw.strip().lower() for kw in (raw or '').split(',') if kw.strip()]
+
+def _copy_result(result: SearchResult, **changes) -> SearchResult:
+    """
+    Salinan SearchResult yang tidak berbagi list/dict/SearchMatch dengan aslinya,
+    agar entri result cache tidak ikut berubah jika pemanggil mengubah hasilnya.
+    """
+    matches = [replace(match, details=list(match.details)) for match in result.matches]
+    fuzzy_words = {kw: list(words) for kw, words in result.fuzzy_words.items()}
+    return replace(result, keywords=list(result.keywords), matches=matches, fuzzy_words=fuzzy_words, **changes)
+
+def normalize_keywords(keywords: list[str]) -> tuple[str, ...]:
+    """
+    Bentuk kanonik keyword untuk key cache: lowercase dan tanpa spasi di tepi.
+    Urutan dan duplikat dipertahankan karena ikut menentukan skor dan urutan details.
+    """
+    return tuple(kw.strip().lower() for kw in keywords if kw.strip())
+
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
+
+def scan_texts(texts: list, keywords: list[str], algorithm: str, first_cv_id: int = 0):
+    """
+    Exact match KMP/BM/Aho-Corasick pada teks lowercase. Kembalikan [(cv_id, details)]
+    untuk CV yang memuat minimal satu keyword; top-level agar bisa jalan di proses worker.
+    Teks boleh str atau bytes/memoryview UTF-8 (slice CorpusStore); semuanya di-scan
+    sebagai byte UTF-8 dengan mode count-only, jumlah kemunculannya sama.
+    """
+    # Aho-Corasick: satu automaton untuk semua keyword, tiap CV di-scan sekali.
+    # KMP/BM: tabel tiap keyword dikompilasi sekali dan dipakai ulang lintas CV dan lintas query.
+    automaton = compile_automaton(keywords) if algorithm == "Aho-Corasick" else None
+    patterns = {kw: compile_pattern(algorithm, kw) for kw in keywords} if automaton is None else {}
+    hits = []
+    for cv_id, text in enumerate(texts, first_cv_id):
+        if isinstance(text, str):
+            text = text.encode("utf-8", ENCODING_ERRORS)
+        keyword_counts = automaton.count(text) if automaton is not None else None
+        details = []
+        for kw in keywords:
+            count = keyword_counts[kw] if keyword_counts is not None else patterns[kw].count(text)
+            if count:
+                details.append((kw, count))
+        if details:
+            hits.append((cv_id, details))
+    return hits
+
+# Proses worker scan: CorpusStore di-mmap sekali oleh initializer pool, bukan dikirim per query
+_WORKER_STORE: CorpusStore | None = None
+
+def _init_scan_worker(store_directory: str | None, store_size: int = 0, store_nbytes: int = 0):
+    global _WORKER_STORE
+    if store_directory is None:
+        return
+    store = CorpusStore.open(store_directory)
+    # Store di disk sudah ditulis ulang: jangan scan teks yang berbeda dari korpus engine
+    if store is not None and (len(store) != store_size or store.nbytes != store_nbytes):
+        store.close()
+        store = None
+    _WORKER_STORE = store
+
+def scan_store_range(start: int, end: int, keywords: list[str], algorithm: str, first_cv_id: int):
+    """
+    Dijalankan di proses worker: scan_texts untuk record store start..end-1 (cv_id engine mulai first_cv_id).
+    """
+    if _WORKER_STORE is None:
+        raise RuntimeError("Corpus store tidak terbuka di proses worker scan")
+    texts = (_WORKER_STORE.lower_view(store_id) for store_id in range(start, end))
+    return scan_texts(texts, keywords, algorithm, first_cv_id)
+
+class SegmentedIndex:
+    """
+    Index exact + fuzzy korpus engine sebagai segmen berurutan. Record CorpusStore yang berurutan
+    memakai index store di-mmap (tidak dibangun ulang saat startup); CV lain masuk InvertedIndex
+    dan FuzzyIndex di memori. cv_id engine = awal segmen + cv_id di dalam segmen.
+    """
+    def __init__(self, text_source):
+        self._text = text_source  # cv_id engine -> teks lowercase, untuk verifikasi segmen memori
+        self.starts: list[int] = []
+        self.segments: list[tuple[InvertedIndex, FuzzyIndex, CorpusStore | None]] = []
+        self.size = 0
+
+    def add(self, data):
+        store = getattr(data, "store", None)
+        index, fuzzy_index, segment_store = self.segments[-1] if self.segments else (None, None, None)
+        if store is not None and store is segment_store and data.cv_id == index.size:
+            # Record berikutnya dari store yang sama: cukup perluas rentang CV yang terlihat
+            index.size += 1
+            fuzzy_index.size += 1
+        elif store is not None and data.cv_id == 0:
+            self.starts.append(self.size)
+            self.segments.append((*store.indexes(1), store))
+        else:
+            if index is None or segment_store is not None:
+                start = self.size
+                index = InvertedIndex(text_source=lambda cv_id: self._text(start + cv_id))
+                fuzzy_index = FuzzyIndex()
+                self.starts.append(start)
+                self.segments.append((index, fuzzy_index, None))
+            index.add(data['text'])
+            fuzzy_index.add(data['text'])
+        self.size += 1
+
+    def _segment(self, cv_id: int) -> tuple[int, FuzzyIndex]:
+        i = bisect_right(self.starts, cv_id) - 1
+        return self.starts[i], self.segments[i][1]
+
+    def count(self, keyword: str) -> dict[int, int]:
+        counts = {}
+        for start, (index, _, _) in zip(self.starts, self.segments):
+            counts.update((start + cv_id, count) for cv_id, count in index.count(keyword).items())
+        return counts
+
+    def search_counts(self, target: str, similarity_threshold: float) -> dict[int, int]:
+        counts = {}
+        for start, (_, fuzzy_index, _) in zip(self.starts, self.segments):
+            counts.update((start + cv_id, count)
+                          for cv_id, count in fuzzy_index.search_counts(target, similarity_threshold).items())
+        return counts
+
+    def matched_words(self, target: str, cv_id: int, similarity_threshold: float) -> tuple[int, list[str]]:
+        start, fuzzy_index = self._segment(cv_id)
+        return fuzzy_index.matched_words(target, cv_id - start, similarity_threshold)
+
+    def matched_forms(self, target: str, exclude_cv_ids, similarity_threshold: float) -> set[str]:
+        forms = set()
+        for start, (_, fuzzy_index, _) in zip(self.starts, self.segments):
+            exclude = [cv_id - start for cv_id in exclude_cv_ids if start <= cv_id < start + fuzzy_index.size]
+            forms |= fuzzy_index.matched_forms(target, exclude, similarity_threshold)
+        return forms
+
+class SearchEngine:
+    """
+    Memegang korpus CV beserta index-nya dan menjalankan ranking:
+    exact match dulu, lalu fuzzy untuk mengisi sisa slot Top-N.
+    """
+    def __init__(self, corpus: list[dict], fuzzy_threshold: float = FUZZY_THRESHOLD,
+                 fuzzy_cache_size: int = FUZZY_CACHE_SIZE, scan_workers: int = SEARCH_WORKERS,
+                 result_cache_size: int = RESULT_CACHE_SIZE, result_cache_ttl: float | None = RESULT_CACHE_TTL_SECONDS):
+        self.corpus = corpus
+        self.scan_workers = scan_workers
+        self._scan_pool = None  # ProcessPoolExecutor, dibuat saat scan besar pertama
+        self._scan_store: CorpusStore | None = None  # store yang di-mmap proses worker
+        self.fuzzy_threshold = fuzzy_threshold
+        # Teks lowercase per CV: str, atau memoryview ke blob CorpusStore (tanpa salinan)
+        self.lower_texts: list = []
+        # Index exact + fuzzy; segmen memori membaca teks verifikasi dari lower_texts (tanpa salinan sendiri)
+        self.index = SegmentedIndex(self._lower_text)
+        # Hasil fuzzy per (cv_id, keyword, threshold), diisi search() dan dibaca popup
+        self.fuzzy_cache = LRUCache(maxsize=fuzzy_cache_size)
+        # Hasil akhir per query; key memuat 'generation' sehingga entri lama otomatis tidak terpakai
+        self.result_cache = LRUCache(maxsize=result_cache_size, ttl=result_cache_ttl)
+        self.generation = 0  # naik setiap korpus berubah (add())
+        self._cv_ids: dict[int, int] = {}
+        # add() dari thread loader tidak boleh mengubah index di tengah search()
+        self._lock = threading.RLock()
+        for data in corpus:
+            self._index_document(data)
+
+    def __len__(self) -> int:
+        return len(self.corpus)
+
+    def _index_document(self, data):
+        self._cv_ids[id(data)] = len(self.lower_texts)
+        # Record store: slice lowercase dari blob, teks asli tidak di-decode
+        lower_view = getattr(data, "lower_view", None)
+        self.lower_texts.append(lower_view() if lower_view is not None else data['text'].lower())
+        self.index.add(data)
+
+    def _lower_text(self, cv_id: int) -> str:
+        text = self.lower_texts[cv_id]
+        return text if isinstance(text, str) else str(text, "utf-8", ENCODING_ERRORS)
+
+    def add(self, data: dict) -> int:
+        """
+        Tambahkan satu CV ke korpus (mis. saat korpus dimuat di background), kembalikan cv_id-nya.
+        Hasil fuzzy di cache tetap valid: kata di CV lama sudah ada di kosakata;
+        result cache tidak, karena generation berubah.
+        """
+        with self._lock:
+            self.corpus.append(data)
+            self._index_document(data)
+            self.generation += 1
+            return len(self.corpus) - 1
+
+    def close(self):
+        """
+        Hentikan proses worker scan (jika ada).
+        """
+        with self._lock:
+            pool, self._scan_pool = self._scan_pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _process_pool(self, limit: int):
+        if self.scan_workers <= 1 or limit < PROCESS_SCAN_MIN_CVS:
+            return None
+        with self._lock:
+            if self._scan_pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # Korpus dari CorpusStore: worker membuka mmap yang sama sekali saja,
+                # batch cukup dikirim sebagai rentang cv_id
+                self._scan_store = getattr(self.corpus[0], "store", None) if self.corpus else None
+                store = self._scan_store
+                initargs = (store.directory, len(store), store.nbytes) if store is not None else (None,)
+                # spawn: fork dari proses yang punya thread UI/loader rawan deadlock
+                self._scan_pool = ProcessPoolExecutor(max_workers=self.scan_workers,
+                                                      mp_context=multiprocessing.get_context("spawn"),
+                                                      initializer=_init_scan_worker, initargs=initargs)
+            return self._scan_pool
+
+    def _store_range(self, start: int, end: int) -> tuple[int, int] | None:
+        """
+        (awal, akhir) cv_id di store worker jika CV start..end-1 adalah record berurutan dari store itu.
+        """
+        store = self._scan_store
+        if store is None:
+            return None
+        offset = getattr(self.corpus[start], "cv_id", 0) - start
+        for cv_id in range(start, end):
+            data = self.corpus[cv_id]
+            if getattr(data, "store", None) is not store or data.cv_id != cv_id + offset:
+                return None
+        return start + offset, end + offset
+
+    def cv_id_of(self, data: dict) -> int:
+        return self._cv_ids[id(data)]
+
+    def fuzzy_result(self, cv_id: int, keyword: str) -> tuple[int, list[str]]:
+        """
+        (count, matched_words) fuzzy untuk satu CV, lewat fuzzy_cache.
+        """
+        with self._lock:
+            return self.fuzzy_cache.get_or_compute(
+                (cv_id, keyword, self.fuzzy_threshold),
+                lambda: self.index.matched_words(keyword, cv_id, self.fuzzy_threshold)
+            )
+
+    # ---------- PHASE 1: EXACT ----------
+
+    def _exact_batches(self, keywords: list[str], algorithm: str, limit: int, batch_size: int | None):
+        """
+        Yield (jumlah CV yang sudah di-scan, [(cv_id, details)]) per batch CV dengan cv_id < limit.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+        if algorithm == "Inverted Index":
+            # Hanya CV yang muncul di posting list yang disentuh
+            with self._lock:
+                keyword_hits = {kw: self.index.count(kw) for kw in keywords}
+            hits = [(cv_id, [(kw, keyword_hits[kw][cv_id]) for kw in keywords if cv_id in keyword_hits[kw]])
+                    for cv_id in sorted(set().union(*keyword_hits.values())) if cv_id < limit]
+            yield limit, hits
+            return
+
+        pool = self._process_pool(limit)
+        if pool is not None and not batch_size:
+            # Tanpa snapshot: beberapa chunk per worker agar beban seimbang
+            batch_size = -(-limit // (self.scan_workers * 4))
+        step = max(1, batch_size or limit)
+        batches = [(start, min(start + step, limit)) for start in range(0, limit, step)]
+        if pool is None:
+            for start, end in batches:
+                yield end, scan_texts(self.lower_texts[start:end], keywords, algorithm, start)
+            return
+
+        # Scan KMP/BM/AC terikat GIL: jalankan per batch di proses worker, hasil tetap urut cv_id.
+        # Jumlah batch yang dikirim dibatasi agar pencarian yang dibatalkan tidak menyisakan antrean panjang.
+        pending = deque(batches)
+        in_flight = deque()
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < self.scan_workers * 2:
+                    start, end = pending.popleft()
+                    store_range = self._store_range(start, end)
+                    if store_range is not None:
+                        future = pool.submit(scan_store_range, *store_range, keywords, algorithm, start)
+                    else:
+                        # Bukan dari store worker (mis. korpus dict saat store ditulis ulang): kirim teks batch ini
+                        texts = [text if isinstance(text, str) else bytes(text) for text in self.lower_texts[start:end]]
+                        future = pool.submit(scan_texts, texts, keywords, algorithm, start)
+                    in_flight.append((end, future))
+                end, future = in_flight.popleft()
+                yield end, future.result()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+
+    def exact_counts(self, keywords: list[str], algorithm: str):
+        """
+        Yield (cv_id, details) untuk setiap CV yang memuat minimal satu keyword,
+        urut berdasarkan cv_id. details = [(keyword, jumlah)] sesuai urutan keyword.
+        """
+        for _, hits in self._exact_batches(keywords, algorithm, len(self.corpus), None):
+            yield from hits
+
+    # ---------- SEARCH ----------
+
+    def search(self, keywords: list[str], algorithm: str = "KMP", top_n: int = 3, fuzzy: bool = True) -> SearchResult:
+        """
+        Cari Top-N CV untuk 'keywords'. Fuzzy search hanya dijalankan jika
+        exact match kurang dari top_n (dan fuzzy=True).
+        Selama korpus masih dimuat, hanya CV yang sudah di-add() yang dicari.
+        """
+        for result in self.iter_search(keywords, algorithm, top_n, fuzzy, batch_size=None):
+            pass
+        return result
+
+    def iter_search(self, keywords: list[str], algorithm: str = "KMP", top_n: int = 3, fuzzy: bool = True,
+                    batch_size: int | None = SNAPSHOT_BATCH_SIZE, cancel: threading.Event | None = None):
+        """
+        Seperti search(), tetapi yield snapshot Top-N sementara (done=False) setiap
+        'batch_size' CV selesai di-scan, lalu hasil akhir (done=True).
+        Jika 'cancel' di-set, generator berhenti tanpa hasil akhir.
+        Query yang sama pada korpus yang belum berubah langsung dijawab dari result_cache.
+        """
+        start = time.perf_counter()
+        keywords = list(normalize_keywords(keywords))
+        # CV yang di-add() setelah pencarian dimulai tidak ikut dicari
+        with self._lock:
+            limit = len(self.corpus)
+            cache_key = (tuple(keywords), algorithm, top_n, fuzzy, self.fuzzy_threshold, self.generation)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            yield _copy_result(cached, cached=True, total_ms=_elapsed_ms(start))
+            return
+        result = SearchResult(keywords=keywords, algorithm=algorithm, top_n=top_n, corpus_size=limit)
+
+        # Top-K exact match; CV yang memuat semua keyword diprioritaskan
+        exact_ranking = TopK(top_n)
+        for scanned, hits in self._exact_batches(keywords, algorithm, limit, batch_size):
+            for cv_id, details in hits:
+                total_matches = sum(count for _, count in details)
+                is_all_matched = len(details) == len(keywords)
+                result.exact_total += 1
+                exact_ranking.push(1000*is_all_matched + total_matches, (cv_id, total_matches, details), cv_id)
+            result.scanned = scanned
+            result.exact_ms = _elapsed_ms(start)
+            if cancel is not None and cancel.is_set():
+                return
+            if batch_size and scanned < limit:
+                yield replace(result, matches=self._exact_search_matches(exact_ranking.items()))
+        result.scanned = limit
+        exact_matches = exact_ranking.items()
+        result.exact_ms = _elapsed_ms(start)
+
+        # DECISION POINT: Do we need fuzzy search?
+        if result.exact_total >= top_n or not fuzzy:
+            result.matches = self._exact_search_matches(exact_matches)
+        else:
+            fuzzy_start = time.perf_counter()
+            result.fuzzy_used = True
+            for matches, final in self._iter_fuzzy_ranking(keywords, top_n, exact_matches, result.fuzzy_words,
+                                                           limit, batch_size, cancel):
+                result.matches = matches
+                result.fuzzy_ms = _elapsed_ms(fuzzy_start)
+                if not final:
+                    yield replace(result, matches=list(matches), fuzzy_words={})
+            if cancel is not None and cancel.is_set():
+                return
+
+        result.total_ms = _elapsed_ms(start)
+        result.done = True
+        self.result_cache.put(cache_key, _copy_result(result))
+        yield result
+
+    def _exact_search_matches(self, exact_matches) -> list[SearchMatch]:
+        return [SearchMatch(cv_id, self.corpus[cv_id], score, details, "exact")
+                for cv_id, score, details in exact_matches]
+
+    def _iter_fuzzy_ranking(self, keywords, top_n, exact_matches, fuzzy_words, limit, batch_size, cancel):
+        """
+        Yield (matches, final): Top-N gabungan exact + fuzzy, sementara setiap 'batch_size'
+        kandidat lalu hasil akhir. Berhenti lebih awal jika 'cancel' di-set.
+        """
+        # Semua exact match pasti ada di exact_matches (jumlahnya < top_n)
+        exact_matches_lookup = {cv_id: (score, details) for cv_id, score, details in exact_matches}
+
+        # Jumlah fuzzy per CV dari index (murah); daftar kata hanya dibuat untuk CV yang masuk Top-K
+        fuzzy_counts = {}
+        for kw in keywords:
+            if cancel is not None and cancel.is_set():
+                return
+            with self._lock:
+                fuzzy_counts[kw] = self.index.search_counts(kw, self.fuzzy_threshold)
+        candidate_ids = [cv_id for cv_id in sorted(set(exact_matches_lookup).union(*fuzzy_counts.values()))
+                         if cv_id < limit]
+        combined_ranking = TopK(top_n)
+
+        for position, cv_id in enumerate(candidate_ids, 1):
+            exact_score, exact_details = exact_matches_lookup.get(cv_id, (0, []))
+            exact_keywords_in_cv = {exact_kw for exact_kw, _ in exact_details}
+
+            # Fuzzy hanya untuk keyword yang tidak punya exact match
+            fuzzy_details = [(kw, fuzzy_counts[kw][cv_id]) for kw in keywords
+                             if kw not in exact_keywords_in_cv and cv_id in fuzzy_counts[kw]]
+            fuzzy_score = sum(count for _, count in fuzzy_details)
+            if exact_score == 0 and fuzzy_score == 0:
+                continue
+
+            # Priority: exact match dulu, lalu jumlah fuzzy, lalu banyaknya keyword yang cocok
+            all_details = list(exact_details) + fuzzy_details
+            priority_score = exact_score * 10e6 + fuzzy_score + 1000 * len(all_details)
+            if exact_score > 0 and fuzzy_score == 0:
+                match_type = "exact"
+            elif exact_score == 0 and fuzzy_score > 0:
+                match_type = "fuzzy"
+            else:
+                match_type = "mixed"
+            combined_ranking.push(priority_score, SearchMatch(cv_id, self.corpus[cv_id], exact_score + fuzzy_score,
+                                                              all_details, match_type), cv_id)
+            if batch_size and position % batch_size == 0:
+                if cancel is not None and cancel.is_set():
+                    return
+                yield combined_ranking.items(), False
+        matches = combined_ranking.items()
+
+        with self._lock:
+            # Kata mirip untuk popup global (semua CV yang keyword-nya tidak exact)
+            for kw in dict.fromkeys(keywords):
+                if cancel is not None and cancel.is_set():
+                    return
+                exact_cv_ids = [cv_id for cv_id, (_, details) in exact_matches_lookup.items()
+                                if any(exact_kw == kw for exact_kw, _ in details)]
+                forms = self.index.matched_forms(kw, exact_cv_ids, self.fuzzy_threshold)
+                if forms:
+                    fuzzy_words[kw] = list(forms)
+
+            # Isi cache agar popup kartu yang tampil tidak perlu menghitung ulang
+            for match in matches:
+                for kw in fuzzy_words:
+                    key = (match.cv_id, kw, self.fuzzy_threshold)
+                    if key not in self.fuzzy_cache:
+                        self.fuzzy_cache.put(key, self.index.matched_words(kw, match.cv_id, self.fuzzy_threshold))
+        yield matches, True
@@ -0,0 +1,70 @@
+# file: utils/search_runner.py
+# Menjalankan pencarian di thread worker dengan token: query baru menggantikan query lama
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from utils.search_engine import SNAPSHOT_BATCH_SIZE, SearchEngine
+
+class SearchRunner:
+    """
+    Antrean pencarian satu worker untuk UI. Setiap submit() mendapat token baru dan
+    membatalkan pencarian sebelumnya; snapshot dari token yang sudah basi dibuang,
+    sehingga klik ganda tidak menjalankan dua full scan berurutan.
+    """
+    def __init__(self, engine: SearchEngine, executor=None):
+        self.engine = engine
+        self._executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+        self._lock = threading.Lock()
+        self._token = 0
+        self._cancel: threading.Event | None = None
+        self.completed = 0
+        self.superseded = 0  # pencarian yang dibatalkan query baru atau cancel()
+
+    def submit(self, keywords: list[str], algorithm: str, top_n: int, on_result,
+               batch_size: int | None = SNAPSHOT_BATCH_SIZE) -> tuple[int, Future]:
+        """
+        Jadwalkan pencarian; on_result(token, result) dipanggil dari thread worker untuk
+        setiap snapshot selama token masih yang terbaru. Kembalikan (token, future).
+        """
+        with self._lock:
+            self._token += 1
+            token = self._token
+            if self._cancel is not None:
+                self._cancel.set()
+            cancel = self._cancel = threading.Event()
+        future = self._executor.submit(self._run, token, cancel, keywords, algorithm, top_n, on_result, batch_size)
+        return token, future
+
+    def cancel(self):
+        """
+        Batalkan pencarian yang sedang berjalan (mis. keyword diubah).
+        """
+        with self._lock:
+            self._token += 1
+            if self._cancel is not None:
+                self._cancel.set()
+                self._cancel = None
+
+    def is_current(self, token: int) -> bool:
+        return token == self._token
+
+    def _run(self, token, cancel, keywords, algorithm, top_n, on_result, batch_size):
+        result = None
+        if not cancel.is_set():
+            try:
+                for result in self.engine.iter_search(keywords, algorithm, top_n, batch_size=batch_size, cancel=cancel):
+                    if not self.is_current(token):
+                        break
+                    on_result(token, result)
+            except Exception as error:
+                print(f"❌ Search failed: {type(error).__name__}: {error}")
+                raise
+        if result is not None and result.done and self.is_current(token):
+            self.completed += 1
+            return result
+        self.superseded += 1
+        return None
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,136 @@
+# file: utils/section_cache.py
+# Cache hasil parsing section CV (experience/education/skills) per isi teks
+import hashlib
+import os
+import threading
+
+from regex.extract_exp import extract_experience_section
+from regex.extract_edu import extract_education_section
+from regex.extract_skill import extract_skills_from_resume
+from regex.sections import scan_sections
+from utils.corpus_store import ENCODING_ERRORS
+from utils.text_cache import CACHE_DIRECTORY, atomic_write_json, read_json
+
+# Naikkan jika extractor di regex/ berubah, agar hasil lama tidak dipakai
+SECTION_CACHE_VERSION = 2
+DEFAULT_SECTION_CACHE_PATH = os.path.join(CACHE_DIRECTORY, "cv_sections.json")
+SAVE_EVERY = 50  # precompute menyimpan ke disk setiap N CV baru
+
+def text_digest(text: str) -> str:
+    # Teks PDF bisa memuat surrogate tunggal; encode seperti CorpusStore agar tidak UnicodeEncodeError
+    return hashlib.sha1(text.encode("utf-8", ENCODING_ERRORS)).hexdigest()
+
+def extract_sections(text: str) -> dict:
+    """
+    Jalankan ketiga extractor regex pada teks CV.
+    """
+    scan = scan_sections(text)  # education dan skills berbagi satu scan baris
+    return {
+        "experience": extract_experience_section(text),
+        "education": extract_education_section(text, scan),
+        "skills": extract_skills_from_resume(text, scan),
+    }
+
+class SectionCache:
+    """
+    Section CV yang sudah di-parse, disimpan di disk (di samping TextCache)
+    dengan key SHA-1 teks CV. Diisi lazy lewat get() atau di background lewat precompute().
+    """
+    def __init__(self, cache_path: str = DEFAULT_SECTION_CACHE_PATH, extractor=extract_sections):
+        self.cache_path = cache_path
+        self.extractor = extractor
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._precompute_thread: threading.Thread | None = None
+        self.load()
+
+    def load(self):
+        try:
+            payload = read_json(self.cache_path)
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == SECTION_CACHE_VERSION:
+            self.entries = payload.get("entries", {})
+
+    def save(self):
+        """
+        Simpan cache ke disk jika ada perubahan.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            atomic_write_json(self.cache_path, {"version": SECTION_CACHE_VERSION, "entries": dict(self.entries)})
+            self._dirty = False
+
+    def lookup(self, text: str) -> dict | None:
+        with self._lock:
+            sections = self.entries.get(text_digest(text))
+            if sections is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return sections
+
+    def get(self, text: str) -> dict:
+        """
+        Section untuk teks CV; extractor hanya dijalankan jika belum ada di cache.
+        """
+        digest = text_digest(text)
+        with self._lock:
+            sections = self.entries.get(digest)
+            if sections is not None:
+                self.hits += 1
+                return sections
+            self.misses += 1
+        sections = self.extractor(text)
+        with self._lock:
+            self.entries[digest] = sections
+            self._dirty = True
+        return sections
+
+    def precompute(self, texts, stop_event: threading.Event | None = None) -> int:
+        """
+        Parse semua teks yang belum ada di cache; kembalikan jumlah CV yang di-parse.
+        """
+        computed = 0
+        for text in texts:
+            if stop_event is not None and stop_event.is_set():
+                break
+            digest = text_digest(text)
+            with self._lock:
+                if digest in self.entries:
+                    continue
+            sections = self.extractor(text)
+            with self._lock:
+                self.entries.setdefault(digest, sections)
+                self._dirty = True
+            computed += 1
+            if computed % SAVE_EVERY == 0:
+                self.save()
+        self.save()
+        return computed
+
+    def start_precompute(self, texts) -> threading.Thread:
+        """
+        Jalankan precompute() di thread background (daemon).
+        'texts' boleh generator: dibaca satu per satu di thread itu.
+        """
+        self._precompute_thread = threading.Thread(target=self.precompute, args=(texts,), daemon=True)
+        self._precompute_thread.start()
+        return self._precompute_thread
+
+    def prune(self, keep_texts):
+        """
+        Hapus entri untuk teks yang sudah tidak ada di korpus.
+        """
+        keep = {text_digest(text) for text in keep_texts}
+        with self._lock:
+            for key in [key for key in self.entries if key not in keep]:
+                del self.entries[key]
+                self._dirty = True
+
+    def stats(self) -> dict:
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
@@ -1,27 +1,31 @@
-import mysql.connector
 from faker import Faker
+import argparse
 import random
 import os
+import sys
+import time
+# Agar tetap bisa dijalankan langsung (python utils/seeding.py), selain python -m utils.seeding
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Koneksi dipakai bersama lewat pool di utils.db (establish_connection tetap diekspor untuk script lama)
+from utils.db import establish_connection, has_cv_filename_column, pooled_connection  # noqa: F401
 
 # ---------- CONFIGURATION ----------
 
 RESUME_DIRECTORY = "../data/data"  # Root folder where roles and CVs are stored
 TOTAL_CANDIDATES = 200
-
-DB_CONFIG = {
-    'host': "localhost",
-    'user': "root",
-    'password': "12345",
-    'database': "tubes3_seeding"
-}
+MIGRATION_BATCH_SIZE = 10000  # baris per UPDATE saat backfill cv_filename
+SEED_BATCH_SIZE = 5000        # pelamar per transaksi/executemany
+FAKE_POOL_SIZE = 5000         # nilai Faker unik per kolom pada mode bulk
 
 # ---------- DATABASE SETUP ----------
 
-def establish_connection():
-    return mysql.connector.connect(**DB_CONFIG)
-
 def setup_database_tables():
-    database = establish_connection()
+    with pooled_connection() as database:
+        _create_tables(database)
+        migrate_cv_filename_column(database)
+    print("Tables created successfully.")
+
+def _create_tables(database):
     cursor = database.cursor()
 
     cursor.execute("""
@@ -41,6 +45,8 @@ def setup_database_tables():
         applicant_id INT NOT NULL,
         application_role VARCHAR(100) DEFAULT NULL,
         cv_path TEXT,
+        cv_filename VARCHAR(255) DEFAULT NULL,
+        INDEX idx_cv_filename (cv_filename),
         FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
             ON DELETE CASCADE
     );
@@ -48,8 +54,41 @@ def setup_database_tables():
 
     database.commit()
     cursor.close()
-    database.close()
-    print("Tables created successfully.")
+
+def migrate_cv_filename_column(database):
+    """
+    Migrasi untuk database lama: tambah kolom cv_filename (nama file dari cv_path)
+    beserta index-nya, lalu backfill bertahap per MIGRATION_BATCH_SIZE baris.
+    Aman dijalankan berulang kali.
+    """
+    cursor = database.cursor()
+
+    if not has_cv_filename_column(database):
+        cursor.execute("ALTER TABLE ApplicationDetail ADD COLUMN cv_filename VARCHAR(255) DEFAULT NULL")
+
+    cursor.execute("""
+    SELECT COUNT(*) FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ApplicationDetail' AND INDEX_NAME = 'idx_cv_filename'
+    """)
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("CREATE INDEX idx_cv_filename ON ApplicationDetail (cv_filename)")
+
+    # cv_path bisa berupa nama file saja atau path lengkap "data/ROLE/123.pdf"
+    backfilled = 0
+    while True:
+        cursor.execute("""
+        UPDATE ApplicationDetail
+        SET cv_filename = SUBSTRING_INDEX(cv_path, '/', -1)
+        WHERE cv_filename IS NULL AND cv_path IS NOT NULL
+        LIMIT %s
+        """, (MIGRATION_BATCH_SIZE,))
+        database.commit()
+        backfilled += cursor.rowcount
+        if cursor.rowcount < MIGRATION_BATCH_SIZE:
+            break
+
+    cursor.close()
+    print(f"cv_filename migration done ({backfilled} rows backfilled).")
 
 # ---------- LOAD CVS STRUCTURE ----------
 
@@ -69,78 +108,181 @@ def fetch_resume_files():
 
 # ---------- FAKE DATA INSERTION ----------
 
-def populate_sample_data(candidate_count=TOTAL_CANDIDATES):
-    data_generator = Faker()
-    database = establish_connection()
-    cursor = database.cursor()
+class FakeValuePool:
+    """
+    Nilai Faker yang dibuat sekali lalu diambil acak (interface sama dengan Faker).
+    Membuat jutaan pelamar jauh lebih cepat daripada memanggil Faker per baris.
+    """
+    def __init__(self, data_generator: Faker, size: int = FAKE_POOL_SIZE):
+        self.first_names = [data_generator.first_name() for _ in range(size)]
+        self.last_names = [data_generator.last_name() for _ in range(size)]
+        self.birth_dates = [data_generator.date_of_birth(minimum_age=18, maximum_age=60) for _ in range(size)]
+        self.addresses = [data_generator.address().replace("\n", ", ") for _ in range(size)]
+        self.phone_numbers = [data_generator.phone_number() for _ in range(size)]
 
-    # Load real CV paths from directory
-    position_to_resumes = fetch_resume_files()
+    def first_name(self):
+        return random.choice(self.first_names)
 
-    if not position_to_resumes:
-        print("No valid CVs found in data/ directory.")
-        return
+    def last_name(self):
+        return random.choice(self.last_names)
+
+    def date_of_birth(self, minimum_age=18, maximum_age=60):
+        return random.choice(self.birth_dates)
+
+    def address(self):
+        return random.choice(self.addresses)
+
+    def phone_number(self):
+        return random.choice(self.phone_numbers)
+
+class ResumePicker:
+    """
+    Ambil CV yang belum dipakai untuk suatu role dalam O(1):
+    daftar CV per role diacak sekali, lalu diambil dari belakang.
+    """
+    def __init__(self, position_to_resumes: dict[str, list[str]]):
+        self.unused = {}
+        for job_position, file_paths in position_to_resumes.items():
+            # Only include .pdf files (case-insensitive)
+            pdf_file_paths = [file_path for file_path in file_paths if file_path.lower().endswith('.pdf')]
+            random.shuffle(pdf_file_paths)
+            self.unused[job_position] = pdf_file_paths
+        self.positions = [position for position in self.unused if self.unused[position]]
 
-    complete_resume_list = []
-    for job_position, file_paths in position_to_resumes.items():
-        # Only include .pdf files (case-insensitive)
-        pdf_file_paths = [file_path for file_path in file_paths if file_path.lower().endswith('.pdf')]
-        if pdf_file_paths:
-            position_to_resumes[job_position] = pdf_file_paths
-            for file_path in pdf_file_paths:
-                complete_resume_list.append((job_position, file_path))
-        else:
-            position_to_resumes[job_position] = []
+    def pick(self, job_position: str) -> str | None:
+        remaining = self.unused[job_position]
+        return remaining.pop() if remaining else None
 
-    utilized_resume_paths = set()
+def generate_applicant_batches(candidate_count: int, position_to_resumes: dict[str, list[str]], values,
+                               batch_size: int = SEED_BATCH_SIZE, synthetic_cvs: bool = False):
+    """
+    Yield (applicant_rows, detail_rows) per batch_size pelamar, siap untuk executemany.
+    applicant_id diisi AUTO_INCREMENT saat insert, jadi detail_rows memakai posisi
+    pelamar di dalam batch (0-based); lihat assign_applicant_ids(). Jika synthetic_cvs=True,
+    role yang CV aslinya habis tetap mendapat nama file CV sintetis yang unik.
+    """
+    picker = ResumePicker(position_to_resumes)
+    applicant_rows, detail_rows = [], []
+    synthetic_count = 0
 
     for _ in range(candidate_count):
-        # Insert applicant
-        candidate_first_name = data_generator.first_name()
-        candidate_last_name = data_generator.last_name()
-        birth_date = data_generator.date_of_birth(minimum_age=18, maximum_age=60)
-        home_address = data_generator.address().replace("\n", ", ")
+        applicant_offset = len(applicant_rows)
         while True:
-            contact_number = data_generator.phone_number()
+            contact_number = values.phone_number()
             if len(contact_number) < 20:
                 break
-
-        cursor.execute("""
-        INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number)
-        VALUES (%s, %s, %s, %s, %s)
-        """, (candidate_first_name, candidate_last_name, birth_date, home_address, contact_number))
-
-        current_applicant_id = cursor.lastrowid
+        applicant_rows.append((values.first_name(), values.last_name(),
+                               values.date_of_birth(minimum_age=18, maximum_age=60),
+                               values.address().replace("\n", ", "), contact_number))
 
         # Assign 1–3 different roles with unique CVs
-        available_positions = [position for position in position_to_resumes if position_to_resumes[position]]
-        random.shuffle(available_positions)
-        selected_role_count = min(random.randint(1, 3), len(available_positions))
-
-        for job_position in available_positions[:selected_role_count]:
-            # Filter unused CVs for this role
-            unused_resume_files = [resume_file for resume_file in position_to_resumes[job_position] if resume_file not in utilized_resume_paths]
-            if not unused_resume_files:
+        selected_role_count = min(random.randint(1, 3), len(picker.positions))
+        for job_position in random.sample(picker.positions, selected_role_count):
+            selected_resume_path = picker.pick(job_position)
+            if selected_resume_path is not None:
+                # Extract only the filename
+                resume_filename = os.path.basename(selected_resume_path)
+            elif synthetic_cvs:
+                synthetic_count += 1
+                resume_filename = f"synthetic-{synthetic_count}.pdf"
+            else:
                 continue
+            detail_rows.append((applicant_offset, job_position.capitalize().replace("-", " "),
+                                resume_filename, resume_filename))
 
-            selected_resume_path = random.choice(unused_resume_files)
-            utilized_resume_paths.add(selected_resume_path)
+        if len(applicant_rows) >= batch_size:
+            yield applicant_rows, detail_rows
+            applicant_rows, detail_rows = [], []
 
-            # Extract only the filename
-            resume_filename = os.path.basename(selected_resume_path)
+    if applicant_rows:
+        yield applicant_rows, detail_rows
 
-            cursor.execute("""
-            INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path)
-            VALUES (%s, %s, %s)
-            """, (current_applicant_id, job_position.capitalize().replace("-", " "), resume_filename))
+def assign_applicant_ids(detail_rows, first_applicant_id: int) -> list[tuple]:
+    """
+    Ganti posisi pelamar di batch dengan applicant_id hasil AUTO_INCREMENT
+    (id pelamar dalam satu INSERT multi-row berurutan mulai first_applicant_id).
+    """
+    return [(first_applicant_id + applicant_offset, *rest) for applicant_offset, *rest in detail_rows]
 
-    database.commit()
+def _insert_batches(database, batches) -> tuple[int, int]:
+    """
+    Satu transaksi per batch; executemany dijadikan satu INSERT multi-row oleh mysql-connector.
+    InnoDB memberi id berurutan untuk INSERT multi-row ("simple insert") dan LAST_INSERT_ID()
+    berlaku per koneksi, sehingga aman walau ada penulis lain yang insert bersamaan.
+    """
+    cursor = database.cursor()
+    applicant_total = detail_total = 0
+    for applicant_rows, detail_rows in batches:
+        cursor.executemany("""
+        INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number)
+        VALUES (%s, %s, %s, %s, %s)
+        """, applicant_rows)
+        # LAST_INSERT_ID() = id baris pertama dari INSERT multi-row terakhir di koneksi ini
+        cursor.execute("SELECT LAST_INSERT_ID()")
+        first_applicant_id = cursor.fetchone()[0]
+        if detail_rows:
+            cursor.executemany("""
+            INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path, cv_filename)
+            VALUES (%s, %s, %s, %s)
+            """, assign_applicant_ids(detail_rows, first_applicant_id))
+        database.commit()
+        applicant_total += len(applicant_rows)
+        detail_total += len(detail_rows)
     cursor.close()
-    database.close()
+    return applicant_total, detail_total
+
+def populate_sample_data(candidate_count=TOTAL_CANDIDATES):
+    with pooled_connection() as database:
+        _insert_sample_data(database, candidate_count)
+
+def _insert_sample_data(database, candidate_count):
+    # Load real CV paths from directory
+    position_to_resumes = fetch_resume_files()
+
+    if not position_to_resumes:
+        print("No valid CVs found in data/ directory.")
+        return
+
+    batches = generate_applicant_batches(candidate_count, position_to_resumes, Faker())
+    _insert_batches(database, batches)
     print(f"{candidate_count} applicants inserted with valid PDF CVs and roles.")
 
+def populate_bulk_data(candidate_count: int, batch_size: int = SEED_BATCH_SIZE):
+    """
+    Mode volume besar untuk load test (mis. 1 juta pelamar): nilai Faker dari pool,
+    CV sintetis setelah CV asli habis, INSERT multi-row per batch.
+    """
+    position_to_resumes = fetch_resume_files()
+    if not position_to_resumes:
+        print("No valid CVs found in data/ directory.")
+        return
+
+    start = time.perf_counter()
+    values = FakeValuePool(Faker())
+    with pooled_connection() as database:
+        batches = generate_applicant_batches(candidate_count, position_to_resumes, values, batch_size,
+                                             synthetic_cvs=True)
+        applicant_total, detail_total = _insert_batches(database, batches)
+    elapsed = time.perf_counter() - start
+    print(f"{applicant_total} applicants and {detail_total} applications inserted in {elapsed:.1f}s "
+          f"({applicant_total / elapsed:.0f} applicants/s).")
+
 # ---------- MAIN EXECUTION ----------
 
 if __name__ == "__main__":
-    setup_database_tables()
-    populate_sample_data()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Setup dan seeding database CV")
+    parser.add_argument("--migrate", action="store_true", help="hanya migrasi database yang sudah ada")
+    parser.add_argument("--bulk", type=int, metavar="N", help="seed N pelamar dengan mode batch (load test)")
+    parser.add_argument("--batch-size", type=int, default=SEED_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if args.migrate:
+        # Hanya migrasi database yang sudah ada, tanpa data baru
+        with pooled_connection() as database:
+            migrate_cv_filename_column(database)
+    elif args.bulk:
+        setup_database_tables()
+        populate_bulk_data(args.bulk, args.batch_size)
+    else:
+        setup_database_tables()
+        populate_sample_data()
@@ -0,0 +1,427 @@
+# file: utils/store_index.py
+# Index exact (posting token) dan fuzzy (kosakata + BK-tree) CorpusStore: array int64 di index.bin yang di-mmap
+import os
+from array import array
+from bisect import bisect_left
+
+from algo.fuzzy_index import BKTree, FuzzyIndex, _in_text_order
+from algo.inverted_index import GRAM_SIZE, TOKEN_PATTERN, InvertedIndex
+from algo.levenshtein import build_peq, myers_distance
+from utils.lru_cache import LRUCache
+
+ENCODING_ERRORS = "surrogatepass"  # teks PDF yang rusak tetap bisa disimpan tanpa kehilangan karakter
+INDEX_FILENAME = "index.bin"
+LOOKUP_CACHE_SIZE = 1024  # hasil lookup kosakata / kata mirip per index
+SECTION_ALIGNMENT = 8
+
+def _pack_strings(strings) -> tuple[bytes, array]:
+    """
+    String -> (blob UTF-8, offset); string ke-i = blob[offsets[i]:offsets[i + 1]].
+    """
+    offsets = array("q", [0])
+    parts = []
+    for string in strings:
+        encoded = string.encode("utf-8", ENCODING_ERRORS)
+        parts.append(encoded)
+        offsets.append(offsets[-1] + len(encoded))
+    return b"".join(parts), offsets
+
+def _pack_lists(lists) -> tuple[array, array]:
+    """
+    List int -> (offset, isi berurutan); list ke-i = flat[offsets[i]:offsets[i + 1]].
+    """
+    offsets, flat = array("q", [0]), array("q")
+    for items in lists:
+        flat.extend(items)
+        offsets.append(len(flat))
+    return offsets, flat
+
+def write_sections(path: str, sections: dict) -> dict:
+    """
+    Tulis semua section (bytes atau array int64) ke satu file, kembalikan layout {nama: [offset, nbytes, typecode]}.
+    """
+    layout = {}
+    with open(path, "wb") as f:
+        for name, data in sections.items():
+            f.write(b"\0" * (-f.tell() % SECTION_ALIGNMENT))
+            typecode = data.typecode if isinstance(data, array) else "B"
+            nbytes = len(data) * data.itemsize if isinstance(data, array) else len(data)
+            layout[name] = [f.tell(), nbytes, typecode]
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return layout
+
+def map_sections(blob, layout: dict) -> dict[str, memoryview]:
+    """
+    View tanpa salinan untuk setiap section di blob (mmap); ValueError jika layout tidak cocok dengan blob.
+    """
+    view = memoryview(blob)
+    sections = {}
+    for name, (offset, nbytes, typecode) in layout.items():
+        if offset < 0 or offset + nbytes > len(view):
+            raise ValueError(f"Section {name} di luar {INDEX_FILENAME}")
+        section = view[offset:offset + nbytes]
+        sections[name] = section if typecode == "B" else section.cast(typecode)
+    return sections
+
+class StoreIndexBuilder:
+    """
+    Mengumpulkan posting exact dan fuzzy saat CorpusStoreWriter.append(); sections() menyusunnya
+    menjadi array int siap tulis. Posisi exact dalam byte di teks lowercase UTF-8 (lower.bin).
+    """
+    def __init__(self):
+        self.size = 0
+        self.postings: dict[str, array] = {}  # token -> [cv_id, posisi byte, ...]
+        self.words: dict[str, array] = {}     # kata lowercase -> [cv_id, id bentuk asli, posisi kata, ...]
+        self.forms: dict[str, int] = {}       # bentuk kata asli -> id
+
+    def add(self, text: str, lower: str):
+        cv_id = self.size
+        self.size += 1
+        ascii_only = lower.isascii()
+        byte_position = previous = 0
+        for match in TOKEN_PATTERN.finditer(lower):
+            if ascii_only:
+                byte_position = match.start()
+            else:
+                byte_position += len(lower[previous:match.start()].encode("utf-8", ENCODING_ERRORS))
+                previous = match.start()
+            postings = self.postings.get(match.group())
+            if postings is None:
+                postings = self.postings[match.group()] = array("q")
+            postings.extend((cv_id, byte_position))
+        # Sama seperti FuzzyIndex.add: kata = hasil split() teks asli
+        for position, word in enumerate(text.split()):
+            form_id = self.forms.setdefault(word, len(self.forms))
+            entries = self.words.get(word.lower())
+            if entries is None:
+                entries = self.words[word.lower()] = array("q")
+            entries.extend((cv_id, form_id, position))
+
+    def sections(self) -> dict:
+        sections = {}
+        # Exact: token terurut -> dokumen (cv_id) -> posisi byte
+        tokens = sorted(self.postings)
+        sections["tokens"], sections["token_offsets"] = _pack_strings(tokens)
+        token_docs, doc_ids, doc_positions, positions = array("q", [0]), array("q"), array("q", [0]), array("q")
+        for token in tokens:
+            pairs = self.postings[token]
+            first_doc = len(doc_ids)
+            for cv_id, position in zip(pairs[::2], pairs[1::2]):
+                if len(doc_ids) == first_doc or doc_ids[-1] != cv_id:
+                    doc_ids.append(cv_id)
+                    doc_positions.append(doc_positions[-1])
+                positions.append(position)
+                doc_positions[-1] += 1
+            token_docs.append(len(doc_ids))
+        sections.update(token_docs=token_docs, doc_ids=doc_ids, doc_positions=doc_positions, positions=positions)
+
+        # Lookup kosakata (lihat TokenIndex): urutan token terbalik untuk suffix, trigram -> token untuk substring
+        sections["reversed_order"] = array("q", sorted(range(len(tokens)), key=lambda i: tokens[i][::-1]))
+        grams: dict[str, list[int]] = {}
+        for token_id, token in enumerate(tokens):
+            for gram in dict.fromkeys(token[i:i + GRAM_SIZE] for i in range(len(token) - GRAM_SIZE + 1)):
+                grams.setdefault(gram, []).append(token_id)
+        gram_list = sorted(grams)
+        sections["grams"], sections["gram_offsets"] = _pack_strings(gram_list)
+        sections["gram_tokens"], sections["gram_token_ids"] = _pack_lists(grams[gram] for gram in gram_list)
+        sections["short_tokens"] = array("q", (i for i, token in enumerate(tokens) if len(token) < GRAM_SIZE))
+
+        # Fuzzy: kata terurut -> entri (cv_id, bentuk, posisi) urut cv_id, plus BK-tree yang diratakan
+        words = sorted(self.words)
+        word_ids = {word: word_id for word_id, word in enumerate(words)}
+        sections["words"], sections["word_offsets"] = _pack_strings(words)
+        sections["forms"], sections["form_offsets"] = _pack_strings(self.forms)
+        word_entries, entry_cvs, entry_forms, entry_positions = array("q", [0]), array("q"), array("q"), array("q")
+        for word in words:
+            entries = self.words[word]
+            entry_cvs.extend(entries[0::3])
+            entry_forms.extend(entries[1::3])
+            entry_positions.extend(entries[2::3])
+            word_entries.append(len(entry_cvs))
+        sections.update(word_entries=word_entries, entry_cvs=entry_cvs, entry_forms=entry_forms,
+                        entry_positions=entry_positions)
+        tree = BKTree()
+        for word in self.words:  # urutan kemunculan pertama, sama seperti FuzzyIndex
+            tree.add(word)
+        node_words, children, edges, child_nodes = array("q"), array("q", [0]), array("q"), array("q")
+        nodes = [tree.root] if tree.root is not None else []
+        for word, node_children in nodes:  # BFS; anak diberi id saat ditemukan
+            node_words.append(word_ids[word])
+            for edge, child in node_children.items():
+                edges.append(edge)
+                child_nodes.append(len(nodes))
+                nodes.append(child)
+            children.append(len(edges))
+        sections.update(tree_words=node_words, tree_children=children, tree_edges=edges, tree_nodes=child_nodes)
+        return sections
+
+class _StringTable:
+    """
+    String terurut di section blob + offset; string di-decode saat dibaca, lookup dengan bisect.
+    """
+    def __init__(self, blob: memoryview, offsets: memoryview):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i: int) -> str:
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], "utf-8", ENCODING_ERRORS)
+
+    def raw(self, i: int) -> bytes:
+        return bytes(self.blob[self.offsets[i]:self.offsets[i + 1]])
+
+    def find(self, string: str) -> int | None:
+        i = bisect_left(self, string)
+        return i if i < len(self) and self[i] == string else None
+
+class StoreTokenIndex:
+    """
+    TokenIndex read-only di atas section store: token terurut, urutan token terbalik dan tabel trigram.
+    Lookup mengembalikan id token.
+    """
+    def __init__(self, sections: dict[str, memoryview]):
+        self.tokens = _StringTable(sections["tokens"], sections["token_offsets"])
+        self._reversed_order = sections["reversed_order"]
+        self._grams = _StringTable(sections["grams"], sections["gram_offsets"])
+        self._gram_tokens = sections["gram_tokens"]
+        self._gram_token_ids = sections["gram_token_ids"]
+        self._short_tokens = sections["short_tokens"]
+        self._gram_list: list[str] | None = None
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def _gram_ids(self, gram_id: int) -> memoryview:
+        return self._gram_token_ids[self._gram_tokens[gram_id]:self._gram_tokens[gram_id + 1]]
+
+    def exact(self, run: str) -> list[int]:
+        token_id = self.tokens.find(run)
+        return [] if token_id is None else [token_id]
+
+    def containing(self, run: str) -> list[int]:
+        if len(run) < GRAM_SIZE:
+            # Jumlah trigram dibatasi alfabet, tidak tumbuh dengan kosakata
+            if self._gram_list is None:
+                self._gram_list = [self._grams[i] for i in range(len(self._grams))]
+            token_ids = {i for i in self._short_tokens if run in self.tokens[i]}
+            for gram_id, gram in enumerate(self._gram_list):
+                if run in gram:
+                    token_ids.update(self._gram_ids(gram_id))
+            return list(token_ids)
+        candidates = None
+        for i in range(len(run) - GRAM_SIZE + 1):
+            gram_id = self._grams.find(run[i:i + GRAM_SIZE])
+            if gram_id is None:
+                return []
+            token_ids = self._gram_ids(gram_id)
+            if candidates is None or len(token_ids) < len(candidates):
+                candidates = token_ids
+        return [token_id for token_id in candidates if run in self.tokens[token_id]]
+
+    def starting_with(self, run: str) -> list[int]:
+        token_ids = []
+        for token_id in range(bisect_left(self.tokens, run), len(self.tokens)):
+            if not self.tokens[token_id].startswith(run):
+                break
+            token_ids.append(token_id)
+        return token_ids
+
+    def ending_with(self, run: str) -> list[int]:
+        order = self._reversed_order
+        first = bisect_left(range(len(order)), run[::-1], key=lambda i: self.tokens[order[i]][::-1])
+        token_ids = []
+        for i in range(first, len(order)):
+            if not self.tokens[order[i]].endswith(run):
+                break
+            token_ids.append(order[i])
+        return token_ids
+
+class StoreInvertedIndex(InvertedIndex):
+    """
+    InvertedIndex read-only dari section store: posting dibaca langsung dari array di-mmap dan
+    kandidat diverifikasi pada slice byte lower.bin (tanpa decode teks). Hanya CV 0..size-1 yang dicari;
+    posisi hasil search() dalam byte di teks lowercase UTF-8, jumlahnya sama dengan InvertedIndex.
+    """
+    def __init__(self, sections: dict[str, memoryview], lower_blob, lower_offsets, size: int):
+        self.size = size
+        self.tokens = StoreTokenIndex(sections)
+        self._token_cache = LRUCache(maxsize=LOOKUP_CACHE_SIZE)
+        self._token_docs = sections["token_docs"]
+        self._doc_ids = sections["doc_ids"]
+        self._doc_positions = sections["doc_positions"]
+        self._positions = sections["positions"]
+        self._blob = lower_blob
+        self._lower_offsets = lower_offsets
+
+    def add(self, text: str) -> int:
+        raise TypeError("Index store read-only; tulis ulang store untuk menambah CV")
+
+    def _docs(self, token_id: int) -> range:
+        # Dokumen per token urut cv_id: CV yang belum dimuat engine (>= size) dipotong dengan bisect
+        first, last = self._token_docs[token_id], self._token_docs[token_id + 1]
+        return range(first, bisect_left(self._doc_ids, self.size, first, last))
+
+    def _cv_ids(self, token_id: int):
+        docs = self._docs(token_id)
+        return self._doc_ids[docs.start:docs.stop]
+
+    def _scan(self, keyword: str) -> dict[int, list[int]]:
+        pattern = keyword.encode("utf-8", ENCODING_ERRORS)
+        results = {}
+        for cv_id in range(self.size):
+            base, end = self._lower_offsets[cv_id], self._lower_offsets[cv_id + 1]
+            positions = []
+            start = self._blob.find(pattern, base, end)
+            while start != -1:
+                positions.append(start - base)
+                start = self._blob.find(pattern, start + 1, end)
+            if positions:
+                results[cv_id] = positions
+        return results
+
+    def _verify(self, keyword: str, anchor_run: tuple, tokens: list[int], candidates: set[int]) -> dict[int, list[int]]:
+        anchor_offset, anchor, at_token_start, at_token_end = anchor_run
+        # Semua panjang dan geseran dalam byte UTF-8: kecocokan byte = kecocokan karakter
+        pattern = keyword.encode("utf-8", ENCODING_ERRORS)
+        anchor_offset = len(keyword[:anchor_offset].encode("utf-8", ENCODING_ERRORS))
+        anchor = anchor.encode("utf-8", ENCODING_ERRORS)
+        results: dict[int, list[int]] = {}
+        for token_id in tokens:
+            token = self.tokens.tokens.raw(token_id)
+            if at_token_start:
+                shifts = [0]
+            elif at_token_end:
+                shifts = [len(token) - len(anchor)]
+            else:
+                shifts = [i for i in range(len(token) - len(anchor) + 1) if token.startswith(anchor, i)]
+            for doc in self._docs(token_id):
+                cv_id = self._doc_ids[doc]
+                if cv_id not in candidates:
+                    continue
+                base, end = self._lower_offsets[cv_id], self._lower_offsets[cv_id + 1]
+                for position in self._positions[self._doc_positions[doc]:self._doc_positions[doc + 1]]:
+                    for shift in shifts:
+                        start = base + position + shift - anchor_offset
+                        if base <= start and start + len(pattern) <= end and self._blob[start:start + len(pattern)] == pattern:
+                            results.setdefault(cv_id, []).append(start - base)
+        return results
+
+class StoreBKTree:
+    """
+    BK-tree yang diratakan ke array: node i = kata tree_words[i], anak-anaknya
+    tree_edges/tree_nodes[tree_children[i]:tree_children[i + 1]]. Root = node 0.
+    """
+    def __init__(self, words: _StringTable, sections: dict[str, memoryview]):
+        self.words = words
+        self._node_words = sections["tree_words"]
+        self._children = sections["tree_children"]
+        self._edges = sections["tree_edges"]
+        self._nodes = sections["tree_nodes"]
+        self.size = len(self._node_words)
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, int]]:
+        """
+        (id kata, jarak) untuk semua kata dengan jarak <= max_distance dari 'word'.
+        """
+        if not self.size:
+            return []
+        peq = build_peq(word)
+        results = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            word_id = self._node_words[node]
+            distance = myers_distance(word, self.words[word_id], peq=peq)
+            if distance <= max_distance:
+                results.append((word_id, distance))
+            for child in range(self._children[node], self._children[node + 1]):
+                if distance - max_distance <= self._edges[child] <= distance + max_distance:
+                    stack.append(self._nodes[child])
+        return results
+
+class StoreFuzzyIndex(FuzzyIndex):
+    """
+    FuzzyIndex read-only dari section store: BK-tree dan posting kata dibaca dari array di-mmap.
+    Hanya CV 0..size-1 yang dicari; hasilnya sama dengan FuzzyIndex atas teks yang sama.
+    """
+    def __init__(self, sections: dict[str, memoryview], size: int):
+        self.size = size
+        self.words = _StringTable(sections["words"], sections["word_offsets"])
+        self.forms = _StringTable(sections["forms"], sections["form_offsets"])
+        self.tree = StoreBKTree(self.words, sections)
+        self._word_entries = sections["word_entries"]
+        self._entry_cvs = sections["entry_cvs"]
+        self._entry_forms = sections["entry_forms"]
+        self._entry_positions = sections["entry_positions"]
+        self._similar_cache = LRUCache(maxsize=LOOKUP_CACHE_SIZE)
+
+    def add(self, text: str) -> int:
+        raise TypeError("Index store read-only; tulis ulang store untuk menambah CV")
+
+    def similar_words(self, target: str, max_distance: int) -> list[int]:
+        """
+        Id kata di kosakata dengan jarak <= max_distance.
+        """
+        key = (target.lower(), max_distance)
+        return self._similar_cache.get_or_compute(key, lambda: [word_id for word_id, _ in self.tree.search(key[0], max_distance)])
+
+    def _entries(self, word_id: int, cv_id: int | None = None) -> range:
+        # Entri per kata urut cv_id: batasi ke CV yang sudah dimuat engine, atau ke satu CV
+        first, last = self._word_entries[word_id], self._word_entries[word_id + 1]
+        if cv_id is None:
+            return range(first, bisect_left(self._entry_cvs, self.size, first, last))
+        if cv_id >= self.size:
+            return range(0)
+        return range(bisect_left(self._entry_cvs, cv_id, first, last), bisect_left(self._entry_cvs, cv_id + 1, first, last))
+
+    def _form(self, forms: dict[int, str], form_id: int) -> str:
+        form = forms.get(form_id)
+        if form is None:
+            form = forms[form_id] = self.forms[form_id]
+        return form
+
+    def search(self, target: str, similarity_threshold: float = 0.125, max_distance: int = 4) -> dict[int, tuple[int, list[str]]]:
+        if not target:
+            return {}
+        occurrences: dict[int, list[tuple[int, str]]] = {}
+        forms: dict[int, str] = {}
+        for word_id in self._similar_for(target, similarity_threshold, max_distance):
+            for entry in self._entries(word_id):
+                occurrences.setdefault(self._entry_cvs[entry], []).append(
+                    (self._entry_positions[entry], self._form(forms, self._entry_forms[entry])))
+        return {cv_id: _in_text_order(found) for cv_id, found in occurrences.items()}
+
+    def search_counts(self, target: str, similarity_threshold: float = 0.125, max_distance: int = 4) -> dict[int, int]:
+        if not target:
+            return {}
+        counts: dict[int, int] = {}
+        for word_id in self._similar_for(target, similarity_threshold, max_distance):
+            entries = self._entries(word_id)
+            for cv_id in self._entry_cvs[entries.start:entries.stop]:
+                counts[cv_id] = counts.get(cv_id, 0) + 1
+        return counts
+
+    def matched_words(self, target: str, cv_id: int, similarity_threshold: float = 0.125, max_distance: int = 4) -> tuple[int, list[str]]:
+        if not target:
+            return 0, []
+        found = []
+        forms: dict[int, str] = {}
+        for word_id in self._similar_for(target, similarity_threshold, max_distance):
+            for entry in self._entries(word_id, cv_id):
+                found.append((self._entry_positions[entry], self._form(forms, self._entry_forms[entry])))
+        return _in_text_order(found)
+
+    def matched_forms(self, target: str, exclude_cv_ids=(), similarity_threshold: float = 0.125, max_distance: int = 4) -> set[str]:
+        if not target:
+            return set()
+        exclude_cv_ids = set(exclude_cv_ids)
+        form_ids = set()
+        for word_id in self._similar_for(target, similarity_threshold, max_distance):
+            for entry in self._entries(word_id):
+                if self._entry_cvs[entry] not in exclude_cv_ids:
+                    form_ids.add(self._entry_forms[entry])
+        return {self.forms[form_id] for form_id in form_ids}
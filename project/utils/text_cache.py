@@ -0,0 +1,162 @@
+# file: utils/text_cache.py
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+CACHE_VERSION = 1
+CACHE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+DEFAULT_CACHE_PATH = os.path.join(CACHE_DIRECTORY, "cv_texts.json")
+# String dengan surrogate tunggal (teks PDF rusak) disimpan sebagai {SURROGATE_KEY: hex UTF-8 surrogatepass}:
+# escape "\\ud800\\udc00" di JSON selalu dibaca sebagai satu karakter astral, bukan dua surrogate
+SURROGATE_KEY = "__utf8_surrogatepass__"
+_SURROGATE = re.compile("[\ud800-\udfff]")
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Hitung SHA-1 dari isi file secara bertahap (per chunk).
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _escape_surrogates(value):
+    if isinstance(value, str):
+        if _SURROGATE.search(value):
+            return {SURROGATE_KEY: value.encode("utf-8", "surrogatepass").hex()}
+        return value
+    if isinstance(value, dict):
+        return {key: _escape_surrogates(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_escape_surrogates(item) for item in value]
+    return value
+
+def _restore_surrogates(obj: dict):
+    if len(obj) == 1 and SURROGATE_KEY in obj:
+        return bytes.fromhex(obj[SURROGATE_KEY]).decode("utf-8", "surrogatepass")
+    return obj
+
+def read_json(path: str):
+    """
+    Baca JSON yang ditulis atomic_write_json, termasuk string dengan surrogate tunggal.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f, object_hook=_restore_surrogates)
+
+def atomic_write_json(path: str, payload) -> None:
+    """
+    Tulis JSON ke file sementara lalu os.replace ke 'path',
+    sehingga crash di tengah penulisan tidak merusak file lama.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        # ensure_ascii: key (mis. path dengan surrogateescape) tetap di-escape dengan aman
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(_escape_surrogates(payload), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class TextCache:
+    """
+    Cache teks hasil ekstraksi PDF di disk.
+    Tiap entri disimpan per path dan divalidasi dengan mtime, size, dan SHA-1 isi file.
+    File cache baru dibaca saat entri pertama kali dibutuhkan.
+    """
+    def __init__(self, cache_path: str = DEFAULT_CACHE_PATH):
+        self.cache_path = cache_path
+        self._entries: dict[str, dict] | None = None
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, dict]:
+        if self._entries is None:
+            self.load()
+        return self._entries
+
+    def load(self):
+        self._entries = {}
+        try:
+            payload = read_json(self.cache_path)
+        except (OSError, ValueError):
+            return
+        if isinstance(payload, dict) and payload.get("version") == CACHE_VERSION:
+            self._entries = payload.get("entries", {})
+
+    def save(self):
+        """
+        Simpan cache ke disk jika ada perubahan.
+        """
+        if not self._dirty:
+            return
+        atomic_write_json(self.cache_path, {"version": CACHE_VERSION, "entries": self.entries})
+        self._dirty = False
+
+    def lookup(self, pdf_path: str) -> str | None:
+        """
+        Kembalikan teks yang tersimpan untuk 'pdf_path', atau None jika
+        file belum pernah diekstrak atau sudah berubah.
+        """
+        key = os.path.abspath(pdf_path)
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        stat = os.stat(pdf_path)
+        if entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            self.hits += 1
+            return entry["text"]
+
+        # mtime/size berubah (mis. file di-copy ulang), cek isi file sebenarnya
+        if entry["size"] == stat.st_size and entry["sha1"] == file_digest(pdf_path):
+            entry["mtime"] = stat.st_mtime_ns
+            self._dirty = True
+            self.hits += 1
+            return entry["text"]
+
+        self.misses += 1
+        return None
+
+    def store(self, pdf_path: str, text: str):
+        stat = os.stat(pdf_path)
+        self.entries[os.path.abspath(pdf_path)] = {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha1": file_digest(pdf_path),
+            "text": text,
+        }
+        self._dirty = True
+
+    def get_text(self, pdf_path: str, extractor) -> str:
+        """
+        Ambil teks dari cache, atau ekstrak dengan 'extractor' lalu simpan.
+        """
+        text = self.lookup(pdf_path)
+        if text is None:
+            text = extractor(pdf_path)
+            self.store(pdf_path, text)
+        return text
+
+    def prune(self, keep_paths):
+        """
+        Hapus entri untuk file yang sudah tidak ada di korpus.
+        """
+        keep = {os.path.abspath(path) for path in keep_paths}
+        for key in [key for key in self.entries if key not in keep]:
+            del self.entries[key]
+            self._dirty = True
+
+    def stats(self) -> dict:
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}